@@ -5,7 +5,9 @@ from dateutil.relativedelta import relativedelta
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from bisect import bisect_left, bisect_right
 import json
+import sys
 
 class CashFlowType(Enum):
     OPERATING = "Operating"
@@ -16,7 +18,7 @@ class CashFlowDirection(Enum):
     INFLOW = "Inflow"
     OUTFLOW = "Outflow"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CashFlowItem:
     item_id: str
     date: date
@@ -31,6 +33,15 @@ class CashFlowItem:
     recurring_frequency: Optional[str] = None
     notes: Optional[str] = None
 
+    def __post_init__(self):
+        # Low-cardinality strings are shared across thousands of items;
+        # interning keeps one copy per unique value
+        object.__setattr__(self, 'category', sys.intern(self.category))
+        if self.subcategory is not None:
+            object.__setattr__(self, 'subcategory', sys.intern(self.subcategory))
+        if self.recurring_frequency is not None:
+            object.__setattr__(self, 'recurring_frequency', sys.intern(self.recurring_frequency))
+
 @dataclass
 class CashPosition:
     date: date
@@ -42,100 +53,286 @@ class CashPosition:
     investing_cash_flow: float
     financing_cash_flow: float
 
+# Seasonal adjustment factors indexed by calendar month (index 0 unused).
+# The tuple serves scalar lookups without NumPy boxing; the array view
+# serves the vectorized forecast path. Both share the same table.
+_SEASONAL = (
+    1.0,
+    0.95,  # January - post-holiday slow
+    0.95,  # February - short month
+    1.05,  # March - Q1 close
+    1.0,   # April - normal
+    1.0,   # May - normal
+    1.05,  # June - Q2 close
+    0.9,   # July - summer slow
+    0.9,   # August - summer slow
+    1.05,  # September - Q3 close
+    1.0,   # October - normal
+    1.1,   # November - holiday prep
+    1.15   # December - holiday/year-end
+)
+_SEASONAL_FACTORS = np.array(_SEASONAL)
+
+# Integer codes for the Structure-of-Arrays store (see _sync_arrays)
+_TYPE_CODES = {
+    CashFlowType.OPERATING: 0,
+    CashFlowType.INVESTING: 1,
+    CashFlowType.FINANCING: 2
+}
+_CODE_TYPES = (CashFlowType.OPERATING, CashFlowType.INVESTING, CashFlowType.FINANCING)
+
+_DIRECTION_CODES = {CashFlowDirection.INFLOW: 0, CashFlowDirection.OUTFLOW: 1}
+_CODE_DIRECTIONS = (CashFlowDirection.INFLOW, CashFlowDirection.OUTFLOW)
+
 class CashFlowAnalyzer:
     """Comprehensive cash flow analysis and forecasting"""
-    
+
     def __init__(self):
         self.cash_flows: List[CashFlowItem] = []
         self.opening_balance: float = 0
         self.bank_accounts: Dict[str, float] = {}
         self.credit_lines: Dict[str, Dict] = {}
-    
+        self._arrays_dirty: bool = True
+        self._running_total: float = 0.0
+        self._dates: Optional[np.ndarray] = None
+        self._signed_amount: Optional[np.ndarray] = None
+        self._type_code: Optional[np.ndarray] = None
+        self._cat_code: Optional[np.ndarray] = None
+        self._categories: List[str] = []
+        self._is_revenue_cat: Optional[np.ndarray] = None
+        self._is_payment_cat: Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None
+        self._dates_sorted: Optional[np.ndarray] = None
+        self._signed_sorted: Optional[np.ndarray] = None
+        self._type_sorted: Optional[np.ndarray] = None
+        self._cat_sorted: Optional[np.ndarray] = None
+
     def add_cash_flow_item(self, item: CashFlowItem) -> str:
         """Add a cash flow item"""
         self.cash_flows.append(item)
+        self._running_total += item.amount if item.direction == CashFlowDirection.INFLOW else -item.amount
+        self._arrays_dirty = True
         return item.item_id
-    
+
+    def add_cash_flows(self, items: List[CashFlowItem]) -> List[str]:
+        """Add many cash flow items with a single cache invalidation.
+
+        Bulk loads avoid the per-item bookkeeping of add_cash_flow_item:
+        the list is extended in one call, the running total is updated
+        once, and the SoA arrays are rebuilt lazily on the next read.
+        """
+        items = list(items)
+        self.cash_flows.extend(items)
+        self._running_total += sum(
+            item.amount if item.direction == CashFlowDirection.INFLOW else -item.amount
+            for item in items
+        )
+        self._arrays_dirty = True
+        return [item.item_id for item in items]
+
+    @property
+    def current_cash_balance(self) -> float:
+        """Opening balance plus the incrementally maintained net of all flows"""
+        return self.opening_balance + self._running_total
+
+    def _rebuild_totals(self) -> None:
+        """Recompute the running total after bulk mutation of cash_flows"""
+        self._running_total = sum(
+            cf.amount if cf.direction == CashFlowDirection.INFLOW else -cf.amount
+            for cf in self.cash_flows
+        )
+
+    def _sync_arrays(self) -> None:
+        """Lazily materialize the Structure-of-Arrays view of the cash flows.
+
+        Parallel NumPy arrays (dates, signed amounts, flow-type codes and
+        category codes) let the analysis methods run as vectorized C-level
+        scans instead of Python-level list comprehensions.
+        """
+        if not self._arrays_dirty:
+            return
+
+        n = len(self.cash_flows)
+        self._dates = np.array([cf.date for cf in self.cash_flows], dtype='datetime64[D]')
+        amounts = np.fromiter((cf.amount for cf in self.cash_flows), dtype=np.float64, count=n)
+        signs = np.fromiter(
+            (1.0 if cf.direction == CashFlowDirection.INFLOW else -1.0 for cf in self.cash_flows),
+            dtype=np.float64, count=n
+        )
+        self._signed_amount = amounts * signs
+        self._type_code = np.fromiter(
+            (_TYPE_CODES[cf.flow_type] for cf in self.cash_flows), dtype=np.int8, count=n
+        )
+        categorical = pd.Categorical([cf.category for cf in self.cash_flows])
+        self._cat_code = np.asarray(categorical.codes, dtype=np.int32)
+        self._categories = list(categorical.categories)
+
+        # Per-category predicates, evaluated once per unique category so
+        # row-level checks become a single fancy-index over the codes
+        self._is_revenue_cat = np.array(
+            ['revenue' in c.lower() for c in self._categories], dtype=bool)
+        self._is_payment_cat = np.array(
+            ['payment' in c.lower() for c in self._categories], dtype=bool)
+
+        # Date-sorted views so period queries become O(log N) binary
+        # searches over contiguous slices instead of O(N) full scans
+        self._order = np.argsort(self._dates, kind='stable')
+        self._dates_sorted = self._dates[self._order]
+        self._signed_sorted = self._signed_amount[self._order]
+        self._type_sorted = self._type_code[self._order]
+        self._cat_sorted = self._cat_code[self._order]
+        self._arrays_dirty = False
+
+    def save_store(self, path: str) -> None:
+        """Persist every cash flow column so a later process can reload them
+        without re-parsing source data item by item. Enum columns are
+        one-byte codes; optional string fields use the empty string for
+        None."""
+        # np.savez appends .npz when missing; normalize so load_store can
+        # take the same path the caller passed here
+        if not path.endswith('.npz'):
+            path += '.npz'
+        self._sync_arrays()
+        n = len(self.cash_flows)
+        np.savez(
+            path,
+            item_id=np.array([cf.item_id for cf in self.cash_flows]),
+            date=self._dates,
+            description=np.array([cf.description for cf in self.cash_flows]),
+            amount=np.fromiter((cf.amount for cf in self.cash_flows),
+                               dtype=np.float64, count=n),
+            direction=np.fromiter((_DIRECTION_CODES[cf.direction] for cf in self.cash_flows),
+                                  dtype=np.int8, count=n),
+            type_code=self._type_code,
+            category=np.array([cf.category for cf in self.cash_flows]),
+            subcategory=np.array([cf.subcategory or '' for cf in self.cash_flows]),
+            project_id=np.array([cf.project_id or '' for cf in self.cash_flows]),
+            recurring=np.fromiter((cf.recurring for cf in self.cash_flows),
+                                  dtype=np.bool_, count=n),
+            recurring_frequency=np.array([cf.recurring_frequency or ''
+                                          for cf in self.cash_flows]),
+            notes=np.array([cf.notes or '' for cf in self.cash_flows]),
+            opening_balance=self.opening_balance
+        )
+
+    def load_store(self, path: str) -> int:
+        """Reload a store written by save_store; returns the item count"""
+        if not path.endswith('.npz'):
+            path += '.npz'
+        data = np.load(path, allow_pickle=False)
+        dates = data['date'].astype('datetime64[D]').astype(object)
+
+        def optional(name):
+            return [str(value) if value else None for value in data[name]]
+
+        records = zip(
+            data['item_id'], dates, data['description'], data['amount'],
+            data['type_code'], data['direction'], data['category'],
+            optional('subcategory'), optional('project_id'), data['recurring'],
+            optional('recurring_frequency'), optional('notes'))
+
+        self.cash_flows = [
+            CashFlowItem(
+                item_id=str(item_id), date=item_date, description=str(description),
+                amount=float(amount), flow_type=_CODE_TYPES[type_code],
+                direction=_CODE_DIRECTIONS[direction_code], category=str(category),
+                subcategory=subcategory, project_id=project_id,
+                recurring=bool(recurring), recurring_frequency=recurring_frequency,
+                notes=notes
+            )
+            for (item_id, item_date, description, amount, type_code,
+                 direction_code, category, subcategory, project_id, recurring,
+                 recurring_frequency, notes)
+            in records
+        ]
+        self.opening_balance = float(data['opening_balance'])
+        self._rebuild_totals()
+        self._arrays_dirty = True
+        return len(self.cash_flows)
+
+    def _period_slice(self, start_date: date, end_date: date) -> slice:
+        """Contiguous slice of the date-sorted arrays covering the period"""
+        self._sync_arrays()
+        lo = np.searchsorted(self._dates_sorted, np.datetime64(start_date), side='left')
+        hi = np.searchsorted(self._dates_sorted, np.datetime64(end_date), side='right')
+        return slice(int(lo), int(hi))
+
     def generate_cash_flow_statement(self, start_date: date, end_date: date) -> Dict:
         """Generate formal cash flow statement"""
-        period_flows = [
-            cf for cf in self.cash_flows 
-            if start_date <= cf.date <= end_date
-        ]
-        
-        # Categorize cash flows
-        operating_flows = [cf for cf in period_flows if cf.flow_type == CashFlowType.OPERATING]
-        investing_flows = [cf for cf in period_flows if cf.flow_type == CashFlowType.INVESTING]
-        financing_flows = [cf for cf in period_flows if cf.flow_type == CashFlowType.FINANCING]
-        
-        # Calculate net flows
-        def calculate_net_flow(flows: List[CashFlowItem]) -> float:
-            inflows = sum(cf.amount for cf in flows if cf.direction == CashFlowDirection.INFLOW)
-            outflows = sum(cf.amount for cf in flows if cf.direction == CashFlowDirection.OUTFLOW)
-            return inflows - outflows
-        
-        operating_cash_flow = calculate_net_flow(operating_flows)
-        investing_cash_flow = calculate_net_flow(investing_flows)
-        financing_cash_flow = calculate_net_flow(financing_flows)
-        
-        net_change_in_cash = operating_cash_flow + investing_cash_flow + financing_cash_flow
-        
+        period = self._period_slice(start_date, end_date)
+
+        # Net flows for all three activity types in a single vectorized pass
+        net_by_type = np.bincount(
+            self._type_sorted[period], weights=self._signed_sorted[period], minlength=3
+        )
+        net_change_in_cash = float(net_by_type.sum())
+
         # Detailed breakdown
-        operating_detail = self._categorize_flows(operating_flows)
-        investing_detail = self._categorize_flows(investing_flows)
-        financing_detail = self._categorize_flows(financing_flows)
-        
+        period_indices = self._order[period]
+        period_types = self._type_sorted[period]
+        operating_detail = self._categorize_flows(period_indices[period_types == 0])
+        investing_detail = self._categorize_flows(period_indices[period_types == 1])
+        financing_detail = self._categorize_flows(period_indices[period_types == 2])
+
+        # One vectorized rounding pass over every reported figure
+        rounded = np.round([
+            net_by_type[0], net_by_type[1], net_by_type[2],
+            net_change_in_cash, self.opening_balance + net_change_in_cash
+        ], 2)
+
         return {
             'period': f"{start_date} to {end_date}",
             'operating_activities': {
-                'total': round(operating_cash_flow, 2),
+                'total': float(rounded[0]),
                 'detail': operating_detail
             },
             'investing_activities': {
-                'total': round(investing_cash_flow, 2),
+                'total': float(rounded[1]),
                 'detail': investing_detail
             },
             'financing_activities': {
-                'total': round(financing_cash_flow, 2),
+                'total': float(rounded[2]),
                 'detail': financing_detail
             },
-            'net_change_in_cash': round(net_change_in_cash, 2),
+            'net_change_in_cash': float(rounded[3]),
             'opening_cash_balance': self.opening_balance,
-            'closing_cash_balance': round(self.opening_balance + net_change_in_cash, 2)
+            'closing_cash_balance': float(rounded[4])
         }
     
-    def _categorize_flows(self, flows: List[CashFlowItem]) -> Dict[str, Dict]:
-        """Categorize and aggregate cash flows"""
-        categories = {}
-        
-        for flow in flows:
-            category = flow.category
-            if category not in categories:
-                categories[category] = {
-                    'inflows': 0,
-                    'outflows': 0,
-                    'net': 0,
-                    'items': []
-                }
-            
-            if flow.direction == CashFlowDirection.INFLOW:
-                categories[category]['inflows'] += flow.amount
-            else:
-                categories[category]['outflows'] += flow.amount
-            
-            categories[category]['net'] = categories[category]['inflows'] - categories[category]['outflows']
-            categories[category]['items'].append({
+    def _categorize_flows(self, indices: np.ndarray) -> Dict[str, Dict]:
+        """Categorize and aggregate cash flows selected by SoA indices"""
+        self._sync_arrays()
+        if len(indices) == 0:
+            return {}
+
+        signed = self._signed_amount[indices]
+        df = pd.DataFrame({
+            'cat_code': self._cat_code[indices],
+            'inflows': np.where(signed > 0, signed, 0.0),
+            'outflows': np.where(signed < 0, -signed, 0.0),
+            'net': signed
+        })
+        sums = df.groupby('cat_code', observed=True).agg(
+            {'inflows': 'sum', 'outflows': 'sum', 'net': 'sum'})
+
+        categories = {
+            self._categories[code]: {
+                'inflows': round(row.inflows, 2),
+                'outflows': round(row.outflows, 2),
+                'net': round(row.net, 2),
+                'items': []
+            }
+            for code, row in zip(sums.index, sums.itertuples(index=False))
+        }
+
+        for i in indices:
+            flow = self.cash_flows[i]
+            categories[flow.category]['items'].append({
                 'date': flow.date.isoformat(),
                 'description': flow.description,
-                'amount': flow.amount * (1 if flow.direction == CashFlowDirection.INFLOW else -1)
+                'amount': float(self._signed_amount[i])
             })
-        
-        # Round values
-        for category_data in categories.values():
-            category_data['inflows'] = round(category_data['inflows'], 2)
-            category_data['outflows'] = round(category_data['outflows'], 2)
-            category_data['net'] = round(category_data['net'], 2)
-        
+
         return categories
     
     def forecast_cash_flow(self, months_ahead: int = 12, 
@@ -146,116 +343,83 @@ class CashFlowAnalyzer:
         
         # Analyze historical patterns
         historical_flows = self._get_historical_patterns()
-        
-        forecasts = []
-        current_balance = self.opening_balance + sum(
-            cf.amount * (1 if cf.direction == CashFlowDirection.INFLOW else -1) 
-            for cf in self.cash_flows
-        )
-        
-        for month_offset in range(1, months_ahead + 1):
-            forecast_date = date.today() + relativedelta(months=month_offset)
-            
-            # Base forecast from historical patterns
-            base_operating = historical_flows['monthly_operating_avg']
-            base_investing = historical_flows['monthly_investing_avg']
-            base_financing = historical_flows['monthly_financing_avg']
-            
-            # Apply seasonal adjustments
-            seasonal_factor = self._get_seasonal_factor(forecast_date.month)
-            
-            month_data = {
-                'Month': forecast_date.strftime('%Y-%m'),
-                'Date': forecast_date
-            }
-            
-            for scenario, factor in scenarios.items():
-                operating = base_operating * seasonal_factor * factor
-                investing = base_investing * factor
-                financing = base_financing * factor
-                
-                net_cash_flow = operating + investing + financing
-                current_balance += net_cash_flow
-                
-                month_data[f'{scenario.title()}_Operating'] = round(operating, 2)
-                month_data[f'{scenario.title()}_Investing'] = round(investing, 2)
-                month_data[f'{scenario.title()}_Financing'] = round(financing, 2)
-                month_data[f'{scenario.title()}_Net'] = round(net_cash_flow, 2)
-                month_data[f'{scenario.title()}_Balance'] = round(current_balance, 2)
-            
-            forecasts.append(month_data)
-        
-        return pd.DataFrame(forecasts)
-    
-    def _get_historical_patterns(self) -> Dict[str, float]:
-        """Analyze historical cash flow patterns"""
-        if not self.cash_flows:
-            return {
-                'monthly_operating_avg': 0,
-                'monthly_investing_avg': 0,
-                'monthly_financing_avg': 0
-            }
-        
-        # Group by type and calculate monthly averages
-        operating_flows = [cf for cf in self.cash_flows if cf.flow_type == CashFlowType.OPERATING]
-        investing_flows = [cf for cf in self.cash_flows if cf.flow_type == CashFlowType.INVESTING]
-        financing_flows = [cf for cf in self.cash_flows if cf.flow_type == CashFlowType.FINANCING]
-        
-        def calculate_monthly_avg(flows: List[CashFlowItem]) -> float:
-            if not flows:
-                return 0
-            
-            df = pd.DataFrame([{
-                'date': cf.date,
-                'amount': cf.amount * (1 if cf.direction == CashFlowDirection.INFLOW else -1)
-            } for cf in flows])
-            
-            df['month'] = pd.to_datetime(df['date']).dt.to_period('M')
-            monthly_totals = df.groupby('month')['amount'].sum()
-            
-            return monthly_totals.mean()
-        
-        return {
-            'monthly_operating_avg': calculate_monthly_avg(operating_flows),
-            'monthly_investing_avg': calculate_monthly_avg(investing_flows),
-            'monthly_financing_avg': calculate_monthly_avg(financing_flows)
+
+        # Base forecast from historical patterns
+        base_operating = historical_flows['monthly_operating']
+        base_investing = historical_flows['monthly_investing']
+        base_financing = historical_flows['monthly_financing']
+
+        # Gather all forecast dates and seasonal factors up front
+        forecast_dates = [date.today() + relativedelta(months=offset)
+                          for offset in range(1, months_ahead + 1)]
+        seasonal_factors = _SEASONAL_FACTORS[[d.month for d in forecast_dates]]
+        scenario_factors = np.fromiter(scenarios.values(), dtype=np.float64,
+                                       count=len(scenarios))
+
+        # Broadcast all (month, scenario) flows at once and accumulate each
+        # scenario's running balance with a single cumsum. Each scenario now
+        # tracks its own balance; previously the balance leaked from one
+        # scenario into the next within a month.
+        operating = base_operating * seasonal_factors[:, None] * scenario_factors[None, :]
+        investing = np.broadcast_to(base_investing * scenario_factors, operating.shape)
+        financing = np.broadcast_to(base_financing * scenario_factors, operating.shape)
+        net = operating + investing + financing
+        balances = self.current_cash_balance + np.cumsum(net, axis=0)
+
+        data = {
+            'Month': [d.strftime('%Y-%m') for d in forecast_dates],
+            'Date': forecast_dates
         }
+        for i, scenario in enumerate(scenarios):
+            name = scenario.title()
+            data[f'{name}_Operating'] = np.round(operating[:, i], 2)
+            data[f'{name}_Investing'] = np.round(investing[:, i], 2)
+            data[f'{name}_Financing'] = np.round(financing[:, i], 2)
+            data[f'{name}_Net'] = np.round(net[:, i], 2)
+            data[f'{name}_Balance'] = np.round(balances[:, i], 2)
+
+        return pd.DataFrame(data)
     
+    def _monthly_type_sums(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Bucket signed amounts by (month, flow type) in one vectorized pass.
+
+        Returns an (n_months, 3) matrix of monthly net flows per activity
+        type and a matching boolean matrix marking which (month, type)
+        buckets actually had activity.
+        """
+        self._sync_arrays()
+        months = self._dates.astype('datetime64[M]').astype(np.int64)
+        month_idx = months - months.min()
+        n_months = int(month_idx.max()) + 1
+
+        flat_idx = month_idx * 3 + self._type_code
+        sums = np.zeros(n_months * 3)
+        np.add.at(sums, flat_idx, self._signed_amount)
+        counts = np.zeros(n_months * 3, dtype=np.int64)
+        np.add.at(counts, flat_idx, 1)
+
+        return sums.reshape(n_months, 3), counts.reshape(n_months, 3) > 0
+
     def _get_seasonal_factor(self, month: int) -> float:
         """Get seasonal adjustment factor"""
-        seasonal_factors = {
-            1: 0.95,   # January - post-holiday slow
-            2: 0.95,   # February - short month
-            3: 1.05,   # March - Q1 close
-            4: 1.0,    # April - normal
-            5: 1.0,    # May - normal
-            6: 1.05,   # June - Q2 close
-            7: 0.9,    # July - summer slow
-            8: 0.9,    # August - summer slow
-            9: 1.05,   # September - Q3 close
-            10: 1.0,   # October - normal
-            11: 1.1,   # November - holiday prep
-            12: 1.15   # December - holiday/year-end
-        }
-        return seasonal_factors.get(month, 1.0)
+        return _SEASONAL[month]
     
     def working_capital_analysis(self, start_date: date, end_date: date) -> Dict:
         """Analyze working capital changes"""
         # Simplified analysis - in practice would integrate with balance sheet data
-        operating_flows = [
-            cf for cf in self.cash_flows 
-            if cf.flow_type == CashFlowType.OPERATING and start_date <= cf.date <= end_date
-        ]
-        
-        revenue_flows = [cf for cf in operating_flows if 'revenue' in cf.category.lower()]
-        expense_flows = [cf for cf in operating_flows if cf not in revenue_flows]
-        
-        total_revenue = sum(cf.amount for cf in revenue_flows if cf.direction == CashFlowDirection.INFLOW)
-        total_expenses = sum(cf.amount for cf in expense_flows if cf.direction == CashFlowDirection.OUTFLOW)
-        
+        period = self._period_slice(start_date, end_date)
+        operating_mask = self._type_sorted[period] == 0
+        signed = self._signed_sorted[period]
+        revenue_cat_mask = self._is_revenue_cat[self._cat_sorted[period]]
+
+        revenue_mask = operating_mask & revenue_cat_mask & (signed > 0)
+        expense_mask = operating_mask & ~revenue_cat_mask & (signed < 0)
+        total_revenue = float(signed[revenue_mask].sum())
+        total_expenses = float(-signed[expense_mask].sum())
+
         # Calculate key metrics
         operating_cash_flow = total_revenue - total_expenses
-        cash_conversion_cycle = self._estimate_cash_conversion_cycle(operating_flows)
+        cash_conversion_cycle = self._estimate_cash_conversion_cycle(period, operating_mask)
         
         return {
             'period': f"{start_date} to {end_date}",
@@ -267,129 +431,140 @@ class CashFlowAnalyzer:
             'working_capital_efficiency': 'Good' if cash_conversion_cycle < 30 else 'Needs Improvement'
         }
     
-    def _estimate_cash_conversion_cycle(self, flows: List[CashFlowItem]) -> float:
+    def _estimate_cash_conversion_cycle(self, period: slice, operating_mask: np.ndarray) -> float:
         """Estimate cash conversion cycle from cash flow timing"""
         # Simplified estimation - would need more detailed AR/AP data
-        revenue_dates = [cf.date for cf in flows if 'revenue' in cf.category.lower()]
-        payment_dates = [cf.date for cf in flows if 'payment' in cf.category.lower()]
-        
-        if not revenue_dates or not payment_dates:
+        cat = self._cat_sorted[period]
+        dates = self._dates_sorted[period]
+        revenue_dates = dates[operating_mask & self._is_revenue_cat[cat]]
+        payment_dates = dates[operating_mask & self._is_payment_cat[cat]]
+
+        if revenue_dates.size == 0 or payment_dates.size == 0:
             return 30  # Default assumption
-        
-        avg_collection_period = np.mean([(p - r).days for r, p in zip(revenue_dates, payment_dates) if (p - r).days > 0])
-        return avg_collection_period if not np.isnan(avg_collection_period) else 30
+
+        # Pair revenue and payment dates positionally; like the previous
+        # zip-based estimate, the longer side is truncated to the shorter
+        pairs = min(revenue_dates.size, payment_dates.size)
+        day_diffs = (payment_dates[:pairs] - revenue_dates[:pairs]) / np.timedelta64(1, 'D')
+        positive_diffs = day_diffs[day_diffs > 0]
+
+        return float(positive_diffs.mean()) if positive_diffs.size else 30
     
     def cash_burn_analysis(self, months_back: int = 6) -> Dict:
         """Analyze cash burn rate and runway"""
         end_date = date.today()
         start_date = end_date - timedelta(days=30 * months_back)
         
-        monthly_flows = {}
-        
-        # Group flows by month
-        for cf in self.cash_flows:
-            if start_date <= cf.date <= end_date:
-                month_key = cf.date.strftime('%Y-%m')
-                if month_key not in monthly_flows:
-                    monthly_flows[month_key] = {'inflows': 0, 'outflows': 0}
-                
-                if cf.direction == CashFlowDirection.INFLOW:
-                    monthly_flows[month_key]['inflows'] += cf.amount
-                else:
-                    monthly_flows[month_key]['outflows'] += cf.amount
-        
-        # Calculate burn rates
-        monthly_burns = []
-        for month, flows in monthly_flows.items():
-            net_burn = flows['outflows'] - flows['inflows']
-            monthly_burns.append({
-                'month': month,
-                'inflows': flows['inflows'],
-                'outflows': flows['outflows'],
-                'net_burn': net_burn
-            })
-        
-        if not monthly_burns:
+        period = self._period_slice(start_date, end_date)
+        if period.start == period.stop:
             return {'error': 'No cash flow data found'}
-        
-        df = pd.DataFrame(monthly_burns)
-        average_burn = df['net_burn'].mean()
-        current_cash = self.opening_balance + sum(
-            cf.amount * (1 if cf.direction == CashFlowDirection.INFLOW else -1) 
-            for cf in self.cash_flows
-        )
-        
+
+        # Bucket inflows/outflows per month with vectorized scatter-adds
+        months = self._dates_sorted[period].astype('datetime64[M]')
+        signed = self._signed_sorted[period]
+        base_month = months.min()
+        month_idx = (months - base_month).astype(np.int64)
+        n_buckets = int(month_idx.max()) + 1
+
+        inflows = np.zeros(n_buckets)
+        outflows = np.zeros(n_buckets)
+        is_inflow = signed > 0
+        np.add.at(inflows, month_idx[is_inflow], signed[is_inflow])
+        np.add.at(outflows, month_idx[~is_inflow], -signed[~is_inflow])
+
+        # Only months with activity participate in the burn statistics
+        active = np.unique(month_idx)
+        inflows = inflows[active]
+        outflows = outflows[active]
+        net_burns = outflows - inflows
+        month_labels = np.datetime_as_string(
+            base_month + active.astype('timedelta64[M]'), unit='M')
+
+        monthly_burns = [
+            {'month': month, 'inflows': inflow, 'outflows': outflow, 'net_burn': burn}
+            for month, inflow, outflow, burn
+            in zip(month_labels, inflows, outflows, net_burns)
+        ]
+
+        average_burn = net_burns.mean()
+        current_cash = self.current_cash_balance
+
         # Calculate runway
         runway_months = current_cash / average_burn if average_burn > 0 else float('inf')
-        
+
         # Trend analysis
-        if len(monthly_burns) >= 3:
-            recent_3_months = df.tail(3)['net_burn'].mean()
+        if len(net_burns) >= 3:
+            recent_3_months = net_burns[-3:].mean()
             trend = 'Improving' if recent_3_months < average_burn else 'Worsening'
         else:
             trend = 'Insufficient Data'
-        
+
         return {
             'current_cash_balance': round(current_cash, 2),
             'average_monthly_burn': round(average_burn, 2),
             'runway_months': round(runway_months, 1) if runway_months != float('inf') else 'Infinite',
             'trend': trend,
             'monthly_detail': monthly_burns,
-            'burn_rate_volatility': round(df['net_burn'].std(), 2),
+            'burn_rate_volatility': round(net_burns.std(ddof=1), 2) if len(net_burns) > 1 else None,
             'recommendation': self._get_burn_recommendation(runway_months, trend)
         }
     
+    _BURN_THRESHOLDS = (6, 12, 18)
+    _BURN_RECOMMENDATIONS = (
+        "Critical - immediate action required",
+        "Moderate concern - reduce burn or secure funding",
+        "Adequate runway - consider efficiency improvements",
+        "Healthy cash position - monitor trends"
+    )
+
     def _get_burn_recommendation(self, runway_months: float, trend: str) -> str:
         """Get recommendations based on burn analysis"""
         if runway_months == float('inf'):
             return "Cash positive - focus on growth investments"
-        elif runway_months > 18:
-            return "Healthy cash position - monitor trends"
-        elif runway_months > 12:
-            return "Adequate runway - consider efficiency improvements"
-        elif runway_months > 6:
-            return "Moderate concern - reduce burn or secure funding"
-        else:
-            return "Critical - immediate action required"
+        return self._BURN_RECOMMENDATIONS[bisect_left(self._BURN_THRESHOLDS, runway_months)]
     
     def scenario_analysis(self, scenarios: Dict[str, Dict[str, float]], 
                          months_ahead: int = 12) -> pd.DataFrame:
         """Run scenario analysis on cash flow projections"""
         base_flows = self._get_historical_patterns()
-        results = []
-        
-        for scenario_name, adjustments in scenarios.items():
-            current_balance = self.opening_balance
-            scenario_results = []
-            
-            for month_offset in range(1, months_ahead + 1):
-                forecast_date = date.today() + relativedelta(months=month_offset)
-                
-                # Apply scenario adjustments
-                operating_flow = base_flows['monthly_operating'] * adjustments.get('operating_multiplier', 1.0)
-                investing_flow = base_flows['monthly_investing'] * adjustments.get('investing_multiplier', 1.0)
-                financing_flow = base_flows['monthly_financing'] * adjustments.get('financing_multiplier', 1.0)
-                
-                # Add one-time adjustments
-                one_time_adjustment = adjustments.get('one_time_cash_injection', 0) if month_offset == 1 else 0
-                
-                net_flow = operating_flow + investing_flow + financing_flow + one_time_adjustment
-                current_balance += net_flow
-                
-                scenario_results.append({
-                    'Scenario': scenario_name,
-                    'Month': forecast_date.strftime('%Y-%m'),
-                    'Operating_Flow': round(operating_flow, 2),
-                    'Investing_Flow': round(investing_flow, 2),
-                    'Financing_Flow': round(financing_flow, 2),
-                    'Net_Flow': round(net_flow, 2),
-                    'Cash_Balance': round(current_balance, 2),
-                    'Months_Runway': round(current_balance / abs(operating_flow), 1) if operating_flow < 0 else float('inf')
-                })
-            
-            results.extend(scenario_results)
-        
-        return pd.DataFrame(results)
+
+        names = list(scenarios.keys())
+        n_scenarios = len(names)
+        adjustments = np.array([
+            [adj.get('operating_multiplier', 1.0),
+             adj.get('investing_multiplier', 1.0),
+             adj.get('financing_multiplier', 1.0),
+             adj.get('one_time_cash_injection', 0)]
+            for adj in scenarios.values()
+        ])
+
+        # Each scenario's flows are constant per month, so the whole grid
+        # reduces to per-scenario vectors plus one cumsum along months
+        operating = base_flows['monthly_operating'] * adjustments[:, 0]
+        investing = base_flows['monthly_investing'] * adjustments[:, 1]
+        financing = base_flows['monthly_financing'] * adjustments[:, 2]
+
+        net = np.repeat((operating + investing + financing)[:, None], months_ahead, axis=1)
+        net[:, 0] += adjustments[:, 3]
+        balances = self.opening_balance + np.cumsum(net, axis=1)
+
+        with np.errstate(divide='ignore'):
+            runway = np.where(operating[:, None] < 0,
+                              balances / np.abs(operating)[:, None], np.inf)
+
+        month_labels = [(date.today() + relativedelta(months=offset)).strftime('%Y-%m')
+                        for offset in range(1, months_ahead + 1)]
+
+        return pd.DataFrame({
+            'Scenario': np.repeat(names, months_ahead),
+            'Month': np.tile(month_labels, n_scenarios),
+            'Operating_Flow': np.repeat(np.round(operating, 2), months_ahead),
+            'Investing_Flow': np.repeat(np.round(investing, 2), months_ahead),
+            'Financing_Flow': np.repeat(np.round(financing, 2), months_ahead),
+            'Net_Flow': np.round(net, 2).ravel(),
+            'Cash_Balance': np.round(balances, 2).ravel(),
+            'Months_Runway': np.round(runway, 1).ravel()
+        })
     
     def _get_historical_patterns(self) -> Dict[str, float]:
         """Get historical cash flow patterns for forecasting"""
@@ -400,21 +575,15 @@ class CashFlowAnalyzer:
                 'monthly_financing': 0
             }
         
-        # Calculate monthly averages by type
-        df = pd.DataFrame([{
-            'date': cf.date,
-            'flow_type': cf.flow_type.value,
-            'amount': cf.amount * (1 if cf.direction == CashFlowDirection.INFLOW else -1)
-        } for cf in self.cash_flows])
-        
-        df['month'] = pd.to_datetime(df['date']).dt.to_period('M')
-        
-        monthly_by_type = df.groupby(['month', 'flow_type'])['amount'].sum().unstack(fill_value=0)
-        
+        # Average each type over the months where it actually had activity;
+        # dividing by the full calendar span would dilute sparse ledgers
+        sums, active = self._monthly_type_sums()
+        averages = sums.sum(axis=0) / np.maximum(active.sum(axis=0), 1)
+
         return {
-            'monthly_operating': monthly_by_type.get('Operating', pd.Series([0])).mean(),
-            'monthly_investing': monthly_by_type.get('Investing', pd.Series([0])).mean(),
-            'monthly_financing': monthly_by_type.get('Financing', pd.Series([0])).mean()
+            'monthly_operating': float(averages[0]),
+            'monthly_investing': float(averages[1]),
+            'monthly_financing': float(averages[2])
         }
     
     def cash_flow_at_risk(self, confidence_level: float = 0.95) -> Dict:
@@ -422,28 +591,23 @@ class CashFlowAnalyzer:
         if len(self.cash_flows) < 30:  # Need sufficient data
             return {'error': 'Insufficient historical data for CFaR calculation'}
         
-        # Calculate daily cash flows
-        daily_flows = {}
-        for cf in self.cash_flows:
-            date_key = cf.date.isoformat()
-            if date_key not in daily_flows:
-                daily_flows[date_key] = 0
-            
-            flow_amount = cf.amount * (1 if cf.direction == CashFlowDirection.INFLOW else -1)
-            daily_flows[date_key] += flow_amount
-        
-        # Calculate percentiles
-        flow_values = list(daily_flows.values())
-        var_percentile = (1 - confidence_level) * 100
-        
-        cash_flow_at_risk = np.percentile(flow_values, var_percentile)
-        expected_shortfall = np.mean([f for f in flow_values if f <= cash_flow_at_risk])
-        
+        # Daily net cash flows from the date-sorted SoA arrays
+        self._sync_arrays()
+        unique_dates, inverse = np.unique(self._dates_sorted, return_inverse=True)
+        daily_flows = np.zeros(len(unique_dates))
+        np.add.at(daily_flows, inverse, self._signed_sorted)
+
+        # O(N) selection of the tail instead of a full percentile sort
+        k = min(int(np.ceil((1 - confidence_level) * len(daily_flows))), len(daily_flows) - 1)
+        tail = np.partition(daily_flows, k)
+        cash_flow_at_risk = float(tail[k])
+        expected_shortfall = float(tail[:k + 1].mean())
+
         return {
             'confidence_level': f"{confidence_level * 100}%",
             'cash_flow_at_risk': round(cash_flow_at_risk, 2),
             'expected_shortfall': round(expected_shortfall, 2),
-            'volatility': round(np.std(flow_values), 2),
+            'volatility': round(float(daily_flows.std()), 2),
             'interpretation': f"With {confidence_level * 100}% confidence, daily cash flow will not be worse than ${abs(cash_flow_at_risk):,.2f}"
         }
     
@@ -473,20 +637,13 @@ class CashFlowAnalyzer:
             'days_cash_on_hand': round(current_cash / (monthly_outflows / 30), 1) if monthly_outflows > 0 else float('inf')
         }
     
+    _LIQUIDITY_THRESHOLDS = (1.0, 1.5, 2.0, 3.0)
+    _LIQUIDITY_STATUSES = ("Critical", "Tight", "Adequate", "Good", "Excellent")
+
     def _get_liquidity_status(self, total_liquidity: float, minimum_requirement: float) -> str:
         """Determine liquidity status"""
         ratio = total_liquidity / minimum_requirement if minimum_requirement > 0 else float('inf')
-        
-        if ratio >= 3.0:
-            return "Excellent"
-        elif ratio >= 2.0:
-            return "Good"
-        elif ratio >= 1.5:
-            return "Adequate"
-        elif ratio >= 1.0:
-            return "Tight"
-        else:
-            return "Critical"
+        return self._LIQUIDITY_STATUSES[bisect_right(self._LIQUIDITY_THRESHOLDS, ratio)]
 
 if __name__ == "__main__":
     # Test cash flow analysis
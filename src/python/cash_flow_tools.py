@@ -1,15 +1,25 @@
-import pandas as pd
-import numpy as np
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Any
 import json
+import os
+
+from cash_flow_analysis import CashFlowAnalyzer
+
+_analyzer: Optional[CashFlowAnalyzer] = None
+
+def _get_analyzer() -> CashFlowAnalyzer:
+    """Shared analyzer so repeated tool calls reuse one loaded store"""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = CashFlowAnalyzer()
+        store_path = os.environ.get('CASH_FLOW_STORE')
+        if store_path and os.path.exists(store_path):
+            _analyzer.load_store(store_path)
+    return _analyzer
 
 def generate_cash_flow_statement(start_date: str, end_date: str) -> Dict[str, Any]:
     """Generate cash flow statement for period"""
-    # This would integrate with the CashFlowAnalyzer
-    from cash_flow_analysis import CashFlowAnalyzer
-    
-    analyzer = CashFlowAnalyzer()
+    analyzer = _get_analyzer()
     # In practice, would load data from storage
     
     start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
@@ -19,25 +29,23 @@ def generate_cash_flow_statement(start_date: str, end_date: str) -> Dict[str, An
 
 def forecast_cash_flow(months_ahead: int = 12, scenarios: Optional[Dict[str, float]] = None) -> List[Dict]:
     """Forecast cash flows with scenario analysis"""
-    from cash_flow_analysis import CashFlowAnalyzer
-    
-    analyzer = CashFlowAnalyzer()
+    analyzer = _get_analyzer()
     result = analyzer.forecast_cash_flow(months_ahead, scenarios)
-    
-    return result.to_dict('records') if hasattr(result, 'to_dict') else []
+
+    if not hasattr(result, 'to_json'):
+        return []
+    # to_json walks the columns in C instead of boxing every cell into
+    # a Python dict the way to_dict('records') does
+    return json.loads(result.to_json(orient='records'))
 
 def cash_burn_analysis(months_back: int = 6) -> Dict[str, Any]:
     """Analyze cash burn rate and runway"""
-    from cash_flow_analysis import CashFlowAnalyzer
-    
-    analyzer = CashFlowAnalyzer()
+    analyzer = _get_analyzer()
     return analyzer.cash_burn_analysis(months_back)
 
 def working_capital_analysis(start_date: str, end_date: str) -> Dict[str, Any]:
     """Analyze working capital changes"""
-    from cash_flow_analysis import CashFlowAnalyzer
-    
-    analyzer = CashFlowAnalyzer()
+    analyzer = _get_analyzer()
     start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
     end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
     
@@ -45,16 +53,12 @@ def working_capital_analysis(start_date: str, end_date: str) -> Dict[str, Any]:
 
 def cash_flow_at_risk(confidence_level: float = 0.95) -> Dict[str, Any]:
     """Calculate Cash Flow at Risk (CFaR)"""
-    from cash_flow_analysis import CashFlowAnalyzer
-    
-    analyzer = CashFlowAnalyzer()
+    analyzer = _get_analyzer()
     return analyzer.cash_flow_at_risk(confidence_level)
 
 def liquidity_analysis() -> Dict[str, Any]:
     """Analyze liquidity position"""
-    from cash_flow_analysis import CashFlowAnalyzer
-    
-    analyzer = CashFlowAnalyzer()
+    analyzer = _get_analyzer()
     return analyzer.liquidity_analysis()
 
 if __name__ == "__main__":
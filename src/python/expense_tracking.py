@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple, Union
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 import json
@@ -103,31 +104,234 @@ class Budget:
         if self.total_budget == 0:
             self.total_budget = sum(self.categories.values())
 
+
+# Positional codes for the analytics arrays below, plus cached enum
+# labels so hot loops skip the Enum .value descriptor
+_CATEGORY_LIST = tuple(ExpenseCategory)
+_CATEGORY_INDEX = {cat: i for i, cat in enumerate(_CATEGORY_LIST)}
+_CATEGORY_VALUES = {cat: cat.value for cat in _CATEGORY_LIST}
+
+# Categorical dtypes so report columns carry int8 codes instead of
+# repeated Python strings, and groupby skips string hashing
+_CATEGORY_DTYPE = pd.CategoricalDtype([cat.value for cat in _CATEGORY_LIST])
+_STATUS_DTYPE = pd.CategoricalDtype([status.value for status in ApprovalStatus])
+
+_PAYMENT_METHOD_LIST = tuple(PaymentMethod)
+_PAYMENT_METHOD_INDEX = {method: i for i, method in enumerate(_PAYMENT_METHOD_LIST)}
+
+_STATUS_LIST = tuple(ApprovalStatus)
+_STATUS_INDEX = {status: i for i, status in enumerate(_STATUS_LIST)}
+
+# Statuses that still hit cash flow; one shared tuple so the pending
+# filter is two identity compares with no per-row list build
+_UNPAID_STATUSES = (ApprovalStatus.PENDING, ApprovalStatus.APPROVED)
+
+# Payment terms resolved with one dict get instead of a compare chain
+_PAYMENT_TERM_DAYS = {
+    "Net 15": 15,
+    "Net 30": 30,
+    "Net 45": 45,
+    "Due on Receipt": 0,
+}
+
 class ExpenseTracker:
     """Comprehensive expense tracking and management system"""
-    
+
     def __init__(self):
         self.vendors: Dict[str, Vendor] = {}
         self.expenses: List[Expense] = []
         self.budgets: Dict[str, Budget] = {}
         self.approval_rules: Dict[str, Dict] = {}
         self.tax_categories: Dict[ExpenseCategory, float] = {}  # Category to tax rate mapping
-    
+
+        # Materialized per-month (category, vendor) spend totals, kept
+        # current by add_expense so lookback reports merge a handful of
+        # month buckets instead of rescanning every expense
+        self._monthly_vendor_spend: Dict[Tuple[int, int], Dict[Tuple[ExpenseCategory, str], List[float]]] = {}
+
+        # Column (structure-of-arrays) views over self.expenses, rebuilt
+        # lazily so reporting never materializes per-row dicts
+        self._arrays_dirty = True
+        self._frame_cache = None
+        self._order = None
+        self._dates_sorted = None
+        self._amounts_sorted = None
+        self._cat_sorted = None
+        self._deductible_sorted = None
+
+    def _sync_arrays(self) -> None:
+        """Rebuild the date-sorted column arrays from self.expenses"""
+        if not self._arrays_dirty:
+            return
+        n = len(self.expenses)
+        dates = np.fromiter((e.date for e in self.expenses),
+                            dtype='datetime64[D]', count=n)
+        amounts = np.fromiter((e.amount for e in self.expenses),
+                              dtype=np.float64, count=n)
+        cat_idx = np.fromiter((_CATEGORY_INDEX[e.category] for e in self.expenses),
+                              dtype=np.int8, count=n)
+        deductible = np.fromiter((e.tax_deductible for e in self.expenses),
+                                 dtype=np.float64, count=n)
+
+        order = np.argsort(dates, kind='stable')
+        self._order = order
+        self._dates_sorted = dates[order]
+        self._amounts_sorted = amounts[order]
+        self._cat_sorted = cat_idx[order]
+        self._deductible_sorted = deductible[order]
+        self._arrays_dirty = False
+
+    def _period_slice(self, start_date: date, end_date: date) -> slice:
+        """Index range of the sorted arrays covering [start, end]"""
+        lo = np.searchsorted(self._dates_sorted, np.datetime64(start_date, 'D'), side='left')
+        hi = np.searchsorted(self._dates_sorted, np.datetime64(end_date, 'D'), side='right')
+        return slice(int(lo), int(hi))
+
+    def _period_expenses(self, start_date: date, end_date: date) -> List[Expense]:
+        """Expenses in [start, end], located by binary search on the sorted
+        date column instead of comparing every row's date object"""
+        self._sync_arrays()
+        period = self._period_slice(start_date, end_date)
+        expenses = self.expenses
+        return [expenses[i] for i in self._order[period]]
+
+    def to_frame(self) -> pd.DataFrame:
+        """One columnar DataFrame over the whole expense log, cached until
+        the next add. Callers chain their own filter/groupby pipelines on
+        it instead of having each analytics call rebuild columns from the
+        object list."""
+        if self._frame_cache is None:
+            self._sync_arrays()
+            self._frame_cache = pd.DataFrame({
+                'Date': pd.DatetimeIndex(self._dates_sorted),
+                'Vendor ID': [self.expenses[i].vendor_id for i in self._order],
+                'Amount': self._amounts_sorted,
+                'Category': pd.Categorical.from_codes(self._cat_sorted,
+                                                      dtype=_CATEGORY_DTYPE),
+                'Tax Deductible': self._deductible_sorted.astype(bool),
+            })
+        return self._frame_cache
+
     def add_expense(self, expense: Expense) -> str:
         """Add a new expense with validation"""
         # Validate vendor exists
         if expense.vendor_id not in self.vendors:
             raise ValueError(f"Vendor {expense.vendor_id} not found")
-        
+
         # Check approval rules
         if self._requires_approval(expense):
             expense.approval_status = ApprovalStatus.PENDING
         else:
             expense.approval_status = ApprovalStatus.APPROVED
-        
+
         self.expenses.append(expense)
+        self._record_monthly_spend(expense)
+        self._arrays_dirty = True
+        self._frame_cache = None
         return expense.expense_id
-    
+
+    def _record_monthly_spend(self, expense: Expense) -> None:
+        """Fold one expense into the month bucket index"""
+        bucket = self._monthly_vendor_spend.setdefault(
+            (expense.date.year, expense.date.month), {})
+        entry = bucket.setdefault((expense.category, expense.vendor_id), [0.0, 0])
+        entry[0] += expense.amount
+        entry[1] += 1
+
+    def save_store(self, path: str) -> None:
+        """Persist every expense column so a later process can reload them
+        without replaying every add_expense call. The enum columns
+        (category, payment method, approval status) are written as one-byte
+        integer codes; optional string fields use the empty string for
+        None, missing paid dates are stored as NaT, and tags are stored as
+        a JSON string per row."""
+        # np.savez appends .npz when missing; normalize so load_store can
+        # take the same path the caller passed here
+        if not path.endswith('.npz'):
+            path += '.npz'
+        n = len(self.expenses)
+        np.savez(
+            path,
+            expense_id=np.array([e.expense_id for e in self.expenses]),
+            date=np.fromiter((e.date for e in self.expenses),
+                             dtype='datetime64[D]', count=n),
+            vendor_id=np.array([e.vendor_id for e in self.expenses]),
+            amount=np.fromiter((e.amount for e in self.expenses),
+                               dtype=np.float64, count=n),
+            category=np.fromiter((_CATEGORY_INDEX[e.category] for e in self.expenses),
+                                 dtype=np.int8, count=n),
+            subcategory=np.array([e.subcategory or '' for e in self.expenses]),
+            description=np.array([e.description for e in self.expenses]),
+            invoice_number=np.array([e.invoice_number or '' for e in self.expenses]),
+            payment_method=np.fromiter(
+                (_PAYMENT_METHOD_INDEX[e.payment_method] for e in self.expenses),
+                dtype=np.int8, count=n),
+            approval_status=np.fromiter(
+                (_STATUS_INDEX[e.approval_status] for e in self.expenses),
+                dtype=np.int8, count=n),
+            approved_by=np.array([e.approved_by or '' for e in self.expenses]),
+            paid_date=np.array([e.paid_date or 'NaT' for e in self.expenses],
+                               dtype='datetime64[D]'),
+            receipt_url=np.array([e.receipt_url or '' for e in self.expenses]),
+            cost_center=np.array([e.cost_center or '' for e in self.expenses]),
+            project_id=np.array([e.project_id or '' for e in self.expenses]),
+            tags=np.array([json.dumps(e.tags) for e in self.expenses]),
+            tax_deductible=np.fromiter((e.tax_deductible for e in self.expenses),
+                                       dtype=np.bool_, count=n),
+            recurring=np.fromiter((e.recurring for e in self.expenses),
+                                  dtype=np.bool_, count=n),
+            recurring_frequency=np.array([e.recurring_frequency or ''
+                                          for e in self.expenses]),
+        )
+
+    def load_store(self, path: str) -> int:
+        """Reload a store written by save_store; returns the expense count"""
+        if not path.endswith('.npz'):
+            path += '.npz'
+        data = np.load(path, allow_pickle=False)
+        dates = data['date'].astype('datetime64[D]').astype(object)
+        paid_dates = [None if np.isnat(value) else value.astype(object)
+                      for value in data['paid_date'].astype('datetime64[D]')]
+
+        def optional(name):
+            return [str(value) if value else None for value in data[name]]
+
+        records = zip(
+            data['expense_id'], dates, data['vendor_id'], data['amount'],
+            data['category'], optional('subcategory'), data['description'],
+            optional('invoice_number'), data['payment_method'],
+            data['approval_status'], optional('approved_by'), paid_dates,
+            optional('receipt_url'), optional('cost_center'),
+            optional('project_id'), data['tags'], data['tax_deductible'],
+            data['recurring'], optional('recurring_frequency'))
+
+        self.expenses = [
+            Expense(
+                expense_id=str(expense_id), date=expense_date,
+                vendor_id=str(vendor_id), amount=float(amount),
+                category=_CATEGORY_LIST[cat_code], subcategory=subcategory,
+                description=str(description), invoice_number=invoice_number,
+                payment_method=_PAYMENT_METHOD_LIST[method_code],
+                approval_status=_STATUS_LIST[status_code],
+                approved_by=approved_by, paid_date=paid_date,
+                receipt_url=receipt_url, cost_center=cost_center,
+                project_id=project_id, tags=json.loads(str(tags)),
+                tax_deductible=bool(deductible), recurring=bool(recurring),
+                recurring_frequency=recurring_frequency,
+            )
+            for (expense_id, expense_date, vendor_id, amount, cat_code,
+                 subcategory, description, invoice_number, method_code,
+                 status_code, approved_by, paid_date, receipt_url, cost_center,
+                 project_id, tags, deductible, recurring, recurring_frequency)
+            in records
+        ]
+        self._monthly_vendor_spend = {}
+        for expense in self.expenses:
+            self._record_monthly_spend(expense)
+        self._arrays_dirty = True
+        self._frame_cache = None
+        return len(self.expenses)
+
     def _requires_approval(self, expense: Expense) -> bool:
         """Check if expense requires approval based on rules"""
         # Example rules - would be configurable
@@ -137,46 +341,89 @@ class ExpenseTracker:
             return True
         return False
     
-    def get_expense_summary(self, start_date: date, end_date: date, 
+    def get_expense_summary(self, start_date: date, end_date: date,
                            group_by: str = "category") -> pd.DataFrame:
         """Generate expense summary report"""
-        filtered_expenses = [
-            e for e in self.expenses 
-            if start_date <= e.date <= end_date
-        ]
-        
-        if not filtered_expenses:
+        self._sync_arrays()
+        period = self._period_slice(start_date, end_date)
+
+        if period.stop <= period.start:
             return pd.DataFrame()
-        
-        df = pd.DataFrame([{
-            'Date': e.date,
-            'Vendor': self.vendors.get(e.vendor_id, Vendor("", "Unknown", {})).name,
-            'Amount': e.amount,
-            'Category': e.category.value,
-            'Subcategory': e.subcategory or '',
-            'Description': e.description,
-            'Status': e.approval_status.value,
-            'Cost Center': e.cost_center or 'Unassigned',
-            'Project': e.project_id or 'None',
-            'Tax Deductible': e.tax_deductible
-        } for e in filtered_expenses])
-        
+
         if group_by == "category":
-            summary = df.groupby('Category').agg({
-                'Amount': ['sum', 'mean', 'count'],
-                'Tax Deductible': lambda x: (x == True).sum()
-            }).round(2)
-            summary.columns = ['Total', 'Average', 'Count', 'Tax Deductible Count']
-            return summary
-        elif group_by == "vendor":
+            # One bincount per figure over the period's columns; no
+            # per-expense dicts or groupby machinery
+            cats = self._cat_sorted[period]
+            amounts = self._amounts_sorted[period]
+            n_cats = len(_CATEGORY_LIST)
+            totals = np.bincount(cats, weights=amounts, minlength=n_cats)
+            counts = np.bincount(cats, minlength=n_cats)
+            deductible = np.bincount(cats, weights=self._deductible_sorted[period],
+                                     minlength=n_cats)
+
+            active = np.flatnonzero(counts)
+            labels = np.array([_CATEGORY_LIST[i].value for i in active])
+            by_label = np.argsort(labels)
+            active = active[by_label]
+
+            return pd.DataFrame({
+                'Total': np.round(totals[active], 2),
+                'Average': np.round(totals[active] / counts[active], 2),
+                'Count': counts[active],
+                'Tax Deductible Count': deductible[active].astype(np.int64)
+            }, index=pd.Index(labels[by_label], name='Category'))
+
+        filtered_expenses = self._period_expenses(start_date, end_date)
+        vendor_name = self._vendor_name
+
+        # Column-wise construction: pandas gets ready-made columns
+        # instead of inferring dtypes from a list of per-row dicts
+        if group_by == "vendor":
+            df = pd.DataFrame({
+                'Vendor': [vendor_name(e.vendor_id) for e in filtered_expenses],
+                'Amount': [e.amount for e in filtered_expenses],
+            })
             return df.groupby('Vendor')['Amount'].agg(['sum', 'mean', 'count']).round(2)
         elif group_by == "cost_center":
+            df = pd.DataFrame({
+                'Cost Center': [e.cost_center or 'Unassigned' for e in filtered_expenses],
+                'Amount': [e.amount for e in filtered_expenses],
+            })
             return df.groupby('Cost Center')['Amount'].agg(['sum', 'mean', 'count']).round(2)
         elif group_by == "month":
-            df['Month'] = pd.to_datetime(df['Date']).dt.to_period('M')
+            # filtered_expenses mirrors the sorted slice, so its months
+            # come straight off the datetime64 column with no per-row
+            # Timestamp parsing
+            df = pd.DataFrame({
+                'Month': pd.PeriodIndex(self._dates_sorted[period].astype('datetime64[M]'),
+                                        freq='M'),
+                'Amount': [e.amount for e in filtered_expenses],
+            })
             return df.groupby('Month')['Amount'].agg(['sum', 'mean', 'count']).round(2)
-        
-        return df
+
+        # Rows mirror the sorted period slice, so the typed columns come
+        # straight off the cached arrays with no dtype inference
+        return pd.DataFrame({
+            'Date': pd.DatetimeIndex(self._dates_sorted[period]),
+            'Vendor': [vendor_name(e.vendor_id) for e in filtered_expenses],
+            'Amount': self._amounts_sorted[period],
+            'Category': pd.Categorical.from_codes(self._cat_sorted[period],
+                                                  dtype=_CATEGORY_DTYPE),
+            'Subcategory': [e.subcategory or '' for e in filtered_expenses],
+            'Description': [e.description for e in filtered_expenses],
+            'Status': pd.Categorical(
+                [e.approval_status.value for e in filtered_expenses],
+                dtype=_STATUS_DTYPE),
+            'Cost Center': pd.Categorical(
+                [e.cost_center or 'Unassigned' for e in filtered_expenses]),
+            'Project': pd.Categorical(
+                [e.project_id or 'None' for e in filtered_expenses]),
+            'Tax Deductible': self._deductible_sorted[period].astype(bool),
+        })
+
+    def _vendor_name(self, vendor_id: str) -> str:
+        vendor = self.vendors.get(vendor_id)
+        return vendor.name if vendor else "Unknown"
     
     def budget_vs_actual(self, budget_id: str, start_date: date, end_date: date) -> Dict:
         """Compare actual expenses against budget"""
@@ -184,46 +431,51 @@ class ExpenseTracker:
         if not budget:
             return {"error": "Budget not found"}
         
-        # Get actual expenses
-        filtered_expenses = [
-            e for e in self.expenses 
-            if start_date <= e.date <= end_date
-        ]
-        
-        # Group by category
-        actual_by_category = {}
-        for expense in filtered_expenses:
-            if expense.category not in actual_by_category:
-                actual_by_category[expense.category] = 0
-            actual_by_category[expense.category] += expense.amount
-        
+        # Actuals for every category in one weighted bincount over the
+        # period slice of the sorted columns
+        self._sync_arrays()
+        period = self._period_slice(start_date, end_date)
+        actual_vec = np.bincount(
+            self._cat_sorted[period], weights=self._amounts_sorted[period],
+            minlength=len(_CATEGORY_LIST)
+        )
+
+        budget_vec = np.zeros(len(_CATEGORY_LIST))
+        for category, budgeted_amount in budget.categories.items():
+            budget_vec[_CATEGORY_INDEX[category]] = budgeted_amount
+
+        variance_vec = budget_vec - actual_vec
+        variance_pct_vec = np.divide(
+            variance_vec, budget_vec, out=np.zeros_like(variance_vec),
+            where=budget_vec > 0
+        ) * 100
+
         # Compare with budget
         comparison = []
         total_budgeted = 0
         total_actual = 0
-        
-        for category, budgeted_amount in budget.categories.items():
-            actual_amount = actual_by_category.get(category, 0)
-            variance = budgeted_amount - actual_amount
-            variance_pct = (variance / budgeted_amount * 100) if budgeted_amount > 0 else 0
-            
+
+        for category in budget.categories:
+            idx = _CATEGORY_INDEX[category]
             comparison.append({
-                'Category': category.value,
-                'Budgeted': budgeted_amount,
-                'Actual': actual_amount,
-                'Variance': variance,
-                'Variance %': round(variance_pct, 2),
-                'Status': 'Under' if variance > 0 else 'Over'
+                'Category': _CATEGORY_VALUES[category],
+                'Budgeted': float(budget_vec[idx]),
+                'Actual': float(actual_vec[idx]),
+                'Variance': float(variance_vec[idx]),
+                'Variance %': round(float(variance_pct_vec[idx]), 2),
+                'Status': 'Under' if variance_vec[idx] > 0 else 'Over'
             })
-            
-            total_budgeted += budgeted_amount
-            total_actual += actual_amount
-        
+
+            total_budgeted += budget_vec[idx]
+            total_actual += actual_vec[idx]
+
         # Add categories with actual but no budget
-        for category, actual_amount in actual_by_category.items():
+        for idx in np.flatnonzero(actual_vec):
+            category = _CATEGORY_LIST[idx]
             if category not in budget.categories:
+                actual_amount = float(actual_vec[idx])
                 comparison.append({
-                    'Category': category.value,
+                    'Category': _CATEGORY_VALUES[category],
                     'Budgeted': 0,
                     'Actual': actual_amount,
                     'Variance': -actual_amount,
@@ -231,7 +483,7 @@ class ExpenseTracker:
                     'Status': 'Unbudgeted'
                 })
                 total_actual += actual_amount
-        
+
         return {
             'budget_name': budget.name,
             'period': f"{start_date} to {end_date}",
@@ -248,146 +500,146 @@ class ExpenseTracker:
         end_date = date.today()
         start_date = end_date - timedelta(days=365)
         
-        historical_expenses = [
-            e for e in self.expenses 
-            if start_date <= e.date <= end_date
-        ]
+        historical_expenses = self._period_expenses(start_date, end_date)
         
         if not historical_expenses:
             return pd.DataFrame()
         
-        # Create monthly aggregations
-        df = pd.DataFrame([{
-            'Date': e.date,
-            'Amount': e.amount,
-            'Category': e.category.value,
-            'Recurring': e.recurring
-        } for e in historical_expenses])
-        
-        df['Month'] = pd.to_datetime(df['Date']).dt.to_period('M')
+        # Create monthly aggregations; only Month and Amount feed the
+        # forecast, so build just those two columns ready-made
+        df = pd.DataFrame({
+            'Month': pd.PeriodIndex(
+                np.fromiter((e.date for e in historical_expenses),
+                            dtype='datetime64[M]', count=len(historical_expenses)),
+                freq='M'),
+            'Amount': [e.amount for e in historical_expenses],
+        })
         monthly_totals = df.groupby('Month')['Amount'].sum()
         
-        # Simple moving average forecast
-        forecast_data = []
-        last_3_months_avg = monthly_totals.tail(3).mean()
-        last_6_months_avg = monthly_totals.tail(6).mean()
-        last_12_months_avg = monthly_totals.mean()
-        
-        for i in range(1, months_ahead + 1):
-            forecast_month = end_date + timedelta(days=30*i)
-            
-            # Weight recent data more heavily
-            forecast_amount = (
-                last_3_months_avg * 0.5 +
-                last_6_months_avg * 0.3 +
-                last_12_months_avg * 0.2
-            )
-            
-            # Add seasonal adjustment (simplified)
-            month_num = forecast_month.month
-            seasonal_factor = 1.0
-            if month_num in [11, 12]:  # Higher expenses in Nov/Dec
-                seasonal_factor = 1.15
-            elif month_num in [7, 8]:  # Lower in summer
-                seasonal_factor = 0.9
-            
-            forecast_data.append({
-                'Month': forecast_month.strftime('%Y-%m'),
-                'Forecast': round(forecast_amount * seasonal_factor, 2),
-                'Low Estimate': round(forecast_amount * seasonal_factor * 0.9, 2),
-                'High Estimate': round(forecast_amount * seasonal_factor * 1.1, 2)
-            })
-        
-        return pd.DataFrame(forecast_data)
+        # Simple moving average forecast, weighting recent data more
+        # heavily; all months computed in one broadcast instead of a
+        # per-month Python loop
+        forecast_amount = (
+            monthly_totals.tail(3).mean() * 0.5 +
+            monthly_totals.tail(6).mean() * 0.3 +
+            monthly_totals.mean() * 0.2
+        )
+
+        forecast_dates = (np.datetime64(end_date, 'D') +
+                          np.arange(1, months_ahead + 1) * np.timedelta64(30, 'D'))
+        month_nums = forecast_dates.astype('datetime64[M]').astype(np.int64) % 12 + 1
+
+        # Seasonal adjustment (simplified): higher in Nov/Dec, lower in summer
+        seasonal = np.select(
+            [np.isin(month_nums, (11, 12)), np.isin(month_nums, (7, 8))],
+            [1.15, 0.9], default=1.0
+        )
+        forecast = forecast_amount * seasonal
+
+        return pd.DataFrame({
+            'Month': np.datetime_as_string(forecast_dates, unit='M'),
+            'Forecast': np.round(forecast, 2),
+            'Low Estimate': np.round(forecast * 0.9, 2),
+            'High Estimate': np.round(forecast * 1.1, 2),
+        })
     
     def identify_cost_savings(self, lookback_months: int = 6) -> List[Dict]:
         """Identify potential cost savings opportunities"""
         end_date = date.today()
         start_date = end_date - timedelta(days=30 * lookback_months)
         
-        recent_expenses = [
-            e for e in self.expenses 
-            if start_date <= e.date <= end_date
-        ]
+        recent_expenses = self._period_expenses(start_date, end_date)
         
         suggestions = []
         
-        # 1. Duplicate vendor analysis
-        vendor_category_spend = {}
-        for expense in recent_expenses:
-            vendor = self.vendors.get(expense.vendor_id)
-            if vendor:
-                key = (expense.category, vendor.vendor_id)
-                if key not in vendor_category_spend:
-                    vendor_category_spend[key] = {'vendor': vendor.name, 'total': 0, 'count': 0}
-                vendor_category_spend[key]['total'] += expense.amount
-                vendor_category_spend[key]['count'] += 1
-        
-        # Find categories with multiple vendors
-        category_vendors = {}
-        for (category, vendor_id), data in vendor_category_spend.items():
-            if category not in category_vendors:
-                category_vendors[category] = []
-            category_vendors[category].append(data)
-        
+        # 1. Duplicate vendor analysis — merge the precomputed month
+        # buckets covering the lookback window instead of rescanning
+        # every recent expense
+        category_vendors = defaultdict(dict)
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            for (category, vendor_id), (total, count) in \
+                    self._monthly_vendor_spend.get((year, month), {}).items():
+                vendor = self.vendors.get(vendor_id)
+                if vendor:
+                    entry = category_vendors[category].setdefault(
+                        vendor_id, {'vendor': vendor.name, 'total': 0, 'count': 0})
+                    entry['total'] += total
+                    entry['count'] += count
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        # Categories with multiple vendors
         for category, vendors in category_vendors.items():
             if len(vendors) > 2:
-                total_spend = sum(v['total'] for v in vendors)
+                total_spend = sum(v['total'] for v in vendors.values())
                 suggestions.append({
                     'type': 'Vendor Consolidation',
                     'category': category.value,
                     'description': f"Consider consolidating {len(vendors)} vendors",
                     'current_spend': round(total_spend, 2),
                     'potential_savings': round(total_spend * 0.1, 2),  # 10% savings estimate
-                    'vendors': [v['vendor'] for v in vendors]
+                    'vendors': [v['vendor'] for v in vendors.values()]
                 })
         
-        # 2. Recurring expense optimization
-        recurring_expenses = [e for e in recent_expenses if e.recurring]
-        recurring_by_category = {}
-        for expense in recurring_expenses:
-            if expense.category not in recurring_by_category:
-                recurring_by_category[expense.category] = []
-            recurring_by_category[expense.category].append(expense)
-        
-        for category, expenses in recurring_by_category.items():
-            if len(expenses) > 5:
-                total = sum(e.amount for e in expenses)
+        # Amount and category codes for the window come straight off the
+        # sorted column slices; recent_expenses mirrors the same rows
+        n = len(recent_expenses)
+        n_cats = len(_CATEGORY_LIST)
+        period = self._period_slice(start_date, end_date)
+        amounts = self._amounts_sorted[period]
+        cats = self._cat_sorted[period].astype(np.intp)
+
+        # 2. Recurring expense review: per-category counts and totals from
+        # two weighted bincounts instead of Python bucketing and sums
+        recurring = np.fromiter((e.recurring for e in recent_expenses),
+                                dtype=bool, count=n)
+        rec_counts = np.bincount(cats[recurring], minlength=n_cats)
+        rec_totals = np.bincount(cats[recurring], weights=amounts[recurring],
+                                 minlength=n_cats)
+
+        for cat_idx in np.flatnonzero(rec_counts > 5):
+            total = float(rec_totals[cat_idx])
+            suggestions.append({
+                'type': 'Recurring Expense Review',
+                'category': _CATEGORY_LIST[cat_idx].value,
+                'description': f"Review {int(rec_counts[cat_idx])} recurring expenses",
+                'current_spend': round(total, 2),
+                'potential_savings': round(total * 0.15, 2),  # 15% savings estimate
+                'action': 'Negotiate annual contracts or review necessity'
+            })
+
+        # 3. Outlier detection: per-category mean/std from three
+        # bincounts, then one vectorized z-score pass; only confirmed
+        # outliers are touched in Python
+        if recent_expenses:
+            counts = np.bincount(cats, minlength=n_cats)
+            sums = np.bincount(cats, weights=amounts, minlength=n_cats)
+            sumsq = np.bincount(cats, weights=amounts * amounts, minlength=n_cats)
+
+            means = np.divide(sums, counts, out=np.zeros(n_cats), where=counts > 0)
+            # Sample variance (ddof=1), matching the groupby std this replaces
+            var = np.divide(sumsq - counts * means * means,
+                            counts - 1,
+                            out=np.zeros(n_cats), where=counts > 1)
+            stds = np.sqrt(np.maximum(var, 0.0))
+
+            per_std = stds[cats]
+            z_scores = np.divide(amounts - means[cats], per_std,
+                                 out=np.zeros(n), where=per_std > 0)
+            outlier_idx = np.flatnonzero((z_scores > 3) & (counts[cats] > 5))
+
+            for i in outlier_idx:
+                expense = recent_expenses[i]
                 suggestions.append({
-                    'type': 'Recurring Expense Review',
-                    'category': category.value,
-                    'description': f"Review {len(expenses)} recurring expenses",
-                    'current_spend': round(total, 2),
-                    'potential_savings': round(total * 0.15, 2),  # 15% savings estimate
-                    'action': 'Negotiate annual contracts or review necessity'
+                    'type': 'Unusual Expense',
+                    'category': _CATEGORY_VALUES[expense.category],
+                    'description': f"Expense significantly above average",
+                    'vendor': self._vendor_name(expense.vendor_id),
+                    'amount': expense.amount,
+                    'average': round(float(means[cats[i]]), 2),
+                    'action': 'Review for accuracy or negotiate'
                 })
-        
-        # 3. Outlier detection
-        df = pd.DataFrame([{
-            'amount': e.amount,
-            'category': e.category.value,
-            'vendor': self.vendors.get(e.vendor_id, Vendor("", "Unknown", {})).name
-        } for e in recent_expenses])
-        
-        if not df.empty:
-            category_stats = df.groupby('category')['amount'].agg(['mean', 'std', 'count'])
-            
-            for expense in recent_expenses:
-                cat_stats = category_stats.loc[expense.category.value]
-                if cat_stats['count'] > 5:  # Need enough data
-                    z_score = (expense.amount - cat_stats['mean']) / cat_stats['std'] if cat_stats['std'] > 0 else 0
-                    if z_score > 3:  # 3 standard deviations
-                        vendor = self.vendors.get(expense.vendor_id, Vendor("", "Unknown", {}))
-                        suggestions.append({
-                            'type': 'Unusual Expense',
-                            'category': expense.category.value,
-                            'description': f"Expense significantly above average",
-                            'vendor': vendor.name,
-                            'amount': expense.amount,
-                            'average': round(cat_stats['mean'], 2),
-                            'action': 'Review for accuracy or negotiate'
-                        })
-        
+
         return suggestions
     
     def generate_1099_report(self, tax_year: int) -> pd.DataFrame:
@@ -397,9 +649,9 @@ class ExpenseTracker:
         
         vendor_payments = {}
         
-        for expense in self.expenses:
-            if (start_date <= expense.date <= end_date and 
-                expense.approval_status == ApprovalStatus.PAID):
+        paid_status = ApprovalStatus.PAID
+        for expense in self._period_expenses(start_date, end_date):
+            if expense.approval_status is paid_status:
                 
                 if expense.vendor_id not in vendor_payments:
                     vendor_payments[expense.vendor_id] = {
@@ -411,7 +663,7 @@ class ExpenseTracker:
                 vendor_payments[expense.vendor_id]['payments'].append({
                     'date': expense.date,
                     'amount': expense.amount,
-                    'category': expense.category.value
+                    'category': _CATEGORY_VALUES[expense.category]
                 })
         
         # Create 1099 report
@@ -434,42 +686,46 @@ class ExpenseTracker:
         """Analyze cash flow impact of pending expenses"""
         today = date.today()
         future_date = today + timedelta(days=days_ahead)
-        
+        overdue_cutoff = today - timedelta(days=30)
+
         # Pending approvals
         pending_expenses = [
-            e for e in self.expenses 
-            if e.approval_status in [ApprovalStatus.PENDING, ApprovalStatus.APPROVED]
-            and e.paid_date is None
+            e for e in self.expenses
+            if e.approval_status in _UNPAID_STATUSES and e.paid_date is None
         ]
         
-        # Group by expected payment date
+        # Expected payment dates for the whole pending queue in one
+        # datetime64 add; unknown vendors get a negative terms sentinel
+        # so they stay out of the schedule, as before
+        n = len(pending_expenses)
+        vendors = self.vendors
+        dates64 = np.fromiter((e.date for e in pending_expenses),
+                              dtype='datetime64[D]', count=n)
+        amounts = np.fromiter((e.amount for e in pending_expenses),
+                              dtype=np.float64, count=n)
+        terms_days = np.fromiter(
+            (_PAYMENT_TERM_DAYS.get(vendors[e.vendor_id].payment_terms, 30)
+             if e.vendor_id in vendors else -1 for e in pending_expenses),
+            dtype=np.int64, count=n)
+
+        expected = dates64 + terms_days.astype('timedelta64[D]')
+        scheduled = (terms_days >= 0) & (expected <= np.datetime64(future_date, 'D'))
+
+        # Weekly totals grouped on the integer day codes; strftime runs
+        # once per distinct payment date instead of once per expense
         cash_flow = {}
-        
-        for expense in pending_expenses:
-            vendor = self.vendors.get(expense.vendor_id)
-            if vendor:
-                # Calculate expected payment date based on terms
-                terms_days = 30  # Default
-                if vendor.payment_terms == "Net 15":
-                    terms_days = 15
-                elif vendor.payment_terms == "Net 45":
-                    terms_days = 45
-                elif vendor.payment_terms == "Due on Receipt":
-                    terms_days = 0
-                
-                expected_payment = expense.date + timedelta(days=terms_days)
-                
-                if expected_payment <= future_date:
-                    week_key = expected_payment.strftime('%Y-W%V')
-                    if week_key not in cash_flow:
-                        cash_flow[week_key] = 0
-                    cash_flow[week_key] += expense.amount
-        
+        uniq_days, inverse = np.unique(expected[scheduled].astype(np.int64),
+                                       return_inverse=True)
+        day_totals = np.bincount(inverse, weights=amounts[scheduled])
+        for day, total in zip(uniq_days, day_totals):
+            week_key = np.datetime64(int(day), 'D').item().strftime('%Y-W%V')
+            cash_flow[week_key] = cash_flow.get(week_key, 0) + float(total)
+
         return {
             'weekly_outflows': cash_flow,
-            'total_pending': sum(e.amount for e in pending_expenses),
+            'total_pending': float(amounts.sum()),
             'next_30_days': sum(cash_flow.values()),
-            'overdue': sum(e.amount for e in pending_expenses if e.date < today - timedelta(days=30))
+            'overdue': float(amounts[dates64 < np.datetime64(overdue_cutoff, 'D')].sum())
         }
 
 class ExpenseAnalytics:
@@ -481,74 +737,81 @@ class ExpenseAnalytics:
         if not expenses:
             return pd.DataFrame()
         
-        df = pd.DataFrame([{
-            'Date': e.date,
-            'Amount': e.amount,
-            'Category': e.category.value
-        } for e in expenses])
-        
-        df['Month'] = pd.to_datetime(df['Date']).dt.to_period('M')
-        
+        months = pd.PeriodIndex(
+            np.fromiter((e.date for e in expenses),
+                        dtype='datetime64[M]', count=len(expenses)),
+            freq='M')
+        df = pd.DataFrame({
+            'Month': months,
+            'Amount': [e.amount for e in expenses],
+        })
+
         # Overall trend
         monthly_trend = df.groupby('Month')['Amount'].sum()
-        
-        # Calculate moving averages
-        ma_3 = monthly_trend.rolling(window=3).mean()
-        ma_6 = monthly_trend.rolling(window=6).mean()
-        
-        # Calculate growth rates
-        growth_rate = monthly_trend.pct_change()
-        
+        totals = np.asarray(monthly_trend.values, dtype=np.float64)
+
+        # Moving averages and growth in one numpy pass over the totals
+        # instead of three separate rolling/pct_change sweeps; both
+        # windows share a single prefix sum, so each average is one
+        # shifted subtract rather than a convolution
+        csum = np.concatenate(([0.0], np.cumsum(totals)))
+
+        def _moving_average(window: int) -> np.ndarray:
+            ma = np.full(len(totals), np.nan)
+            if len(totals) >= window:
+                ma[window - 1:] = (csum[window:] - csum[:-window]) / window
+            return ma
+
+        growth_rate = np.full(len(totals), np.nan)
+        if len(totals) > 1:
+            np.divide(totals[1:], totals[:-1], out=growth_rate[1:])
+            growth_rate[1:] -= 1
+
         trend_df = pd.DataFrame({
             'Month': monthly_trend.index,
-            'Total': monthly_trend.values,
-            '3-Month MA': ma_3.values,
-            '6-Month MA': ma_6.values,
-            'Growth Rate': growth_rate.values
+            'Total': totals,
+            '3-Month MA': _moving_average(3),
+            '6-Month MA': _moving_average(6),
+            'Growth Rate': growth_rate
         })
-        
+
         return trend_df
     
     @staticmethod
     def vendor_analysis(expenses: List[Expense], vendors: Dict[str, Vendor]) -> pd.DataFrame:
         """Analyze vendor spending patterns"""
-        vendor_data = {}
-        
-        for expense in expenses:
-            if expense.vendor_id not in vendor_data:
-                vendor = vendors.get(expense.vendor_id, Vendor("", "Unknown", {}))
-                vendor_data[expense.vendor_id] = {
-                    'name': vendor.name,
-                    'total_spend': 0,
-                    'transaction_count': 0,
-                    'categories': set(),
-                    'last_payment': None,
-                    'payment_methods': set()
-                }
-            
-            vd = vendor_data[expense.vendor_id]
-            vd['total_spend'] += expense.amount
-            vd['transaction_count'] += 1
-            vd['categories'].add(expense.category.value)
-            vd['payment_methods'].add(expense.payment_method.value)
-            
-            if vd['last_payment'] is None or expense.date > vd['last_payment']:
-                vd['last_payment'] = expense.date
-        
-        # Convert to DataFrame
-        analysis_data = []
-        for vendor_id, data in vendor_data.items():
-            analysis_data.append({
-                'Vendor': data['name'],
-                'Total Spend': data['total_spend'],
-                'Transactions': data['transaction_count'],
-                'Avg Transaction': data['total_spend'] / data['transaction_count'],
-                'Categories': len(data['categories']),
-                'Last Payment': data['last_payment'],
-                'Days Since Last': (date.today() - data['last_payment']).days if data['last_payment'] else None
-            })
-        
-        return pd.DataFrame(analysis_data).sort_values('Total Spend', ascending=False)
+        df = pd.DataFrame({
+            'vendor_id': [e.vendor_id for e in expenses],
+            'amount': [e.amount for e in expenses],
+            'category': pd.Categorical.from_codes(
+                [_CATEGORY_INDEX[e.category] for e in expenses],
+                dtype=_CATEGORY_DTYPE),
+            'date': [e.date for e in expenses],
+        })
+
+        # One grouped aggregation pass instead of a per-expense
+        # dict-of-sets accumulator
+        agg = df.groupby('vendor_id').agg(
+            total_spend=('amount', 'sum'),
+            transactions=('amount', 'count'),
+            categories=('category', 'nunique'),
+            last_payment=('date', 'max'),
+        )
+
+        def vendor_name(vendor_id: str) -> str:
+            vendor = vendors.get(vendor_id)
+            return vendor.name if vendor else "Unknown"
+
+        today = date.today()
+        return pd.DataFrame({
+            'Vendor': [vendor_name(v) for v in agg.index],
+            'Total Spend': agg['total_spend'].values,
+            'Transactions': agg['transactions'].values,
+            'Avg Transaction': (agg['total_spend'] / agg['transactions']).values,
+            'Categories': agg['categories'].values,
+            'Last Payment': agg['last_payment'].values,
+            'Days Since Last': [(today - d).days for d in agg['last_payment']],
+        }).sort_values('Total Spend', ascending=False)
 
 if __name__ == "__main__":
     # Test expense tracking system
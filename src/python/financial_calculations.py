@@ -1,24 +1,130 @@
+import math
+
 import numpy as np
 import numpy_financial as npf
+from functools import lru_cache
 from decimal import Decimal, ROUND_HALF_UP
 from typing import List, Dict, Union, Optional, Tuple
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
 import pandas as pd
 
+# Payment frequency lookup shared by the amortization path; built once
+# instead of per call
+_FREQUENCIES = {
+    'monthly': 12,
+    'quarterly': 4,
+    'semi-annually': 2,
+    'annually': 1
+}
+
+# Half-year convention MACRS tables, frozen as arrays so macrs() is one
+# broadcast multiply with no per-call dict or list building
+_MACRS_RATES = {
+    3: np.array([0.3333, 0.4445, 0.1481, 0.0741]),
+    5: np.array([0.2000, 0.3200, 0.1920, 0.1152, 0.1152, 0.0576]),
+    7: np.array([0.1429, 0.2449, 0.1749, 0.1249, 0.0893, 0.0892, 0.0893, 0.0446]),
+    10: np.array([0.1000, 0.1800, 0.1440, 0.1152, 0.0922, 0.0737, 0.0655, 0.0655,
+                  0.0656, 0.0655, 0.0328]),
+}
+
+@lru_cache(maxsize=1024)
+def _discount_vector(rate: float, n: int) -> np.ndarray:
+    """Read-only [(1+rate)^-1 .. (1+rate)^-n], cached so sensitivity
+    sweeps and Monte Carlo runs that reuse a rate skip the pow calls"""
+    v = np.power(1.0 + rate, -np.arange(1, n + 1))
+    v.setflags(write=False)
+    return v
+
+
+def _irr_newton(flows: np.ndarray, tol: float = 1e-12, maxiter: int = 80) -> float:
+    """Newton IRR seeded from a coarse bracket scan, with bisection as the
+    safety net when a step leaves the bracket. Returns nan when no sign
+    change exists in npv(r) over the scanned range."""
+    periods = np.arange(flows.size)
+    weighted = periods * flows
+
+    def f(r: float) -> float:
+        return float(flows @ (1.0 + r) ** -periods)
+
+    # Coarse scan for a sign change; one power matrix covers every grid
+    # point at once
+    grid = np.concatenate((np.linspace(-0.999, -0.1, 19), np.linspace(0.0, 10.0, 101)))
+    values = ((1.0 + grid[:, None]) ** -periods) @ flows
+    signs = np.sign(values)
+    change = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+    if change.size == 0:
+        exact = np.flatnonzero(values == 0)
+        return float(grid[exact[0]]) if exact.size else float('nan')
+
+    lo, hi = float(grid[change[0]]), float(grid[change[0] + 1])
+    f_lo = f(lo)
+    r = (lo + hi) / 2
+
+    for _ in range(maxiter):
+        fr = f(r)
+        if abs(fr) < tol:
+            return r
+        # Keep the bracket current so bisection stays valid
+        if (fr < 0) == (f_lo < 0):
+            lo, f_lo = r, fr
+        else:
+            hi = r
+        fp = float(weighted @ (1.0 + r) ** -(periods + 1))
+        step_to = r + fr / fp if fp != 0 else lo - 1  # force bisection
+        r = step_to if lo < step_to < hi else (lo + hi) / 2
+        if hi - lo < tol:
+            return r
+    return r
+
+
 class FinancialCalculator:
     """High-level financial calculations for accounting and finance"""
-    
+
     @staticmethod
     def npv(rate: float, cash_flows: List[float], initial_investment: float = 0) -> float:
         """Calculate Net Present Value"""
         flows = [-initial_investment] + cash_flows if initial_investment else cash_flows
+        if len(flows) < 64 and rate != -1.0:
+            # Typical accounting schedules are short; a running
+            # discount factor beats building ndarrays and pow vectors
+            # for these sizes
+            total = 0.0
+            factor = 1.0
+            step = 1.0 / (1.0 + rate)
+            for flow in flows:
+                total += flow * factor
+                factor *= step
+            return total
         return float(npf.npv(rate, flows))
-    
+
+    @staticmethod
+    def npv_batch(rate: Union[float, np.ndarray], values: np.ndarray,
+                  initial_investment: float = 0.0) -> np.ndarray:
+        """Net present value for many scenarios at once.
+
+        values is (n_scenarios, n_periods) with period 0 undiscounted,
+        matching npv(); the whole batch reduces to one matrix-vector
+        product against the discount vector. A rate array of shape (R,)
+        broadcasts to an (R, n_scenarios) result."""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        periods = np.arange(values.shape[-1])
+
+        if np.ndim(rate) == 0:
+            discounts = np.power(1.0 + rate, -periods)
+            return values @ discounts - initial_investment
+
+        rates = np.asarray(rate, dtype=np.float64)
+        discounts = np.power(1.0 + rates[:, None], -periods)
+        return discounts @ values.T - initial_investment
+
     @staticmethod
     def irr(cash_flows: List[float]) -> float:
         """Calculate Internal Rate of Return"""
-        return float(npf.irr(cash_flows))
+        flows = np.asarray(cash_flows, dtype=np.float64)
+        if flows.size == 0 or (flows >= 0).all() or (flows <= 0).all():
+            return float('nan')
+        return _irr_newton(flows)
     
     @staticmethod
     def mirr(cash_flows: List[float], finance_rate: float, reinvest_rate: float) -> float:
@@ -28,85 +134,118 @@ class FinancialCalculator:
     @staticmethod
     def payback_period(initial_investment: float, cash_flows: List[float]) -> Optional[float]:
         """Calculate payback period in years"""
-        cumulative = -initial_investment
-        for i, flow in enumerate(cash_flows):
-            cumulative += flow
-            if cumulative >= 0:
-                if flow != 0:
-                    return i + (cumulative - flow) / flow
-                else:
-                    return float(i)
-        return None
+        flows = np.asarray(cash_flows, dtype=np.float64)
+        if flows.size == 0:
+            return None
+
+        # Accumulate every period at once, then locate the first
+        # recovery point; mirrors discounted_payback_period
+        cumulative = np.cumsum(flows) - initial_investment
+        recovered = cumulative >= 0
+        if not recovered.any():
+            return None
+
+        i = int(np.argmax(recovered))
+        flow = flows[i]
+        if flow != 0:
+            return float(i + (cumulative[i] - flow) / flow)
+        return float(i)
     
+    @staticmethod
+    def payback_period_integer(initial_investment: float, cash_flows: List[float]) -> Optional[int]:
+        """Whole-period payback: first period whose cumulative flow
+        recovers the investment, with no fractional interpolation.
+
+        The whole computation is a sign scan — cumsum, compare, argmin
+        over the boolean mask — for callers that only need the year."""
+        cumulative = np.cumsum(np.asarray(cash_flows, dtype=np.float64)) - initial_investment
+        negative = cumulative < 0
+        if negative.all():
+            return None
+        return int(np.argmin(negative))
+
     @staticmethod
     def discounted_payback_period(initial_investment: float, cash_flows: List[float], rate: float) -> Optional[float]:
         """Calculate discounted payback period"""
-        cumulative = -initial_investment
-        for i, flow in enumerate(cash_flows):
-            discounted_flow = flow / ((1 + rate) ** (i + 1))
-            cumulative += discounted_flow
-            if cumulative >= 0:
-                if discounted_flow != 0:
-                    return i + (cumulative - discounted_flow) / discounted_flow
-                else:
-                    return float(i)
-        return None
+        flows = np.asarray(cash_flows, dtype=np.float64)
+        if flows.size == 0:
+            return None
+
+        # Discount and accumulate every period in one vectorized pass,
+        # then locate the first recovery point
+        discounted = flows * _discount_vector(rate, flows.size)
+        cumulative = np.cumsum(discounted) - initial_investment
+        recovered = cumulative >= 0
+        if not recovered.any():
+            return None
+
+        i = int(np.argmax(recovered))
+        discounted_flow = discounted[i]
+        if discounted_flow != 0:
+            return float(i + (cumulative[i] - discounted_flow) / discounted_flow)
+        return float(i)
     
     @staticmethod
     def profitability_index(initial_investment: float, cash_flows: List[float], rate: float) -> float:
         """Calculate profitability index (PI)"""
-        pv_future_flows = sum(flow / ((1 + rate) ** (i + 1)) for i, flow in enumerate(cash_flows))
-        return pv_future_flows / initial_investment
+        flows = np.asarray(cash_flows, dtype=np.float64)
+        return float(flows @ _discount_vector(rate, flows.size)) / initial_investment
     
     @staticmethod
     def loan_amortization(principal: float, annual_rate: float, years: int, 
                          payment_frequency: str = 'monthly') -> pd.DataFrame:
         """Generate loan amortization schedule"""
-        frequencies = {
-            'monthly': 12,
-            'quarterly': 4,
-            'semi-annually': 2,
-            'annually': 1
-        }
-        
-        periods_per_year = frequencies.get(payment_frequency, 12)
+        periods_per_year = _FREQUENCIES.get(payment_frequency, 12)
         n_periods = years * periods_per_year
         period_rate = annual_rate / periods_per_year
         
-        payment = npf.pmt(period_rate, n_periods, -principal)
-        
-        schedule = []
-        balance = principal
-        
-        for period in range(1, n_periods + 1):
-            interest = balance * period_rate
-            principal_payment = payment - interest
-            balance -= principal_payment
-            
-            schedule.append({
-                'Period': period,
-                'Payment': round(payment, 2),
-                'Principal': round(principal_payment, 2),
-                'Interest': round(interest, 2),
-                'Balance': round(max(0, balance), 2)
-            })
-        
-        return pd.DataFrame(schedule)
-    
+        payment = float(npf.pmt(period_rate, n_periods, -principal))
+
+        # The balance recurrence has a closed form, so every period's
+        # balance comes from one power vector with no loop:
+        #   balance_k = principal*(1+r)^k - payment*((1+r)^k - 1)/r
+        growth = np.power(1.0 + period_rate, np.arange(n_periods + 1))
+        if period_rate != 0:
+            balances = principal * growth - payment * (growth - 1.0) / period_rate
+        else:
+            balances = principal - payment * np.arange(n_periods + 1)
+
+        interest_col = balances[:-1] * period_rate
+        principal_col = payment - interest_col
+        balance_col = balances[1:]
+
+        return pd.DataFrame({
+            'Period': np.arange(1, n_periods + 1),
+            'Payment': np.full(n_periods, round(payment, 2)),
+            'Principal': np.round(principal_col, 2),
+            'Interest': np.round(interest_col, 2),
+            'Balance': np.round(np.maximum(0, balance_col), 2)
+        })
+    
+    # The compounding formulas below use log1p/expm1 rather than
+    # (1+rate)**periods: they stay accurate for small rates (no
+    # cancellation in 1+rate) and broadcast when callers pass arrays
+
     @staticmethod
-    def effective_annual_rate(nominal_rate: float, compounding_periods: int) -> float:
+    def effective_annual_rate(nominal_rate: Union[float, np.ndarray],
+                              compounding_periods: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
         """Calculate effective annual rate (EAR)"""
-        return ((1 + nominal_rate / compounding_periods) ** compounding_periods) - 1
-    
+        if not isinstance(nominal_rate, np.ndarray) and not isinstance(compounding_periods, np.ndarray):
+            # math's scalar ufuncs skip ndarray dispatch entirely
+            return math.expm1(compounding_periods * math.log1p(nominal_rate / compounding_periods))
+        return np.expm1(compounding_periods * np.log1p(nominal_rate / compounding_periods))
+
     @staticmethod
-    def future_value(present_value: float, rate: float, periods: int) -> float:
+    def future_value(present_value: Union[float, np.ndarray], rate: Union[float, np.ndarray],
+                     periods: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
         """Calculate future value"""
-        return present_value * ((1 + rate) ** periods)
-    
+        return present_value * np.exp(periods * np.log1p(rate))
+
     @staticmethod
-    def present_value(future_value: float, rate: float, periods: int) -> float:
+    def present_value(future_value: Union[float, np.ndarray], rate: Union[float, np.ndarray],
+                      periods: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
         """Calculate present value"""
-        return future_value / ((1 + rate) ** periods)
+        return future_value * np.exp(-periods * np.log1p(rate))
     
     @staticmethod
     def bond_price(face_value: float, coupon_rate: float, yield_rate: float, 
@@ -115,26 +254,63 @@ class FinancialCalculator:
         periods = years * frequency
         coupon_payment = (face_value * coupon_rate) / frequency
         period_yield = yield_rate / frequency
-        
-        pv_coupons = sum(coupon_payment / ((1 + period_yield) ** i) 
-                        for i in range(1, periods + 1))
-        pv_face = face_value / ((1 + period_yield) ** periods)
-        
+
+        # Closed-form annuity value of the coupon stream; the per-period
+        # discounting loop was a geometric series
+        if period_yield == 0:
+            pv_coupons = coupon_payment * periods
+        else:
+            pv_coupons = (coupon_payment *
+                          (1.0 - (1.0 + period_yield) ** -periods) / period_yield)
+        pv_face = face_value * (1.0 + period_yield) ** -periods
+
         return pv_coupons + pv_face
     
     @staticmethod
     def duration(cash_flows: List[Tuple[float, float]], yield_rate: float) -> float:
         """Calculate Macaulay duration"""
-        total_pv = 0
-        weighted_pv = 0
-        
-        for time, cash_flow in cash_flows:
-            pv = cash_flow / ((1 + yield_rate) ** time)
-            total_pv += pv
-            weighted_pv += time * pv
-        
-        return weighted_pv / total_pv if total_pv != 0 else 0
+        flows = np.asarray(cash_flows, dtype=np.float64)
+        if flows.size == 0:
+            return 0
+
+        # One vectorized discounting pass over the (time, cash flow)
+        # columns instead of a pow per tuple
+        times = flows[:, 0]
+        pv = flows[:, 1] / np.power(1.0 + yield_rate, times)
+        total_pv = pv.sum()
+
+        return float((times * pv).sum() / total_pv) if total_pv != 0 else 0
     
+    @staticmethod
+    def bond_analytics(face_value: float, coupon_rate: float, yield_rate: float,
+                       years: int, frequency: int = 2) -> Dict[str, float]:
+        """Price, Macaulay/modified duration and convexity in one pass.
+
+        Calling bond_price and duration separately discounts the same
+        schedule twice; here one discount vector feeds all four
+        figures. Durations and convexity are annualized."""
+        periods = years * frequency
+        coupon_payment = (face_value * coupon_rate) / frequency
+        period_yield = yield_rate / frequency
+
+        k = np.arange(1, periods + 1, dtype=np.float64)
+        pv = coupon_payment * _discount_vector(period_yield, periods)
+        pv[-1] += face_value * (1.0 + period_yield) ** -periods
+
+        price = float(pv.sum())
+        if price == 0:
+            return {'price': 0.0, 'macaulay_duration': 0.0,
+                    'modified_duration': 0.0, 'convexity': 0.0}
+
+        weighted_pv = float(k @ pv)
+        macaulay = weighted_pv / price / frequency
+        modified = macaulay / (1.0 + period_yield)
+        convexity = (float((k * (k + 1.0)) @ pv) /
+                     ((1.0 + period_yield) ** 2 * price * frequency ** 2))
+
+        return {'price': price, 'macaulay_duration': macaulay,
+                'modified_duration': modified, 'convexity': convexity}
+
     @staticmethod
     def capm(risk_free_rate: float, beta: float, market_return: float) -> float:
         """Calculate expected return using CAPM"""
@@ -144,11 +320,10 @@ class FinancialCalculator:
     def wacc(equity_value: float, debt_value: float, cost_of_equity: float, 
              cost_of_debt: float, tax_rate: float) -> float:
         """Calculate Weighted Average Cost of Capital"""
+        # One division instead of two per-weight divisions
         total_value = equity_value + debt_value
-        equity_weight = equity_value / total_value
-        debt_weight = debt_value / total_value
-        
-        return (equity_weight * cost_of_equity) + (debt_weight * cost_of_debt * (1 - tax_rate))
+        return (equity_value * cost_of_equity +
+                debt_value * cost_of_debt * (1.0 - tax_rate)) / total_value
 
 
 class DepreciationCalculator:
@@ -161,66 +336,54 @@ class DepreciationCalculator:
         return [annual_depreciation] * useful_life
     
     @staticmethod
-    def declining_balance(cost: float, salvage_value: float, useful_life: int, 
-                         rate: float = 2.0) -> List[float]:
+    def declining_balance(cost: float, salvage_value: float, useful_life: int,
+                         rate: float = 2.0) -> np.ndarray:
         """Calculate declining balance depreciation"""
-        depreciation_schedule = []
+        # Preallocated schedule: the zeros after an early salvage stop
+        # are already in place, so no list growth or tail padding
+        depreciation_schedule = np.zeros(useful_life)
         book_value = cost
         annual_rate = rate / useful_life
-        
+
         for year in range(useful_life):
             depreciation = book_value * annual_rate
             if book_value - depreciation < salvage_value:
                 depreciation = book_value - salvage_value
-            depreciation_schedule.append(depreciation)
+            depreciation_schedule[year] = depreciation
             book_value -= depreciation
-            
+
             if book_value <= salvage_value:
                 break
-        
-        while len(depreciation_schedule) < useful_life:
-            depreciation_schedule.append(0)
-            
+
         return depreciation_schedule
     
     @staticmethod
-    def sum_of_years_digits(cost: float, salvage_value: float, useful_life: int) -> List[float]:
+    def sum_of_years_digits(cost: float, salvage_value: float, useful_life: int) -> np.ndarray:
         """Calculate sum-of-years-digits depreciation"""
         depreciable_amount = cost - salvage_value
-        sum_of_years = sum(range(1, useful_life + 1))
-        
-        depreciation_schedule = []
-        for year in range(useful_life, 0, -1):
-            fraction = year / sum_of_years
-            depreciation = depreciable_amount * fraction
-            depreciation_schedule.append(depreciation)
-            
-        return depreciation_schedule
+        sum_of_years = useful_life * (useful_life + 1) / 2
+
+        # Whole schedule in one broadcast over the descending years
+        years = np.arange(useful_life, 0, -1, dtype=np.float64)
+        return depreciable_amount * years / sum_of_years
     
     @staticmethod
-    def units_of_production(cost: float, salvage_value: float, total_units: int, 
-                           units_per_period: List[int]) -> List[float]:
+    def units_of_production(cost: float, salvage_value: float, total_units: int,
+                           units_per_period: List[int]) -> np.ndarray:
         """Calculate units of production depreciation"""
         depreciable_amount = cost - salvage_value
         rate_per_unit = depreciable_amount / total_units
-        
-        return [units * rate_per_unit for units in units_per_period]
+
+        return np.asarray(units_per_period, dtype=np.float64) * rate_per_unit
     
     @staticmethod
-    def macrs(cost: float, recovery_period: int) -> List[float]:
+    def macrs(cost: float, recovery_period: int) -> np.ndarray:
         """Calculate MACRS depreciation (simplified)"""
-        macrs_rates = {
-            3: [0.3333, 0.4445, 0.1481, 0.0741],
-            5: [0.2000, 0.3200, 0.1920, 0.1152, 0.1152, 0.0576],
-            7: [0.1429, 0.2449, 0.1749, 0.1249, 0.0893, 0.0892, 0.0893, 0.0446],
-            10: [0.1000, 0.1800, 0.1440, 0.1152, 0.0922, 0.0737, 0.0655, 0.0655, 0.0656, 0.0655, 0.0328]
-        }
-        
-        if recovery_period not in macrs_rates:
+        rates = _MACRS_RATES.get(recovery_period)
+        if rates is None:
             raise ValueError(f"MACRS rates not available for {recovery_period} year period")
-        
-        rates = macrs_rates[recovery_period]
-        return [cost * rate for rate in rates]
+
+        return cost * rates
 
 
 class RatioAnalysis:
@@ -286,6 +449,85 @@ class RatioAnalysis:
         """Calculate interest coverage ratio"""
         return ebit / interest_expense if interest_expense != 0 else float('inf')
 
+    # Batched variants: one guarded divide over whole arrays, so a
+    # portfolio of companies or periods costs one call instead of a
+    # Python loop over the scalar methods above
+
+    @staticmethod
+    def _batch_divide(numerator, denominator, zero_fill: float) -> np.ndarray:
+        """Elementwise a/b with zero_fill wherever the denominator is 0"""
+        numerator = np.asarray(numerator, dtype=np.float64)
+        denominator = np.asarray(denominator, dtype=np.float64)
+        out = np.full(np.broadcast(numerator, denominator).shape, zero_fill)
+        np.divide(numerator, denominator, out=out, where=denominator != 0)
+        return out
+
+    @staticmethod
+    def current_ratio_batch(current_assets, current_liabilities) -> np.ndarray:
+        """current_ratio over arrays of positions"""
+        return RatioAnalysis._batch_divide(current_assets, current_liabilities, float('inf'))
+
+    @staticmethod
+    def quick_ratio_batch(current_assets, inventory, current_liabilities) -> np.ndarray:
+        """quick_ratio over arrays of positions"""
+        quick_assets = np.asarray(current_assets, dtype=np.float64) - np.asarray(inventory, dtype=np.float64)
+        return RatioAnalysis._batch_divide(quick_assets, current_liabilities, float('inf'))
+
+    @staticmethod
+    def debt_to_equity_batch(total_debt, total_equity) -> np.ndarray:
+        """debt_to_equity over arrays of positions"""
+        return RatioAnalysis._batch_divide(total_debt, total_equity, float('inf'))
+
+    @staticmethod
+    def return_on_assets_batch(net_income, total_assets) -> np.ndarray:
+        """return_on_assets over arrays of positions"""
+        return RatioAnalysis._batch_divide(net_income, total_assets, 0.0)
+
+    @staticmethod
+    def return_on_equity_batch(net_income, shareholders_equity) -> np.ndarray:
+        """return_on_equity over arrays of positions"""
+        return RatioAnalysis._batch_divide(net_income, shareholders_equity, 0.0)
+
+    @staticmethod
+    def gross_margin_batch(revenue, cogs) -> np.ndarray:
+        """gross_margin over arrays of positions"""
+        revenue = np.asarray(revenue, dtype=np.float64)
+        profit = revenue - np.asarray(cogs, dtype=np.float64)
+        return RatioAnalysis._batch_divide(profit * 100, revenue, 0.0)
+
+    @staticmethod
+    def operating_margin_batch(operating_income, revenue) -> np.ndarray:
+        """operating_margin over arrays of positions"""
+        operating_income = np.asarray(operating_income, dtype=np.float64)
+        return RatioAnalysis._batch_divide(operating_income * 100, revenue, 0.0)
+
+    @staticmethod
+    def net_margin_batch(net_income, revenue) -> np.ndarray:
+        """net_margin over arrays of positions"""
+        net_income = np.asarray(net_income, dtype=np.float64)
+        return RatioAnalysis._batch_divide(net_income * 100, revenue, 0.0)
+
+    @staticmethod
+    def inventory_turnover_batch(cogs, average_inventory) -> np.ndarray:
+        """inventory_turnover over arrays of positions"""
+        return RatioAnalysis._batch_divide(cogs, average_inventory, 0.0)
+
+    @staticmethod
+    def days_sales_outstanding_batch(accounts_receivable, annual_sales) -> np.ndarray:
+        """days_sales_outstanding over arrays of positions"""
+        receivable = np.asarray(accounts_receivable, dtype=np.float64)
+        return RatioAnalysis._batch_divide(receivable * 365, annual_sales, 0.0)
+
+    @staticmethod
+    def asset_turnover_batch(revenue, average_total_assets) -> np.ndarray:
+        """asset_turnover over arrays of positions"""
+        return RatioAnalysis._batch_divide(revenue, average_total_assets, 0.0)
+
+    @staticmethod
+    def interest_coverage_batch(ebit, interest_expense) -> np.ndarray:
+        """interest_coverage over arrays of positions"""
+        return RatioAnalysis._batch_divide(ebit, interest_expense, float('inf'))
+
 
 if __name__ == "__main__":
     # Test calculations
@@ -1,8 +1,11 @@
+import json
+
 import pandas as pd
 import numpy as np
+from openpyxl.utils import get_column_letter
 from datetime import datetime, date, timedelta
 from dateutil.relativedelta import relativedelta
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, TypedDict, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -44,7 +47,27 @@ class AccountSubtype(Enum):
     ADMINISTRATIVE_EXPENSE = "Administrative Expense"
     SELLING_EXPENSE = "Selling Expense"
 
-@dataclass
+# Fixed orderings so account types and subtypes can live in the ledger
+# cache as small integer codes
+_ACCOUNT_TYPES = tuple(AccountType)
+_TYPE_INDEX = {account_type: i for i, account_type in enumerate(_ACCOUNT_TYPES)}
+_ACCOUNT_SUBTYPES = tuple(AccountSubtype)
+_SUBTYPE_INDEX = {subtype: i for i, subtype in enumerate(_ACCOUNT_SUBTYPES)}
+
+class LineItem(TypedDict):
+    """One account row in a statement section. Kept as a plain dict at
+    runtime so reports stay directly JSON-serializable; the TypedDict
+    documents the shape without per-item class overhead."""
+    account_number: str
+    account_name: str
+    amount: float
+
+# Categorical dtype for the trial balance's Account Type column: int8
+# codes plus one small category table instead of a string per row (the
+# empty string covers the TOTALS row)
+_ACCOUNT_TYPE_DTYPE = pd.CategoricalDtype([t.value for t in _ACCOUNT_TYPES] + [''])
+
+@dataclass(slots=True)
 class ChartOfAccount:
     account_number: str
     account_name: str
@@ -54,7 +77,7 @@ class ChartOfAccount:
     is_active: bool = True
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class JournalEntry:
     entry_id: str
     date: date
@@ -65,7 +88,7 @@ class JournalEntry:
     posted: bool = False
     created_by: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class TrialBalanceItem:
     account_number: str
     account_name: str
@@ -73,6 +96,48 @@ class TrialBalanceItem:
     debit_balance: float = 0
     credit_balance: float = 0
 
+# Standard chart of accounts, built once at import; every generator
+# shares these records (they are treated as immutable) instead of
+# reconstructing two dozen dataclass instances per instantiation
+_STANDARD_ACCOUNTS: Tuple[ChartOfAccount, ...] = (
+    # Assets
+    ChartOfAccount("1000", "Cash and Cash Equivalents", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
+    ChartOfAccount("1100", "Accounts Receivable", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
+    ChartOfAccount("1200", "Inventory", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
+    ChartOfAccount("1300", "Prepaid Expenses", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
+    ChartOfAccount("1500", "Property, Plant & Equipment", AccountType.ASSET, AccountSubtype.FIXED_ASSET),
+    ChartOfAccount("1600", "Accumulated Depreciation", AccountType.ASSET, AccountSubtype.FIXED_ASSET),
+
+    # Liabilities
+    ChartOfAccount("2000", "Accounts Payable", AccountType.LIABILITY, AccountSubtype.CURRENT_LIABILITY),
+    ChartOfAccount("2100", "Accrued Liabilities", AccountType.LIABILITY, AccountSubtype.CURRENT_LIABILITY),
+    ChartOfAccount("2200", "Short-term Debt", AccountType.LIABILITY, AccountSubtype.CURRENT_LIABILITY),
+    ChartOfAccount("2500", "Long-term Debt", AccountType.LIABILITY, AccountSubtype.LONG_TERM_LIABILITY),
+
+    # Equity
+    ChartOfAccount("3000", "Owner's Equity", AccountType.EQUITY, AccountSubtype.CONTRIBUTED_CAPITAL),
+    ChartOfAccount("3500", "Retained Earnings", AccountType.EQUITY, AccountSubtype.RETAINED_EARNINGS),
+
+    # Revenue
+    ChartOfAccount("4000", "Sales Revenue", AccountType.REVENUE, AccountSubtype.OPERATING_REVENUE),
+    ChartOfAccount("4100", "Rental Revenue", AccountType.REVENUE, AccountSubtype.OPERATING_REVENUE),
+    ChartOfAccount("4900", "Other Income", AccountType.REVENUE, AccountSubtype.OTHER_REVENUE),
+
+    # COGS
+    ChartOfAccount("5000", "Cost of Goods Sold", AccountType.COGS, AccountSubtype.OPERATING_EXPENSE),
+
+    # Expenses
+    ChartOfAccount("6000", "Salaries & Wages", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
+    ChartOfAccount("6100", "Rent Expense", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
+    ChartOfAccount("6200", "Utilities", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
+    ChartOfAccount("6300", "Insurance", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
+    ChartOfAccount("6400", "Professional Fees", AccountType.EXPENSE, AccountSubtype.ADMINISTRATIVE_EXPENSE),
+    ChartOfAccount("6500", "Marketing & Advertising", AccountType.EXPENSE, AccountSubtype.SELLING_EXPENSE),
+    ChartOfAccount("6600", "Depreciation Expense", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
+    ChartOfAccount("6700", "Interest Expense", AccountType.EXPENSE, AccountSubtype.ADMINISTRATIVE_EXPENSE),
+)
+
+
 class FinancialReportGenerator:
     """Generate comprehensive financial reports"""
     
@@ -80,131 +145,211 @@ class FinancialReportGenerator:
         self.chart_of_accounts: Dict[str, ChartOfAccount] = {}
         self.journal_entries: List[JournalEntry] = []
         self.account_balances: Dict[str, float] = {}
-        
+
+        # Flattened ledger columns (structure-of-arrays), rebuilt
+        # lazily so every report shares one C-level pass over the
+        # posted journal lines instead of re-walking the entry objects
+        self._ledger_dirty = True
+        self._ledger_count = 0
+        self._acct_to_idx: Dict[str, int] = {}
+        self._idx_to_acct: List[str] = []
+        self._acct_list: List[Optional[ChartOfAccount]] = []
+        self._ledger_dates = np.empty(0, dtype='datetime64[D]')
+        self._ledger_accts = np.empty(0, dtype=np.intp)
+        self._ledger_amounts = np.empty(0, dtype=np.float64)
+        self._acct_type_idx = np.empty(0, dtype=np.int8)
+        self._acct_subtype_idx = np.empty(0, dtype=np.int8)
+        self._ledger_version = 0
+        self._pnl_cache: Dict[Tuple[date, date], Dict] = {}
+        self._balance_sheet_cache: Dict[date, Dict] = {}
+        self._accounts_by_type: Dict[AccountType, np.ndarray] = {}
+        self._accounts_by_subtype: Dict[AccountSubtype, np.ndarray] = {}
+
         # Initialize standard chart of accounts
         self._initialize_standard_accounts()
+
+    def add_journal_entry(self, entry: JournalEntry) -> None:
+        """Record a journal entry and invalidate the ledger cache"""
+        self.journal_entries.append(entry)
+        self._ledger_dirty = True
+
+    def _sync_ledger(self) -> None:
+        """Rebuild the flattened ledger if entries were added.
+
+        Appends through add_journal_entry (or directly to
+        journal_entries) are picked up automatically; in-place edits to
+        an existing entry need _ledger_dirty set by hand."""
+        if self._ledger_dirty or len(self.journal_entries) != self._ledger_count:
+            self._rebuild_ledger()
+
+    def _rebuild_ledger(self) -> None:
+        """Flatten posted entries into parallel date/account/amount
+        columns, with credits stored as negative amounts"""
+        acct_to_idx = {number: i for i, number in enumerate(self.chart_of_accounts)}
+        entry_dates: List[date] = []
+        line_counts: List[int] = []
+        accts: List[int] = []
+        amounts: List[float] = []
+        lookup = acct_to_idx.get
+        accts_append = accts.append
+        amounts_append = amounts.append
+
+        # Dates are recorded once per entry with a line count, then
+        # expanded with one np.repeat, so the per-line work is just the
+        # account index lookup and the signed amount
+        for entry in self.journal_entries:
+            if not entry.posted:
+                continue
+            before = len(accts)
+            for account_number, amount in entry.debits or ():
+                idx = lookup(account_number)
+                if idx is None:
+                    idx = acct_to_idx[account_number] = len(acct_to_idx)
+                accts_append(idx)
+                amounts_append(amount)
+            for account_number, amount in entry.credits or ():
+                idx = lookup(account_number)
+                if idx is None:
+                    idx = acct_to_idx[account_number] = len(acct_to_idx)
+                accts_append(idx)
+                amounts_append(-amount)
+            entry_dates.append(entry.date)
+            line_counts.append(len(accts) - before)
+
+        self._acct_to_idx = acct_to_idx
+        self._idx_to_acct = list(acct_to_idx)
+        # Chart records aligned to the same indexes (None for numbers
+        # posted against but missing from the chart), so the display
+        # layer resolves names without re-hashing account strings
+        self._acct_list = [self.chart_of_accounts.get(number) for number in self._idx_to_acct]
+        self._ledger_dates = np.repeat(np.array(entry_dates, dtype='datetime64[D]'), line_counts)
+        self._ledger_accts = np.asarray(accts, dtype=np.intp)
+        self._ledger_amounts = np.asarray(amounts, dtype=np.float64)
+
+        # Keep the columns date-sorted so period reports slice a
+        # contiguous window with two binary searches
+        order = np.argsort(self._ledger_dates, kind='stable')
+        self._ledger_dates = self._ledger_dates[order]
+        self._ledger_accts = self._ledger_accts[order]
+        self._ledger_amounts = self._ledger_amounts[order]
+
+        # Account type and subtype as int8 codes per ledger account
+        # index; -1 marks numbers not in the chart of accounts
+        type_codes = np.full(len(acct_to_idx), -1, dtype=np.int8)
+        subtype_codes = np.full(len(acct_to_idx), -1, dtype=np.int8)
+        for number, i in acct_to_idx.items():
+            account = self.chart_of_accounts.get(number)
+            if account is not None:
+                type_codes[i] = _TYPE_INDEX[account.account_type]
+                subtype_codes[i] = _SUBTYPE_INDEX[account.account_subtype]
+        self._acct_type_idx = type_codes
+        self._acct_subtype_idx = subtype_codes
+
+        # Account indexes grouped by type and subtype, so report
+        # sections pull their accounts with one advanced-indexing op
+        # instead of re-scanning the chart per call
+        self._accounts_by_type = {
+            account_type: np.flatnonzero(type_codes == code)
+            for account_type, code in _TYPE_INDEX.items()
+        }
+        self._accounts_by_subtype = {
+            subtype: np.flatnonzero(subtype_codes == code)
+            for subtype, code in _SUBTYPE_INDEX.items()
+        }
+
+        self._ledger_dirty = False
+        self._ledger_count = len(self.journal_entries)
+        self._ledger_version += 1
+        self._pnl_cache.clear()
+        self._balance_sheet_cache.clear()
+
+    def _slice_range(self, start_date: date, end_date: date) -> slice:
+        """Contiguous ledger slice covering [start_date, end_date]"""
+        lo = int(np.searchsorted(self._ledger_dates, np.datetime64(start_date, 'D'), side='left'))
+        hi = int(np.searchsorted(self._ledger_dates, np.datetime64(end_date, 'D'), side='right'))
+        return slice(lo, hi)
+
+    def map_account(self, account_number: str) -> int:
+        """Dense integer index for an account number, as used by the
+        ledger cache arrays"""
+        self._sync_ledger()
+        return self._acct_to_idx[account_number]
     
     def _initialize_standard_accounts(self):
         """Set up standard chart of accounts"""
-        standard_accounts = [
-            # Assets
-            ChartOfAccount("1000", "Cash and Cash Equivalents", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
-            ChartOfAccount("1100", "Accounts Receivable", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
-            ChartOfAccount("1200", "Inventory", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
-            ChartOfAccount("1300", "Prepaid Expenses", AccountType.ASSET, AccountSubtype.CURRENT_ASSET),
-            ChartOfAccount("1500", "Property, Plant & Equipment", AccountType.ASSET, AccountSubtype.FIXED_ASSET),
-            ChartOfAccount("1600", "Accumulated Depreciation", AccountType.ASSET, AccountSubtype.FIXED_ASSET),
-            
-            # Liabilities
-            ChartOfAccount("2000", "Accounts Payable", AccountType.LIABILITY, AccountSubtype.CURRENT_LIABILITY),
-            ChartOfAccount("2100", "Accrued Liabilities", AccountType.LIABILITY, AccountSubtype.CURRENT_LIABILITY),
-            ChartOfAccount("2200", "Short-term Debt", AccountType.LIABILITY, AccountSubtype.CURRENT_LIABILITY),
-            ChartOfAccount("2500", "Long-term Debt", AccountType.LIABILITY, AccountSubtype.LONG_TERM_LIABILITY),
-            
-            # Equity
-            ChartOfAccount("3000", "Owner's Equity", AccountType.EQUITY, AccountSubtype.CONTRIBUTED_CAPITAL),
-            ChartOfAccount("3500", "Retained Earnings", AccountType.EQUITY, AccountSubtype.RETAINED_EARNINGS),
-            
-            # Revenue
-            ChartOfAccount("4000", "Sales Revenue", AccountType.REVENUE, AccountSubtype.OPERATING_REVENUE),
-            ChartOfAccount("4100", "Rental Revenue", AccountType.REVENUE, AccountSubtype.OPERATING_REVENUE),
-            ChartOfAccount("4900", "Other Income", AccountType.REVENUE, AccountSubtype.OTHER_REVENUE),
-            
-            # COGS
-            ChartOfAccount("5000", "Cost of Goods Sold", AccountType.COGS, AccountSubtype.OPERATING_EXPENSE),
-            
-            # Expenses
-            ChartOfAccount("6000", "Salaries & Wages", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
-            ChartOfAccount("6100", "Rent Expense", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
-            ChartOfAccount("6200", "Utilities", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
-            ChartOfAccount("6300", "Insurance", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
-            ChartOfAccount("6400", "Professional Fees", AccountType.EXPENSE, AccountSubtype.ADMINISTRATIVE_EXPENSE),
-            ChartOfAccount("6500", "Marketing & Advertising", AccountType.EXPENSE, AccountSubtype.SELLING_EXPENSE),
-            ChartOfAccount("6600", "Depreciation Expense", AccountType.EXPENSE, AccountSubtype.OPERATING_EXPENSE),
-            ChartOfAccount("6700", "Interest Expense", AccountType.EXPENSE, AccountSubtype.ADMINISTRATIVE_EXPENSE),
-        ]
-        
-        for account in standard_accounts:
-            self.chart_of_accounts[account.account_number] = account
+        self.chart_of_accounts = {account.account_number: account
+                                  for account in _STANDARD_ACCOUNTS}
     
     def generate_income_statement(self, start_date: date, end_date: date) -> Dict:
-        """Generate Income Statement (P&L)"""
-        # Get relevant journal entries for the period
-        period_entries = [
-            entry for entry in self.journal_entries
-            if entry.posted and start_date <= entry.date <= end_date
-        ]
-        
-        # Calculate account balances for revenue and expense accounts
-        account_totals = {}
-        
-        for entry in period_entries:
-            if entry.debits:
-                for account_number, amount in entry.debits:
-                    account = self.chart_of_accounts.get(account_number)
-                    if account and account.account_type in [AccountType.REVENUE, AccountType.EXPENSE, AccountType.COGS]:
-                        if account_number not in account_totals:
-                            account_totals[account_number] = 0
-                        # Debits decrease revenue, increase expenses
-                        if account.account_type == AccountType.REVENUE:
-                            account_totals[account_number] -= amount
-                        else:
-                            account_totals[account_number] += amount
-            
-            if entry.credits:
-                for account_number, amount in entry.credits:
-                    account = self.chart_of_accounts.get(account_number)
-                    if account and account.account_type in [AccountType.REVENUE, AccountType.EXPENSE, AccountType.COGS]:
-                        if account_number not in account_totals:
-                            account_totals[account_number] = 0
-                        # Credits increase revenue, decrease expenses
-                        if account.account_type == AccountType.REVENUE:
-                            account_totals[account_number] += amount
-                        else:
-                            account_totals[account_number] -= amount
-        
+        """Generate Income Statement (P&L).
+
+        Results are memoized per period until the ledger changes, so
+        dashboards re-requesting the same window (and the comparative
+        statement's overlapping calls) pay for one computation."""
+        self._sync_ledger()
+        cached = self._pnl_cache.get((start_date, end_date))
+        if cached is not None:
+            return cached
+
+        period = self._slice_range(start_date, end_date)
+        accts = self._ledger_accts[period]
+
+        # Net movement per account over the window in one weighted
+        # bincount; debits are stored positive so revenue (which grows
+        # on the credit side) flips sign
+        n_accounts = len(self._idx_to_acct)
+        signed = np.bincount(accts, weights=self._ledger_amounts[period], minlength=n_accounts)
+        touched = np.bincount(accts, minlength=n_accounts) > 0
+
+        type_codes = self._acct_type_idx
+        revenue_code = _TYPE_INDEX[AccountType.REVENUE]
+        cogs_code = _TYPE_INDEX[AccountType.COGS]
+        expense_code = _TYPE_INDEX[AccountType.EXPENSE]
+        totals = np.where(type_codes == revenue_code, -signed, signed)
+        # Round every account total once, vectorized, rather than per
+        # line item while building the sections
+        rounded = np.round(totals, 2)
+
         # Organize by statement sections
-        revenue_accounts = []
-        cogs_accounts = []
-        expense_accounts = []
-        
-        for account_number, balance in account_totals.items():
-            account = self.chart_of_accounts.get(account_number)
-            if not account:
+        revenue_accounts: List[LineItem] = []
+        cogs_accounts: List[LineItem] = []
+        expense_accounts: List[LineItem] = []
+        account_totals = {}
+
+        for i in np.flatnonzero(touched):
+            code = type_codes[i]
+            if code == revenue_code:
+                bucket = revenue_accounts
+            elif code == cogs_code:
+                bucket = cogs_accounts
+            elif code == expense_code:
+                bucket = expense_accounts
+            else:
                 continue
-            
-            item = {
+
+            account_number = self._idx_to_acct[i]
+            account_totals[account_number] = float(totals[i])
+            bucket.append({
                 'account_number': account_number,
-                'account_name': account.account_name,
-                'amount': round(balance, 2)
-            }
-            
-            if account.account_type == AccountType.REVENUE:
-                revenue_accounts.append(item)
-            elif account.account_type == AccountType.COGS:
-                cogs_accounts.append(item)
-            elif account.account_type == AccountType.EXPENSE:
-                expense_accounts.append(item)
+                'account_name': self._acct_list[i].account_name,
+                'amount': float(rounded[i])
+            })
         
         # Calculate totals
         total_revenue = sum(item['amount'] for item in revenue_accounts)
         total_cogs = sum(item['amount'] for item in cogs_accounts)
         gross_profit = total_revenue - total_cogs
         
-        total_operating_expenses = sum(
-            item['amount'] for item in expense_accounts 
-            if self.chart_of_accounts[item['account_number']].account_subtype == AccountSubtype.OPERATING_EXPENSE
-        )
-        
-        total_admin_expenses = sum(
-            item['amount'] for item in expense_accounts 
-            if self.chart_of_accounts[item['account_number']].account_subtype == AccountSubtype.ADMINISTRATIVE_EXPENSE
-        )
-        
-        total_selling_expenses = sum(
-            item['amount'] for item in expense_accounts 
-            if self.chart_of_accounts[item['account_number']].account_subtype == AccountSubtype.SELLING_EXPENSE
-        )
+        # All three expense subtotals from a single bincount over the
+        # subtype codes, weighted by the rounded per-account amounts
+        # the line items carry
+        expense_mask = touched & (type_codes == expense_code)
+        subtype_sums = np.bincount(self._acct_subtype_idx[expense_mask],
+                                   weights=rounded[expense_mask],
+                                   minlength=len(_ACCOUNT_SUBTYPES))
+        total_operating_expenses = float(subtype_sums[_SUBTYPE_INDEX[AccountSubtype.OPERATING_EXPENSE]])
+        total_admin_expenses = float(subtype_sums[_SUBTYPE_INDEX[AccountSubtype.ADMINISTRATIVE_EXPENSE]])
+        total_selling_expenses = float(subtype_sums[_SUBTYPE_INDEX[AccountSubtype.SELLING_EXPENSE]])
         
         operating_income = gross_profit - total_operating_expenses - total_admin_expenses - total_selling_expenses
         
@@ -214,7 +359,7 @@ class FinancialReportGenerator:
         
         net_income = operating_income - interest_expense + other_income
         
-        return {
+        result = {
             'statement_type': 'Income Statement',
             'period': f"{start_date} to {end_date}",
             'revenue': {
@@ -242,55 +387,60 @@ class FinancialReportGenerator:
             'net_income': round(net_income, 2),
             'net_margin_pct': round(net_income / total_revenue * 100, 2) if total_revenue > 0 else 0
         }
-    
+        self._pnl_cache[(start_date, end_date)] = result
+        return result
+
     def generate_balance_sheet(self, as_of_date: date) -> Dict:
-        """Generate Balance Sheet"""
-        # Calculate account balances as of date
-        account_balances = self._calculate_account_balances(as_of_date)
-        
-        # Organize by balance sheet sections
-        current_assets = []
-        fixed_assets = []
-        current_liabilities = []
-        long_term_liabilities = []
-        equity_accounts = []
-        
-        for account_number, balance in account_balances.items():
-            account = self.chart_of_accounts.get(account_number)
-            if not account or balance == 0:
-                continue
-            
-            item = {
-                'account_number': account_number,
-                'account_name': account.account_name,
-                'amount': round(balance, 2)
-            }
-            
-            if account.account_type == AccountType.ASSET:
-                if account.account_subtype == AccountSubtype.CURRENT_ASSET:
-                    current_assets.append(item)
-                else:
-                    fixed_assets.append(item)
-            elif account.account_type == AccountType.LIABILITY:
-                if account.account_subtype == AccountSubtype.CURRENT_LIABILITY:
-                    current_liabilities.append(item)
-                else:
-                    long_term_liabilities.append(item)
-            elif account.account_type == AccountType.EQUITY:
-                equity_accounts.append(item)
-        
-        # Calculate totals
-        total_current_assets = sum(item['amount'] for item in current_assets)
-        total_fixed_assets = sum(item['amount'] for item in fixed_assets)
+        """Generate Balance Sheet.
+
+        Memoized per as-of date until the ledger changes, mirroring
+        the income statement cache; financial_ratios_analysis then
+        gets both of its statements without a second ledger scan."""
+        self._sync_ledger()
+        cached = self._balance_sheet_cache.get(as_of_date)
+        if cached is not None:
+            return cached
+
+        mask = self._ledger_dates <= np.datetime64(as_of_date, 'D')
+        balances = np.bincount(self._ledger_accts[mask],
+                               weights=self._ledger_amounts[mask],
+                               minlength=len(self._idx_to_acct))
+
+        rounded = np.round(balances, 2)
+
+        def section(idx: np.ndarray) -> Tuple[List[LineItem], float]:
+            """Line items and total for the nonzero accounts of one
+            section, in a single sweep over the section's indexes"""
+            nonzero = idx[balances[idx] != 0]
+            items = [
+                {
+                    'account_number': self._idx_to_acct[i],
+                    'account_name': self._acct_list[i].account_name,
+                    'amount': float(rounded[i])
+                }
+                for i in nonzero
+            ]
+            return items, float(rounded[nonzero].sum())
+
+        # Each section is one advanced-indexing pull from the grouped
+        # account indexes; assets/liabilities split on the current
+        # subtype like the old per-account branches
+        subtype_codes = self._acct_subtype_idx
+        asset_idx = self._accounts_by_type[AccountType.ASSET]
+        is_current_asset = subtype_codes[asset_idx] == _SUBTYPE_INDEX[AccountSubtype.CURRENT_ASSET]
+        liability_idx = self._accounts_by_type[AccountType.LIABILITY]
+        is_current_liability = subtype_codes[liability_idx] == _SUBTYPE_INDEX[AccountSubtype.CURRENT_LIABILITY]
+
+        current_assets, total_current_assets = section(asset_idx[is_current_asset])
+        fixed_assets, total_fixed_assets = section(asset_idx[~is_current_asset])
+        current_liabilities, total_current_liabilities = section(liability_idx[is_current_liability])
+        long_term_liabilities, total_long_term_liabilities = section(liability_idx[~is_current_liability])
+        equity_accounts, total_equity = section(self._accounts_by_type[AccountType.EQUITY])
+
         total_assets = total_current_assets + total_fixed_assets
-        
-        total_current_liabilities = sum(item['amount'] for item in current_liabilities)
-        total_long_term_liabilities = sum(item['amount'] for item in long_term_liabilities)
         total_liabilities = total_current_liabilities + total_long_term_liabilities
         
-        total_equity = sum(item['amount'] for item in equity_accounts)
-        
-        return {
+        result = {
             'statement_type': 'Balance Sheet',
             'as_of_date': as_of_date.isoformat(),
             'assets': {
@@ -322,80 +472,71 @@ class FinancialReportGenerator:
             'total_liabilities_and_equity': round(total_liabilities + total_equity, 2),
             'balanced': abs(total_assets - (total_liabilities + total_equity)) < 0.01
         }
+        self._balance_sheet_cache[as_of_date] = result
+        return result
     
     def _calculate_account_balances(self, as_of_date: date) -> Dict[str, float]:
         """Calculate account balances as of a specific date"""
-        balances = {}
-        
-        # Initialize all accounts with zero balance
-        for account_number in self.chart_of_accounts.keys():
-            balances[account_number] = 0
-        
-        # Process journal entries up to the date
-        for entry in self.journal_entries:
-            if not entry.posted or entry.date > as_of_date:
-                continue
-            
-            if entry.debits:
-                for account_number, amount in entry.debits:
-                    if account_number not in balances:
-                        balances[account_number] = 0
-                    balances[account_number] += amount
-            
-            if entry.credits:
-                for account_number, amount in entry.credits:
-                    if account_number not in balances:
-                        balances[account_number] = 0
-                    balances[account_number] -= amount
-        
-        return balances
+        self._sync_ledger()
+
+        # One weighted bincount over the in-range ledger lines replaces
+        # the per-entry Python traversal; zero initialization of every
+        # account comes free from minlength
+        mask = self._ledger_dates <= np.datetime64(as_of_date, 'D')
+        totals = np.bincount(self._ledger_accts[mask],
+                             weights=self._ledger_amounts[mask],
+                             minlength=len(self._idx_to_acct))
+
+        return {number: float(totals[i]) for number, i in self._acct_to_idx.items()}
     
     def generate_trial_balance(self, as_of_date: date) -> pd.DataFrame:
         """Generate trial balance"""
-        account_balances = self._calculate_account_balances(as_of_date)
-        
-        trial_balance_items = []
-        total_debits = 0
-        total_credits = 0
-        
-        for account_number, balance in account_balances.items():
-            account = self.chart_of_accounts.get(account_number)
-            if not account or balance == 0:
-                continue
-            
-            # Determine normal balance based on account type
-            normal_debit_accounts = [AccountType.ASSET, AccountType.EXPENSE, AccountType.COGS]
-            
-            if account.account_type in normal_debit_accounts:
-                debit_balance = max(0, balance)
-                credit_balance = max(0, -balance)
-            else:
-                debit_balance = max(0, -balance)
-                credit_balance = max(0, balance)
-            
-            trial_balance_items.append({
-                'Account Number': account_number,
-                'Account Name': account.account_name,
-                'Account Type': account.account_type.value,
-                'Debit': round(debit_balance, 2) if debit_balance > 0 else None,
-                'Credit': round(credit_balance, 2) if credit_balance > 0 else None
-            })
-            
-            total_debits += debit_balance
-            total_credits += credit_balance
-        
-        # Add totals row
-        trial_balance_items.append({
-            'Account Number': '',
-            'Account Name': 'TOTALS',
-            'Account Type': '',
-            'Debit': round(total_debits, 2),
-            'Credit': round(total_credits, 2)
+        self._sync_ledger()
+        mask = self._ledger_dates <= np.datetime64(as_of_date, 'D')
+        balances = np.bincount(self._ledger_accts[mask],
+                               weights=self._ledger_amounts[mask],
+                               minlength=len(self._idx_to_acct))
+
+        # Normal-balance side and the debit/credit split for every
+        # account in one vectorized pass over the type codes
+        type_codes = self._acct_type_idx
+        debit_normal = ((type_codes == _TYPE_INDEX[AccountType.ASSET]) |
+                        (type_codes == _TYPE_INDEX[AccountType.EXPENSE]) |
+                        (type_codes == _TYPE_INDEX[AccountType.COGS]))
+        debit_col = np.where(debit_normal, np.maximum(balances, 0), np.maximum(-balances, 0))
+        credit_col = np.where(debit_normal, np.maximum(-balances, 0), np.maximum(balances, 0))
+
+        # Accounts missing from the chart (type code -1) and zero
+        # balances are excluded, matching the old per-row skips
+        active = (type_codes >= 0) & (balances != 0)
+        total_debits = float(debit_col[active].sum())
+        total_credits = float(credit_col[active].sum())
+
+        # Assemble column arrays directly (with a trailing TOTALS row)
+        # so pandas wraps them as blocks instead of type-inferring a
+        # list of per-row dicts; NaN stands in for the old None and
+        # keeps Debit/Credit float64
+        idx = np.flatnonzero(active)
+        debit_active = debit_col[idx]
+        credit_active = credit_col[idx]
+        debit_vals = np.concatenate((
+            np.where(debit_active > 0, np.round(debit_active, 2), np.nan),
+            [round(total_debits, 2)]))
+        credit_vals = np.concatenate((
+            np.where(credit_active > 0, np.round(credit_active, 2), np.nan),
+            [round(total_credits, 2)]))
+
+        df = pd.DataFrame({
+            'Account Number': np.array([self._idx_to_acct[i] for i in idx] + [''], dtype=object),
+            'Account Name': np.array([self._acct_list[i].account_name for i in idx] + ['TOTALS'], dtype=object),
+            'Account Type': pd.Categorical.from_codes(
+                np.concatenate((type_codes[idx], [len(_ACCOUNT_TYPES)])).astype(np.int8),
+                dtype=_ACCOUNT_TYPE_DTYPE),
+            'Debit': debit_vals,
+            'Credit': credit_vals
         })
-        
-        df = pd.DataFrame(trial_balance_items)
         df['Balanced'] = abs(total_debits - total_credits) < 0.01
-        
+
         return df
     
     def comparative_income_statement(self, periods: List[Tuple[date, date]]) -> pd.DataFrame:
@@ -423,20 +564,15 @@ class FinancialReportGenerator:
         
         df = pd.DataFrame(statements)
         
-        # Add variance columns if we have multiple periods
+        # Add variance columns if we have multiple periods; one
+        # diff/shift per column replaces the per-cell iloc loop, with
+        # zero-base periods masked to NaN like before
         if len(statements) > 1:
-            for i in range(1, len(statements)):
-                period_name = df.iloc[i]['Period']
-                prev_period_name = df.iloc[i-1]['Period']
-                
-                for col in ['Total Revenue', 'Gross Profit', 'Operating Income', 'Net Income']:
-                    current_value = df.iloc[i][col]
-                    previous_value = df.iloc[i-1][col]
-                    
-                    if previous_value != 0:
-                        variance_pct = ((current_value - previous_value) / abs(previous_value)) * 100
-                        df.loc[i, f'{col} Variance %'] = round(variance_pct, 2)
-        
+            for col in ['Total Revenue', 'Gross Profit', 'Operating Income', 'Net Income']:
+                previous = df[col].shift()
+                variance = (df[col].diff() / previous.abs() * 100).round(2)
+                df[f'{col} Variance %'] = variance.mask(previous == 0)
+
         return df
     
     def aged_receivables_report(self, as_of_date: date) -> pd.DataFrame:
@@ -517,6 +653,13 @@ class FinancialReportGenerator:
             }
         }
 
+# Formula templates for the budget sheet, parsed once instead of being
+# re-built as f-strings per row
+_BUDGET_YTD_FMT = '=B{r}/12*MONTH(TODAY())'
+_BUDGET_VARIANCE_FMT = '=D{r}-C{r}'
+_BUDGET_VARIANCE_PCT_FMT = '=IF(C{r}=0,0,E{r}/C{r}*100)'
+
+
 class ReportTemplates:
     """Pre-built report templates for common financial statements"""
     
@@ -551,31 +694,40 @@ class ReportTemplates:
             ['Cap Rate % (if known)', '', '', property_data.get('cap_rate', 0)],
         ]
         
-        return pd.DataFrame(template_data, columns=['Item', 'Description', 'Notes', 'Amount'])
+        # Mixed labels, numbers and formula strings end up object
+        # dtype regardless, so hand pandas a ready object array and
+        # skip the per-cell type inference
+        return pd.DataFrame(np.array(template_data, dtype=object),
+                            columns=['Item', 'Description', 'Notes', 'Amount'])
     
     @staticmethod
     def create_cash_flow_template(months: int = 12) -> pd.DataFrame:
         """Create cash flow projection template"""
         headers = ['Category'] + [f'Month {i+1}' for i in range(months)] + ['Total']
-        
+
+        # Last data column computed once; the old template hardcoded
+        # column M, which was only right for twelve months
+        last_col = get_column_letter(months + 1)
+        row_total = f'=SUM(B{{r}}:{last_col}{{r}})'.format
+
         template_data = [
             ['CASH INFLOWS'] + [''] * (months + 1),
-            ['Revenue'] + [0] * months + ['=SUM(B2:' + f'M2)'],
-            ['Other Income'] + [0] * months + ['=SUM(B3:' + f'M3)'],
+            ['Revenue'] + [0] * months + [row_total(r=2)],
+            ['Other Income'] + [0] * months + [row_total(r=3)],
             ['Total Inflows'] + [''] * months + ['=SUM(B2:B3)'],
             [''] + [''] * (months + 1),
             ['CASH OUTFLOWS'] + [''] * (months + 1),
-            ['Operating Expenses'] + [0] * months + ['=SUM(B6:' + f'M6)'],
-            ['Capital Expenditures'] + [0] * months + ['=SUM(B7:' + f'M7)'],
-            ['Debt Service'] + [0] * months + ['=SUM(B8:' + f'M8)'],
+            ['Operating Expenses'] + [0] * months + [row_total(r=6)],
+            ['Capital Expenditures'] + [0] * months + [row_total(r=7)],
+            ['Debt Service'] + [0] * months + [row_total(r=8)],
             ['Total Outflows'] + [''] * months + ['=SUM(B6:B8)'],
             [''] + [''] * (months + 1),
             ['NET CASH FLOW'] + [''] * months + ['=B4-B10'],
-            ['Beginning Balance'] + [0] + [''] * months + [''],
+            ['Beginning Balance'] + [0] + [''] * (months - 1) + [''],
             ['Ending Balance'] + [''] * months + ['=B12+B11']
         ]
-        
-        df = pd.DataFrame(template_data, columns=headers)
+
+        df = pd.DataFrame(np.array(template_data, dtype=object), columns=headers)
         return df
     
     @staticmethod
@@ -586,18 +738,24 @@ class ReportTemplates:
         # Headers
         template_data.append(['Category', 'Annual Budget', 'YTD Budget', 'YTD Actual', 'Variance', 'Variance %'])
         
-        # Revenue section
+        # Revenue section; each data row fills the shared formula
+        # templates with its own spreadsheet row number (the old code
+        # left the {} placeholders unformatted)
         template_data.append(['REVENUE', '', '', '', '', ''])
         for cat in ['Sales Revenue', 'Service Revenue', 'Other Revenue']:
-            template_data.append([cat, 0, '=B{}/12*MONTH(TODAY())', 0, '=D{}-C{}', '=IF(C{}=0,0,E{}/C{}*100)'])
+            r = len(template_data) + 1
+            template_data.append([cat, 0, _BUDGET_YTD_FMT.format(r=r), 0,
+                                  _BUDGET_VARIANCE_FMT.format(r=r), _BUDGET_VARIANCE_PCT_FMT.format(r=r)])
         template_data.append(['Total Revenue', '=SUM(B3:B5)', '=SUM(C3:C5)', '=SUM(D3:D5)', '=D6-C6', '=IF(C6=0,0,E6/C6*100)'])
-        
+
         # Expense section
         template_data.append(['', '', '', '', '', ''])
         template_data.append(['EXPENSES', '', '', '', '', ''])
-        
+
         for category in categories:
-            template_data.append([category, 0, '=B{}/12*MONTH(TODAY())', 0, '=D{}-C{}', '=IF(C{}=0,0,E{}/C{}*100)'])
+            r = len(template_data) + 1
+            template_data.append([category, 0, _BUDGET_YTD_FMT.format(r=r), 0,
+                                  _BUDGET_VARIANCE_FMT.format(r=r), _BUDGET_VARIANCE_PCT_FMT.format(r=r)])
         
         next_row = len(template_data) + 1
         template_data.append(['Total Expenses', f'=SUM(B9:B{next_row-1})', f'=SUM(C9:C{next_row-1})', 
@@ -608,7 +766,7 @@ class ReportTemplates:
         template_data.append(['NET INCOME', f'=B6-B{next_row}', f'=C6-C{next_row}', f'=D6-D{next_row}', 
                              f'=D{next_row+2}-C{next_row+2}', f'=IF(C{next_row+2}=0,0,E{next_row+2}/C{next_row+2}*100)'])
         
-        return pd.DataFrame(template_data)
+        return pd.DataFrame(np.array(template_data, dtype=object))
 
 if __name__ == "__main__":
     # Test financial reporting
@@ -5,6 +5,42 @@ from dateutil.relativedelta import relativedelta
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from collections import namedtuple
+
+_PeriodScan = namedtuple('_PeriodScan', ['rental_income', 'other_income', 'vacancy'])
+
+_FREQ_CODES = {"annually": 0, "semi-annually": 1}
+_EPOCH_ORD = date(1970, 1, 1).toordinal()
+
+
+def _month_number(day_ord) -> np.ndarray:
+    """Months since the epoch for integer date ordinals."""
+    return (np.asarray(day_ord, dtype=np.int64) - _EPOCH_ORD) \
+        .astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+
+
+def _current_rent_vec(base, start_ord, rate, freq_code, as_of_ord) -> np.ndarray:
+    """Escalated rent for arrays of leases and/or dates in one shot.
+
+    Broadcasts over any mix of scalar and array arguments; freq_code is 0
+    for annual escalation, 1 for semi-annual, -1 for unrecognized (no
+    escalation, mirroring calculate_current_rent).
+    """
+    rate = np.asarray(rate, dtype=np.float64)
+    freq_code = np.asarray(freq_code)
+    months = _month_number(as_of_ord) - _month_number(start_ord)
+    shape = np.broadcast_shapes(np.shape(base), rate.shape, freq_code.shape, months.shape)
+    out = np.broadcast_to(np.asarray(base, dtype=np.float64), shape).copy()
+
+    # Most leases are flat; only run the power for rows that escalate.
+    escalating = np.broadcast_to((rate != 0) & (freq_code >= 0), shape)
+    if escalating.any():
+        period = np.where(freq_code == 1, 6, 12)
+        periods = np.broadcast_to(months // period, shape)[escalating]
+        out[escalating] *= np.power(
+            1.0 + np.broadcast_to(rate, shape)[escalating], periods)
+    return out
+
 
 class LeaseStatus(Enum):
     ACTIVE = "active"
@@ -13,6 +49,10 @@ class LeaseStatus(Enum):
     TERMINATED = "terminated"
     MONTH_TO_MONTH = "month_to_month"
 
+_ACTIVE = LeaseStatus.ACTIVE
+_STATUS_CODES = {status: code for code, status in enumerate(LeaseStatus)}
+_ACTIVE_CODE = _STATUS_CODES[_ACTIVE]
+
 @dataclass
 class Tenant:
     tenant_id: str
@@ -35,6 +75,12 @@ class Lease:
     rent_escalation_frequency: str = "annually"
     additional_charges: Dict[str, float] = None
 
+    def __post_init__(self):
+        # Cached ordinals let hot paths compare ints instead of date objects;
+        # re-run __post_init__ if the dates are edited in place.
+        self._start_ord = self.start_date.toordinal()
+        self._end_ord = self.end_date.toordinal()
+
 @dataclass
 class Unit:
     unit_id: str
@@ -67,110 +113,299 @@ class RentalPropertyManager:
         self.tenants: Dict[str, Tenant] = {}
         self.payments: List[Dict] = []
         self.maintenance_requests: List[Dict] = []
-    
+        self._index_dirty = True
+        self._indexed_units = 0
+        self._indexed_leases = 0
+        self._units_by_property: Dict[str, List[Unit]] = {}
+        self._leases_by_unit: Dict[str, List[Lease]] = {}
+        # Columnar mirror of the lease dict (one row per lease) so the hot
+        # paths can filter and price with numpy instead of attribute walks.
+        self._lease_list: List[Lease] = []
+        self._lease_rows_by_unit: Dict[str, List[int]] = {}
+        self._lease_start_ord = np.empty(0, dtype=np.int64)
+        self._lease_end_ord = np.empty(0, dtype=np.int64)
+        self._lease_rent = np.empty(0, dtype=np.float64)
+        self._lease_rate = np.empty(0, dtype=np.float64)
+        self._lease_freq_code = np.empty(0, dtype=np.int8)
+        self._lease_status = np.empty(0, dtype=np.int8)
+        self._lease_charges = np.empty(0, dtype=np.float64)
+        self._lease_order_by_start = np.empty(0, dtype=np.int64)
+        self._lease_starts_sorted = np.empty(0, dtype=np.int64)
+        self._noi_cache: Dict[Tuple[str, int], Dict] = {}
+        self._vacancy_cache: Dict[Tuple[str, int, int], Dict[str, float]] = {}
+        self._units_df = pd.DataFrame()
+
+    def add_property(self, prop: Property) -> None:
+        """Register a property and invalidate derived indexes"""
+        self.properties[prop.property_id] = prop
+        self._index_dirty = True
+
+    def add_unit(self, unit: Unit) -> None:
+        """Register a unit and invalidate derived indexes"""
+        self.units[unit.unit_id] = unit
+        self._index_dirty = True
+
+    def add_tenant(self, tenant: Tenant) -> None:
+        """Register a tenant"""
+        self.tenants[tenant.tenant_id] = tenant
+
+    def add_lease(self, lease: Lease) -> None:
+        """Register a lease and invalidate derived indexes"""
+        self.leases[lease.lease_id] = lease
+        self._index_dirty = True
+
+    def _sync_indexes(self) -> None:
+        """Rebuild the inverted indexes if records were added.
+
+        Direct writes into the units/leases dicts are detected by count;
+        in-place edits of existing records should set _index_dirty.
+        """
+        if (self._index_dirty or
+                len(self.units) != self._indexed_units or
+                len(self.leases) != self._indexed_leases):
+            self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild unit-to-leases and property-to-units lookups"""
+        self._units_by_property = {}
+        for unit in self.units.values():
+            self._units_by_property.setdefault(unit.property_id, []).append(unit)
+        self._leases_by_unit = {}
+        self._lease_rows_by_unit = {}
+        leases = list(self.leases.values())
+        self._lease_list = leases
+        for row, lease in enumerate(leases):
+            self._leases_by_unit.setdefault(lease.unit_id, []).append(lease)
+            self._lease_rows_by_unit.setdefault(lease.unit_id, []).append(row)
+        self._lease_start_ord = np.array([l._start_ord for l in leases], dtype=np.int64)
+        self._lease_end_ord = np.array([l._end_ord for l in leases], dtype=np.int64)
+        self._lease_rent = np.array([l.monthly_rent for l in leases], dtype=np.float64)
+        self._lease_rate = np.array([l.rent_escalation_rate for l in leases], dtype=np.float64)
+        self._lease_freq_code = np.array(
+            [_FREQ_CODES.get(l.rent_escalation_frequency, -1) for l in leases], dtype=np.int8)
+        self._lease_status = np.array([_STATUS_CODES[l.status] for l in leases], dtype=np.int8)
+        self._lease_charges = np.array(
+            [sum(l.additional_charges.values()) if l.additional_charges else 0.0 for l in leases],
+            dtype=np.float64)
+        self._lease_order_by_start = np.argsort(self._lease_start_ord, kind='stable')
+        self._lease_starts_sorted = self._lease_start_ord[self._lease_order_by_start]
+        units = list(self.units.values())
+        self._units_df = pd.DataFrame({
+            'unit_id': np.array([u.unit_id for u in units], dtype=object),
+            'property_id': np.array([u.property_id for u in units], dtype=object),
+            'unit_number': np.array([u.unit_number for u in units], dtype=object),
+            'square_feet': np.array([u.square_feet for u in units], dtype=np.float64),
+            'bedrooms': np.array([u.bedrooms for u in units], dtype=np.int64),
+            'market_rent': np.array([u.market_rent for u in units], dtype=np.float64),
+        })
+        self._indexed_units = len(self.units)
+        self._indexed_leases = len(self.leases)
+        self._noi_cache.clear()
+        self._vacancy_cache.clear()
+        self._index_dirty = False
+
+    def _active_lease_rows(self, as_of_ord: int) -> np.ndarray:
+        """Rows of leases active on a given day ordinal.
+
+        Brackets start dates with a binary search over the sorted view,
+        then filters ends and status; rows come back in lease-insertion
+        order so first-match semantics are preserved.
+        """
+        bound = np.searchsorted(self._lease_starts_sorted, as_of_ord, side='right')
+        candidates = self._lease_order_by_start[:bound]
+        rows = candidates[(self._lease_end_ord[candidates] >= as_of_ord) &
+                          (self._lease_status[candidates] == _ACTIVE_CODE)]
+        rows.sort()
+        return rows
+
+    def _current_lease_rows_by_unit(self, as_of_ord: int) -> Dict[str, int]:
+        """Resolve each unit's current lease row in one pass.
+
+        The first active lease per unit wins, matching the old per-unit
+        linear search order.
+        """
+        current: Dict[str, int] = {}
+        for row in self._active_lease_rows(as_of_ord):
+            current.setdefault(self._lease_list[row].unit_id, int(row))
+        return current
+
     def calculate_rent_roll(self, property_id: str, as_of_date: date = None) -> pd.DataFrame:
         """Generate rent roll report for a property"""
         if as_of_date is None:
             as_of_date = date.today()
-        
-        rent_roll_data = []
-        
-        for unit_id, unit in self.units.items():
-            if unit.property_id != property_id:
-                continue
-            
-            active_lease = None
-            for lease in self.leases.values():
-                if (lease.unit_id == unit_id and 
-                    lease.start_date <= as_of_date <= lease.end_date and
-                    lease.status == LeaseStatus.ACTIVE):
-                    active_lease = lease
-                    break
-            
-            if active_lease:
+
+        self._sync_indexes()
+        property_units = self._units_by_property.get(property_id, ())
+        if not property_units:
+            return pd.DataFrame()
+        as_of_ord = as_of_date.toordinal()
+        current_by_unit = self._current_lease_rows_by_unit(as_of_ord)
+
+        # Preallocated column arrays skip the per-row dict inference that
+        # list-of-dicts construction pays.
+        n = len(property_units)
+        unit_col = np.empty(n, dtype=object)
+        tenant_col = np.empty(n, dtype=object)
+        start_col = np.empty(n, dtype=object)
+        end_col = np.empty(n, dtype=object)
+        rent_col = np.empty(n, dtype=np.float64)
+        deposit_col = np.empty(n, dtype=np.float64)
+        status_col = np.empty(n, dtype=object)
+        days_col = np.empty(n, dtype=object)
+
+        for i, unit in enumerate(property_units):
+            unit_col[i] = unit.unit_number
+            active_row = current_by_unit.get(unit.unit_id)
+
+            if active_row is not None:
+                active_lease = self._lease_list[active_row]
                 tenant = self.tenants.get(active_lease.tenant_id)
-                current_rent = self.calculate_current_rent(active_lease, as_of_date)
-                
-                rent_roll_data.append({
-                    'Unit': unit.unit_number,
-                    'Tenant': tenant.name if tenant else 'Unknown',
-                    'Lease Start': active_lease.start_date,
-                    'Lease End': active_lease.end_date,
-                    'Monthly Rent': current_rent,
-                    'Security Deposit': active_lease.security_deposit,
-                    'Status': 'Occupied',
-                    'Days Remaining': (active_lease.end_date - as_of_date).days
-                })
+                tenant_col[i] = tenant.name if tenant else 'Unknown'
+                start_col[i] = active_lease.start_date
+                end_col[i] = active_lease.end_date
+                rent_col[i] = self.calculate_current_rent(active_lease, as_of_date)
+                deposit_col[i] = active_lease.security_deposit
+                status_col[i] = 'Occupied'
+                days_col[i] = active_lease._end_ord - as_of_ord
             else:
-                rent_roll_data.append({
-                    'Unit': unit.unit_number,
-                    'Tenant': 'VACANT',
-                    'Lease Start': None,
-                    'Lease End': None,
-                    'Monthly Rent': unit.market_rent,
-                    'Security Deposit': 0,
-                    'Status': 'Vacant',
-                    'Days Remaining': None
-                })
-        
-        return pd.DataFrame(rent_roll_data)
+                tenant_col[i] = 'VACANT'
+                start_col[i] = None
+                end_col[i] = None
+                rent_col[i] = unit.market_rent
+                deposit_col[i] = 0
+                status_col[i] = 'Vacant'
+                days_col[i] = None
+
+        return pd.DataFrame({
+            'Unit': unit_col,
+            'Tenant': tenant_col,
+            'Lease Start': start_col,
+            'Lease End': end_col,
+            'Monthly Rent': rent_col,
+            'Security Deposit': deposit_col,
+            'Status': status_col,
+            'Days Remaining': days_col
+        })
     
+    @staticmethod
+    def _rent_table(lease: Lease, period_months: int) -> np.ndarray:
+        """Escalated rent per escalation period over the lease term.
+
+        Cached on the lease and rebuilt if rent, rate or frequency are
+        edited, so repeated rent queries index a table instead of
+        re-running the power each time.
+        """
+        key = (lease.monthly_rent, lease.rent_escalation_rate, period_months)
+        if getattr(lease, '_rent_table_key', None) != key:
+            term_months = (lease.end_date.year - lease.start_date.year) * 12 + \
+                          (lease.end_date.month - lease.start_date.month)
+            periods = max(term_months, 0) // period_months + 1
+            lease._rent_table_cache = lease.monthly_rent * \
+                np.power(1.0 + lease.rent_escalation_rate, np.arange(periods))
+            lease._rent_table_key = key
+        return lease._rent_table_cache
+
     def calculate_current_rent(self, lease: Lease, as_of_date: date) -> float:
         """Calculate current rent considering escalations"""
         if lease.rent_escalation_rate == 0:
             return lease.monthly_rent
-        
-        months_elapsed = (as_of_date.year - lease.start_date.year) * 12 + \
-                        (as_of_date.month - lease.start_date.month)
-        
+
         if lease.rent_escalation_frequency == "annually":
-            years_elapsed = months_elapsed // 12
-            return lease.monthly_rent * ((1 + lease.rent_escalation_rate) ** years_elapsed)
+            period_months = 12
         elif lease.rent_escalation_frequency == "semi-annually":
-            periods_elapsed = months_elapsed // 6
-            return lease.monthly_rent * ((1 + lease.rent_escalation_rate) ** periods_elapsed)
-        
-        return lease.monthly_rent
+            period_months = 6
+        else:
+            return lease.monthly_rent
+
+        months_elapsed = (as_of_date.year - lease.start_date.year) * 12 + \
+                        (as_of_date.month - lease.start_date.month)
+        periods_elapsed = months_elapsed // period_months
+
+        table = self._rent_table(lease, period_months)
+        if 0 <= periods_elapsed < len(table):
+            return float(table[periods_elapsed])
+        # Dates outside the lease term fall back to the direct formula
+        return lease.monthly_rent * ((1 + lease.rent_escalation_rate) ** periods_elapsed)
     
-    def calculate_vacancy_rate(self, property_id: str, start_date: date, end_date: date) -> Dict[str, float]:
-        """Calculate vacancy rate and loss"""
-        total_units = len([u for u in self.units.values() if u.property_id == property_id])
-        days_in_period = (end_date - start_date).days + 1
-        
+    def _scan_period(self, property_id: str, start_date: date, end_date: date) -> '_PeriodScan':
+        """Single fused pass over a property's leases for a period.
+
+        Produces both the month-level revenue totals NOI needs and the
+        day-level occupancy figures the vacancy rate needs from one
+        gather of the lease arrays, and seeds the vacancy cache.
+        """
+        start_ord = start_date.toordinal()
+        end_ord = end_date.toordinal()
+        property_units = self._units_by_property.get(property_id, ())
+        total_units = len(property_units)
+        days_in_period = end_ord - start_ord + 1
+
         total_unit_days = total_units * days_in_period
         vacant_unit_days = 0
         potential_rent = 0
         actual_rent = 0
-        
-        for unit in self.units.values():
-            if unit.property_id != property_id:
-                continue
-            
-            unit_vacant_days = 0
-            current_date = start_date
-            
-            while current_date <= end_date:
-                lease_found = False
-                for lease in self.leases.values():
-                    if (lease.unit_id == unit.unit_id and 
-                        lease.start_date <= current_date <= lease.end_date and
-                        lease.status == LeaseStatus.ACTIVE):
-                        lease_found = True
-                        actual_rent += self.calculate_current_rent(lease, current_date) / 30
-                        break
-                
-                if not lease_found:
-                    unit_vacant_days += 1
-                    
-                potential_rent += unit.market_rent / 30
-                current_date += timedelta(days=1)
-            
-            vacant_unit_days += unit_vacant_days
-        
+
+        # Escalated rent only changes at calendar-month boundaries, so each day
+        # maps to a per-month rent instead of being priced individually.
+        months = np.arange(np.datetime64(start_date, 'M'), np.datetime64(end_date, 'M') + 1)
+        month_ords = months.astype('datetime64[D]').astype(np.int64) + _EPOCH_ORD
+        day_months = (np.arange(np.datetime64(start_date, 'D'),
+                                np.datetime64(end_date, 'D') + 1).astype('datetime64[M]')
+                      - months[0]).astype(np.int64)
+
+        income_rows = []
+        for unit in property_units:
+            occupied = np.zeros(days_in_period, dtype=bool)
+
+            for row in self._lease_rows_by_unit.get(unit.unit_id, ()):
+                if self._lease_status[row] != _ACTIVE_CODE:
+                    continue
+                income_rows.append(row)
+                overlap_start = max(int(self._lease_start_ord[row]), start_ord)
+                overlap_end = min(int(self._lease_end_ord[row]), end_ord)
+                if overlap_start > overlap_end:
+                    continue
+                window = slice(overlap_start - start_ord, overlap_end - start_ord + 1)
+                # Earlier leases take precedence on days covered by more than one
+                # lease, matching the first-match scan this loop replaces.
+                open_days = ~occupied[window]
+                if open_days.any():
+                    if self._lease_rate[row] == 0 or self._lease_freq_code[row] < 0:
+                        # Flat lease: rent * days, no escalation math
+                        actual_rent += float(self._lease_rent[row]) * int(open_days.sum()) / 30
+                    else:
+                        month_rents = _current_rent_vec(
+                            self._lease_rent[row], self._lease_start_ord[row],
+                            self._lease_rate[row], self._lease_freq_code[row],
+                            month_ords)
+                        day_rents = month_rents[day_months[window]]
+                        actual_rent += float(day_rents[open_days].sum()) / 30
+                    occupied[window] = True
+
+            vacant_unit_days += days_in_period - int(occupied.sum())
+            potential_rent += unit.market_rent * days_in_period / 30
+
+        # Revenue: one (leases x months) activity matrix over the same rows,
+        # with month end pinned to the 28th.  Simplified
+        rental_income = 0.0
+        other_income = 0.0
+        if income_rows:
+            rows = np.array(income_rows, dtype=np.int64)
+            month_ends = month_ords + 27
+            starts = self._lease_start_ord[rows]
+            ends = self._lease_end_ord[rows]
+
+            active = (starts[:, None] <= month_ends) & (ends[:, None] >= month_ords)
+            rents = _current_rent_vec(self._lease_rent[rows, None], starts[:, None],
+                                      self._lease_rate[rows, None],
+                                      self._lease_freq_code[rows, None], month_ords)
+            rental_income = float((rents * active).sum())
+            other_income = float(active.sum(axis=1) @ self._lease_charges[rows])
+
         vacancy_rate = (vacant_unit_days / total_unit_days) * 100 if total_unit_days > 0 else 0
         economic_vacancy = ((potential_rent - actual_rent) / potential_rent * 100) if potential_rent > 0 else 0
-        
-        return {
+
+        vacancy = {
             'physical_vacancy_rate': round(vacancy_rate, 2),
             'economic_vacancy_rate': round(economic_vacancy, 2),
             'vacant_unit_days': vacant_unit_days,
@@ -179,64 +414,76 @@ class RentalPropertyManager:
             'actual_rent': round(actual_rent, 2),
             'vacancy_loss': round(potential_rent - actual_rent, 2)
         }
+        self._vacancy_cache[(property_id, start_ord, end_ord)] = vacancy
+        return _PeriodScan(rental_income, other_income, vacancy)
+
+    def calculate_vacancy_rate(self, property_id: str, start_date: date, end_date: date) -> Dict[str, float]:
+        """Calculate vacancy rate and loss"""
+        self._sync_indexes()
+        cache_key = (property_id, start_date.toordinal(), end_date.toordinal())
+        cached = self._vacancy_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        return self._scan_period(property_id, start_date, end_date).vacancy
+
     
     def generate_lease_expiration_report(self, months_ahead: int = 3) -> pd.DataFrame:
         """Generate report of upcoming lease expirations"""
-        cutoff_date = date.today() + relativedelta(months=months_ahead)
-        expiring_leases = []
-        
-        for lease in self.leases.values():
-            if (lease.status == LeaseStatus.ACTIVE and 
-                date.today() <= lease.end_date <= cutoff_date):
-                
-                unit = self.units.get(lease.unit_id)
-                tenant = self.tenants.get(lease.tenant_id)
-                
-                expiring_leases.append({
-                    'Unit': unit.unit_number if unit else 'Unknown',
-                    'Tenant': tenant.name if tenant else 'Unknown',
-                    'Lease End': lease.end_date,
-                    'Days Until Expiry': (lease.end_date - date.today()).days,
-                    'Current Rent': self.calculate_current_rent(lease, date.today()),
-                    'Market Rent': unit.market_rent if unit else 0,
-                    'Variance': ((unit.market_rent - self.calculate_current_rent(lease, date.today())) 
-                                / self.calculate_current_rent(lease, date.today()) * 100) if unit else 0
-                })
-        
-        df = pd.DataFrame(expiring_leases)
-        if not df.empty:
-            df = df.sort_values('Days Until Expiry')
-        return df
+        self._sync_indexes()
+        today = date.today()
+        today_ord = today.toordinal()
+        cutoff_ord = (today + relativedelta(months=months_ahead)).toordinal()
+
+        rows = np.flatnonzero((self._lease_status == _ACTIVE_CODE) &
+                              (self._lease_end_ord >= today_ord) &
+                              (self._lease_end_ord <= cutoff_ord))
+        if not rows.size:
+            return pd.DataFrame()
+
+        expiring = [self._lease_list[row] for row in rows]
+        units = [self.units.get(lease.unit_id) for lease in expiring]
+        tenants = [self.tenants.get(lease.tenant_id) for lease in expiring]
+
+        current_rent = _current_rent_vec(
+            self._lease_rent[rows], self._lease_start_ord[rows],
+            self._lease_rate[rows], self._lease_freq_code[rows], today_ord)
+        market_rent = np.array([unit.market_rent if unit else 0 for unit in units],
+                               dtype=np.float64)
+        known_unit = np.array([unit is not None for unit in units])
+        variance = np.where(known_unit,
+                            (market_rent - current_rent) / current_rent * 100, 0.0)
+
+        df = pd.DataFrame({
+            'Unit': np.array([unit.unit_number if unit else 'Unknown' for unit in units],
+                             dtype=object),
+            'Tenant': np.array([tenant.name if tenant else 'Unknown' for tenant in tenants],
+                               dtype=object),
+            'Lease End': np.array([lease.end_date for lease in expiring], dtype=object),
+            'Days Until Expiry': self._lease_end_ord[rows] - today_ord,
+            'Current Rent': current_rent,
+            'Market Rent': market_rent,
+            'Variance': variance
+        })
+        return df.sort_values('Days Until Expiry')
     
     def calculate_noi(self, property_id: str, year: int) -> Dict[str, float]:
-        """Calculate Net Operating Income for a property"""
-        start_date = date(year, 1, 1)
-        end_date = date(year, 12, 31)
-        
-        # Revenue calculations
-        rental_income = 0
-        other_income = 0
-        
-        for unit in self.units.values():
-            if unit.property_id != property_id:
-                continue
-            
-            for month in range(1, 13):
-                month_start = date(year, month, 1)
-                month_end = date(year, month, 28)  # Simplified
-                
-                for lease in self.leases.values():
-                    if (lease.unit_id == unit.unit_id and 
-                        lease.start_date <= month_end and lease.end_date >= month_start and
-                        lease.status == LeaseStatus.ACTIVE):
-                        
-                        rental_income += self.calculate_current_rent(lease, month_start)
-                        
-                        if lease.additional_charges:
-                            other_income += sum(lease.additional_charges.values())
-        
-        vacancy_data = self.calculate_vacancy_rate(property_id, start_date, end_date)
-        vacancy_loss = vacancy_data['vacancy_loss']
+        """Calculate Net Operating Income for a property
+
+        Results are memoized until lease or unit records change, so
+        repeated queries (e.g. multi-year projections) only pay for the
+        lease scan once per (property, year).
+        """
+        self._sync_indexes()
+        cache_key = (property_id, year)
+        cached = self._noi_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Revenue and vacancy come from one fused scan of the year
+        scan = self._scan_period(property_id, date(year, 1, 1), date(year, 12, 31))
+        rental_income = scan.rental_income
+        other_income = scan.other_income
+        vacancy_loss = scan.vacancy['vacancy_loss']
         
         # Operating expenses (simplified - would be tracked separately)
         operating_expenses = {
@@ -255,7 +502,7 @@ class RentalPropertyManager:
         total_expenses = sum(operating_expenses.values())
         noi = total_revenue - total_expenses
         
-        return {
+        result = {
             'Gross Rental Income': round(gross_rental_income, 2),
             'Vacancy Loss': round(vacancy_loss, 2),
             'Effective Rental Income': round(effective_rental_income, 2),
@@ -267,6 +514,8 @@ class RentalPropertyManager:
             'Operating Expense Ratio': round(total_expenses / total_revenue * 100, 2) if total_revenue > 0 else 0,
             'NOI Margin': round(noi / total_revenue * 100, 2) if total_revenue > 0 else 0
         }
+        self._noi_cache[cache_key] = result
+        return result
     
     def calculate_cap_rate(self, property_id: str, property_value: float, year: int) -> float:
         """Calculate capitalization rate"""
@@ -278,101 +527,97 @@ class RentalPropertyManager:
                          initial_investment: float, loan_amount: float = 0,
                          loan_rate: float = 0, loan_term_years: int = 0) -> pd.DataFrame:
         """Project property cash flows"""
-        projections = []
         current_year = date.today().year
-        
+
         # Calculate loan payment if applicable
         if loan_amount > 0 and loan_rate > 0 and loan_term_years > 0:
             monthly_rate = loan_rate / 12
-            n_payments = loan_term_years * 12
-            monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate)**n_payments) / \
-                            ((1 + monthly_rate)**n_payments - 1)
+            growth_factor = (1 + monthly_rate) ** (loan_term_years * 12)
+            monthly_payment = loan_amount * monthly_rate * growth_factor / (growth_factor - 1)
             annual_debt_service = monthly_payment * 12
         else:
             annual_debt_service = 0
-        
-        for year_offset in range(years):
-            year = current_year + year_offset
-            noi_data = self.calculate_noi(property_id, year)
-            
-            # Apply growth assumptions
-            if year_offset > 0:
-                noi = noi_data['Net Operating Income'] * (1.03 ** year_offset)  # 3% growth
-            else:
-                noi = noi_data['Net Operating Income']
-            
-            # Calculate cash flow
-            before_tax_cash_flow = noi - annual_debt_service
-            
-            # Simplified tax calculation
-            depreciation = initial_investment / 27.5  # Residential depreciation
-            taxable_income = noi - annual_debt_service - depreciation
-            taxes = max(0, taxable_income * 0.25)  # 25% tax rate
-            
-            after_tax_cash_flow = before_tax_cash_flow - taxes
-            
-            projections.append({
-                'Year': year,
-                'NOI': round(noi, 2),
-                'Debt Service': round(annual_debt_service, 2),
-                'Before Tax Cash Flow': round(before_tax_cash_flow, 2),
-                'Depreciation': round(depreciation, 2),
-                'Taxes': round(taxes, 2),
-                'After Tax Cash Flow': round(after_tax_cash_flow, 2)
-            })
-        
-        return pd.DataFrame(projections)
+
+        # Grow the base year's NOI at the assumed 3% and compute the whole
+        # projection as numpy columns.
+        base_noi = self.calculate_noi(property_id, current_year)['Net Operating Income']
+        noi = base_noi * 1.03 ** np.arange(years)  # 3% growth
+
+        before_tax_cash_flow = noi - annual_debt_service
+
+        # Simplified tax calculation
+        depreciation = initial_investment / 27.5  # Residential depreciation
+        taxes = np.maximum(0, (noi - annual_debt_service - depreciation) * 0.25)  # 25% tax rate
+        after_tax_cash_flow = before_tax_cash_flow - taxes
+
+        return pd.DataFrame({
+            'Year': np.arange(current_year, current_year + years),
+            'NOI': np.round(noi, 2),
+            'Debt Service': np.full(years, round(annual_debt_service, 2)),
+            'Before Tax Cash Flow': np.round(before_tax_cash_flow, 2),
+            'Depreciation': np.full(years, round(depreciation, 2)),
+            'Taxes': np.round(taxes, 2),
+            'After Tax Cash Flow': np.round(after_tax_cash_flow, 2)
+        })
     
     def analyze_rent_comparables(self, unit_id: str, radius_properties: List[str]) -> Dict:
         """Analyze comparable rents for market analysis"""
         target_unit = self.units.get(unit_id)
         if not target_unit:
             return {}
-        
-        comparables = []
-        
-        for prop_id in radius_properties:
-            for unit in self.units.values():
-                if unit.property_id != prop_id:
-                    continue
-                
-                # Find similar units (same bedroom count, similar size)
-                if (unit.bedrooms == target_unit.bedrooms and
-                    abs(unit.square_feet - target_unit.square_feet) / target_unit.square_feet < 0.15):
-                    
-                    # Get current rent if leased
-                    current_rent = unit.market_rent
-                    for lease in self.leases.values():
-                        if (lease.unit_id == unit.unit_id and 
-                            lease.status == LeaseStatus.ACTIVE and
-                            lease.start_date <= date.today() <= lease.end_date):
-                            current_rent = self.calculate_current_rent(lease, date.today())
-                            break
-                    
-                    comparables.append({
-                        'property': self.properties.get(prop_id).name if prop_id in self.properties else 'Unknown',
-                        'unit': unit.unit_number,
-                        'sq_ft': unit.square_feet,
-                        'rent': current_rent,
-                        'rent_per_sq_ft': current_rent / unit.square_feet
-                    })
-        
-        if not comparables:
+
+        self._sync_indexes()
+        df = self._units_df
+
+        # Similar units (same bedroom count, similar size) as one boolean mask
+        # over the units mirror, scanned property-by-property to keep the
+        # caller's radius ordering.
+        prop_ids = df['property_id'].to_numpy()
+        similar = ((df['bedrooms'].to_numpy() == target_unit.bedrooms) &
+                   (np.abs(df['square_feet'].to_numpy() - target_unit.square_feet)
+                    / target_unit.square_feet < 0.15))
+        rows = [i for prop_id in radius_properties
+                for i in np.flatnonzero(similar & (prop_ids == prop_id))]
+
+        if not rows:
             return {'error': 'No comparable units found'}
-        
-        df = pd.DataFrame(comparables)
-        
+
+        today = date.today()
+        current_by_unit = self._current_lease_rows_by_unit(today.toordinal())
+        sub = df.iloc[rows]
+        sq_ft = sub['square_feet'].to_numpy()
+        rents = sub['market_rent'].to_numpy().copy()
+        for k, unit_key in enumerate(sub['unit_id']):
+            # Use current lease rent where the unit is occupied
+            lease_row = current_by_unit.get(unit_key)
+            if lease_row is not None:
+                rents[k] = self.calculate_current_rent(self._lease_list[lease_row], today)
+        rent_per_sq_ft = rents / sq_ft
+
+        comparables = [
+            {
+                'property': self.properties[prop_id].name if prop_id in self.properties else 'Unknown',
+                'unit': number,
+                'sq_ft': int(feet),
+                'rent': float(rent),
+                'rent_per_sq_ft': float(per_ft)
+            }
+            for prop_id, number, feet, rent, per_ft in zip(
+                sub['property_id'], sub['unit_number'], sq_ft, rents, rent_per_sq_ft)
+        ]
+
+        median_per_sq_ft = float(np.median(rent_per_sq_ft))
         return {
             'target_unit': target_unit.unit_number,
             'target_sq_ft': target_unit.square_feet,
             'current_market_rent': target_unit.market_rent,
             'comparables': comparables,
-            'average_rent': round(df['rent'].mean(), 2),
-            'median_rent': round(df['rent'].median(), 2),
-            'average_rent_per_sq_ft': round(df['rent_per_sq_ft'].mean(), 2),
-            'suggested_rent': round(df['rent_per_sq_ft'].median() * target_unit.square_feet, 2),
-            'rent_variance': round(((df['rent_per_sq_ft'].median() * target_unit.square_feet) - 
-                                   target_unit.market_rent) / target_unit.market_rent * 100, 2)
+            'average_rent': round(float(rents.mean()), 2),
+            'median_rent': round(float(np.median(rents)), 2),
+            'average_rent_per_sq_ft': round(float(rent_per_sq_ft.mean()), 2),
+            'suggested_rent': round(median_per_sq_ft * target_unit.square_feet, 2),
+            'rent_variance': round((median_per_sq_ft * target_unit.square_feet -
+                                    target_unit.market_rent) / target_unit.market_rent * 100, 2)
         }
 
 if __name__ == "__main__":
@@ -380,20 +625,16 @@ if __name__ == "__main__":
     rpm = RentalPropertyManager()
     
     # Add sample property
-    prop = Property("P001", "Sunset Apartments", "123 Main St", "Multifamily", 10, 2010, ["Pool", "Gym"])
-    rpm.properties[prop.property_id] = prop
-    
+    rpm.add_property(Property("P001", "Sunset Apartments", "123 Main St", "Multifamily", 10, 2010, ["Pool", "Gym"]))
+
     # Add sample unit
-    unit = Unit("U001", "P001", "101", 850, 2, 1.0, "Apartment", ["Balcony"], 1500)
-    rpm.units[unit.unit_id] = unit
-    
+    rpm.add_unit(Unit("U001", "P001", "101", 850, 2, 1.0, "Apartment", ["Balcony"], 1500))
+
     # Add sample tenant and lease
-    tenant = Tenant("T001", "John Doe", {"phone": "555-1234", "email": "john@example.com"})
-    rpm.tenants[tenant.tenant_id] = tenant
-    
-    lease = Lease("L001", "U001", "T001", date(2024, 1, 1), date(2025, 12, 31), 
-                  1500, 3000, LeaseStatus.ACTIVE, 0.03)
-    rpm.leases[lease.lease_id] = lease
+    rpm.add_tenant(Tenant("T001", "John Doe", {"phone": "555-1234", "email": "john@example.com"}))
+
+    rpm.add_lease(Lease("L001", "U001", "T001", date(2024, 1, 1), date(2025, 12, 31),
+                        1500, 3000, LeaseStatus.ACTIVE, 0.03))
     
     # Test rent roll
     print("Rent Roll:")
@@ -2,10 +2,153 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple, Union
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import json
 
+from financial_calculations import DepreciationCalculator
+
+def _bracket_arrays(brackets: List[Tuple[float, float]]) -> Tuple[np.ndarray, ...]:
+    """Decompose (threshold, rate) bracket tuples into flat arrays.
+
+    Returns (lowers, widths, rates, uppers) so progressive tax reduces to
+    clipping income against each bracket and one dot product.
+    """
+    uppers = np.array([threshold for threshold, _ in brackets], dtype=np.float64)
+    rates = np.array([rate for _, rate in brackets], dtype=np.float64)
+    lowers = np.concatenate(([0.0], uppers[:-1]))
+    return lowers, uppers - lowers, rates, uppers
+
+
+# 2024 tax brackets (would be updated annually)
+_FEDERAL_BRACKETS_SINGLE = [
+    (11000, 0.10),
+    (44725, 0.12),
+    (95375, 0.22),
+    (182050, 0.24),
+    (231250, 0.32),
+    (578125, 0.35),
+    (float('inf'), 0.37)
+]
+
+_FEDERAL_BRACKETS_MFJ = [
+    (22000, 0.10),
+    (89450, 0.12),
+    (190750, 0.22),
+    (364200, 0.24),
+    (462500, 0.32),
+    (693750, 0.35),
+    (float('inf'), 0.37)
+]
+
+# Standard deductions for 2024
+_STANDARD_DEDUCTIONS = {
+    'single': 13850,
+    'married_filing_jointly': 27700,
+    'married_filing_separately': 13850,
+    'head_of_household': 20800
+}
+
+# State income tax brackets (simplified; would need to be expanded for all states)
+_STATE_RATES = {
+    'CA': {
+        'single': [(10099, 0.01), (23942, 0.02), (37788, 0.04),
+                  (52455, 0.06), (66295, 0.08), (338639, 0.093),
+                  (406364, 0.103), (677278, 0.113), (float('inf'), 0.123)],
+        'married_filing_jointly': [(20198, 0.01), (47884, 0.02), (75576, 0.04),
+                                 (104910, 0.06), (132590, 0.08), (677278, 0.093),
+                                 (812728, 0.103), (1354556, 0.113), (float('inf'), 0.123)]
+    },
+    'NY': {
+        'single': [(8500, 0.04), (11700, 0.045), (13900, 0.0525),
+                  (21400, 0.059), (80650, 0.0645), (215400, 0.0665),
+                  (1077550, 0.0685), (float('inf'), 0.0882)],
+        'married_filing_jointly': [(17150, 0.04), (23600, 0.045), (27900, 0.0525),
+                                 (43000, 0.059), (161550, 0.0645), (323200, 0.0665),
+                                 (2155350, 0.0685), (float('inf'), 0.0882)]
+    },
+    'TX': {
+        'single': [(float('inf'), 0.0)],  # No state income tax
+        'married_filing_jointly': [(float('inf'), 0.0)]
+    },
+    'FL': {
+        'single': [(float('inf'), 0.0)],  # No state income tax
+        'married_filing_jointly': [(float('inf'), 0.0)]
+    }
+}
+
+# Arrays built once at import so every TaxCalculator instance shares them
+_FEDERAL_BRACKET_ARRAYS = {
+    'single': _bracket_arrays(_FEDERAL_BRACKETS_SINGLE),
+    'married_filing_jointly': _bracket_arrays(_FEDERAL_BRACKETS_MFJ)
+}
+
+_STATE_BRACKET_ARRAYS = {
+    state: {status: _bracket_arrays(brackets) for status, brackets in by_status.items()}
+    for state, by_status in _STATE_RATES.items()
+}
+
+
+_DUE_DATES_CACHE: Dict[int, List[str]] = {}
+
+
+def _due_dates(year: int) -> List[str]:
+    """Quarterly estimated-tax due dates for a year, formatted once"""
+    due_dates = _DUE_DATES_CACHE.get(year)
+    if due_dates is None:
+        due_dates = [
+            f"{year}-01-15",  # Q4 prior year
+            f"{year}-04-15",  # Q1
+            f"{year}-06-15",  # Q2
+            f"{year}-09-15"   # Q3
+        ]
+        _DUE_DATES_CACHE[year] = due_dates
+    return due_dates
+
+
+def format_calculation_detail(details: List[Dict]) -> List[Dict]:
+    """Format raw per-bracket detail entries for display"""
+    return [
+        {
+            'income_range': f"${entry['lower']:,.0f} - ${entry['upper']:,.0f}",
+            'rate': f"{entry['rate'] * 100:.1f}%",
+            'taxable_income': entry['taxable_income'],
+            'tax': entry['tax']
+        }
+        for entry in details
+    ]
+
+
+def _se_tax_vec(net_earnings) -> Dict[str, np.ndarray]:
+    """Self-employment tax components for an array of net earnings.
+
+    Returns unrounded component arrays; non-positive earnings yield zeros.
+    """
+    # 2024 rates and limits
+    ss_wage_base = 160200  # Social Security wage base
+    ss_rate = 0.124  # 12.4%
+    medicare_rate = 0.029  # 2.9%
+    additional_medicare_rate = 0.009  # Additional 0.9% on high earners
+    additional_medicare_threshold = 200000
+
+    net = np.asarray(net_earnings, dtype=np.float64)
+    # SE earnings are 92.35% of net earnings
+    se_earnings = np.where(net > 0, net * 0.9235, 0.0)
+    ss_tax = np.minimum(se_earnings, ss_wage_base) * ss_rate
+    medicare_tax = se_earnings * medicare_rate
+    additional_medicare = np.maximum(se_earnings - additional_medicare_threshold, 0.0) * additional_medicare_rate
+
+    return {
+        'se_earnings': se_earnings,
+        'social_security_tax': ss_tax,
+        'medicare_tax': medicare_tax,
+        'additional_medicare_tax': additional_medicare,
+        'total_se_tax': ss_tax + medicare_tax + additional_medicare
+    }
+
+
 class TaxEntityType(Enum):
     SOLE_PROPRIETORSHIP = "Sole Proprietorship"
     PARTNERSHIP = "Partnership"
@@ -19,7 +162,98 @@ class DepreciationMethod(Enum):
     SECTION_179 = "Section 179"
     BONUS_DEPRECIATION = "Bonus Depreciation"
 
-@dataclass
+_METHOD_CODES = {
+    DepreciationMethod.STRAIGHT_LINE: 0,
+    DepreciationMethod.MACRS: 1,
+    DepreciationMethod.SECTION_179: 2,
+    DepreciationMethod.BONUS_DEPRECIATION: 3
+}
+_SL_CODE = _METHOD_CODES[DepreciationMethod.STRAIGHT_LINE]
+_MACRS_CODE = _METHOD_CODES[DepreciationMethod.MACRS]
+_SEC179_CODE = _METHOD_CODES[DepreciationMethod.SECTION_179]
+
+_MACRS_LIVES = (3, 5, 7, 10)
+_MACRS_TABLE = None
+
+
+@lru_cache(maxsize=None)
+def _macrs_pct_schedule(life: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """MACRS percentage schedule for a recovery period: (annual pct, cumulative pct)"""
+    pct = tuple(DepreciationCalculator.macrs(1.0, life))
+    return pct, tuple(np.cumsum(pct))
+
+
+def _macrs_pct_table() -> Tuple[Dict[int, int], np.ndarray, np.ndarray]:
+    """Padded MACRS percentage table: (row index by life, pct, cumulative pct)"""
+    global _MACRS_TABLE
+    if _MACRS_TABLE is None:
+        schedules = [np.asarray(_macrs_pct_schedule(life)[0]) for life in _MACRS_LIVES]
+        table = np.zeros((len(schedules), max(len(s) for s in schedules)))
+        for row, schedule in enumerate(schedules):
+            table[row, :len(schedule)] = schedule
+        _MACRS_TABLE = ({life: row for row, life in enumerate(_MACRS_LIVES)},
+                        table, np.cumsum(table, axis=1))
+    return _MACRS_TABLE
+
+
+def _depreciation_section_179(asset: 'DepreciableAsset', years_in_service: int) -> Dict[str, float]:
+    # Section 179 immediate expensing (2024 limit: $1,220,000)
+    section_179_limit = 1220000
+    deduction = min(asset.cost, section_179_limit)
+
+    return {
+        'asset_id': asset.asset_id,
+        'depreciation_method': 'Section 179',
+        'annual_deduction': deduction,
+        'remaining_basis': 0,
+        'total_depreciation': deduction
+    }
+
+
+def _depreciation_macrs(asset: 'DepreciableAsset', years_in_service: int) -> Dict[str, float]:
+    # MACRS depreciation; schedules depend only on the recovery period,
+    # so they are cached and scaled by cost
+    pct, cumulative = _macrs_pct_schedule(asset.useful_life)
+
+    if years_in_service < 0:
+        # Not yet in service for this tax year
+        annual_deduction = 0
+        total_depreciation = 0
+    else:
+        annual_deduction = asset.cost * pct[years_in_service] if years_in_service < len(pct) else 0
+        total_depreciation = asset.cost * cumulative[min(years_in_service, len(pct) - 1)]
+
+    return {
+        'asset_id': asset.asset_id,
+        'depreciation_method': 'MACRS',
+        'annual_deduction': round(annual_deduction, 2),
+        'remaining_basis': round(asset.cost - total_depreciation, 2),
+        'total_depreciation': round(total_depreciation, 2)
+    }
+
+
+def _depreciation_straight_line(asset: 'DepreciableAsset', years_in_service: int) -> Dict[str, float]:
+    annual_deduction = asset.cost / asset.useful_life
+    total_depreciation = annual_deduction * min(years_in_service + 1, asset.useful_life)
+
+    return {
+        'asset_id': asset.asset_id,
+        'depreciation_method': 'Straight Line',
+        'annual_deduction': round(annual_deduction, 2),
+        'remaining_basis': round(asset.cost - total_depreciation, 2),
+        'total_depreciation': round(total_depreciation, 2)
+    }
+
+
+# Depreciation dispatch by method code; BONUS_DEPRECIATION has no handler yet
+_DEPR_HANDLERS = {
+    _SEC179_CODE: _depreciation_section_179,
+    _MACRS_CODE: _depreciation_macrs,
+    _SL_CODE: _depreciation_straight_line
+}
+
+
+@dataclass(slots=True)
 class TaxableEntity:
     entity_id: str
     name: str
@@ -28,7 +262,7 @@ class TaxableEntity:
     fiscal_year_end: str  # MM-DD format
     state: str
     
-@dataclass
+@dataclass(slots=True)
 class DepreciableAsset:
     asset_id: str
     description: str
@@ -46,109 +280,86 @@ class TaxCalculator:
     def __init__(self):
         self.entities: Dict[str, TaxableEntity] = {}
         self.assets: Dict[str, DepreciableAsset] = {}
-        
-        # 2024 tax brackets (would be updated annually)
-        self.federal_brackets_single = [
-            (11000, 0.10),
-            (44725, 0.12),
-            (95375, 0.22),
-            (182050, 0.24),
-            (231250, 0.32),
-            (578125, 0.35),
-            (float('inf'), 0.37)
-        ]
-        
-        self.federal_brackets_mfj = [
-            (22000, 0.10),
-            (89450, 0.12),
-            (190750, 0.22),
-            (364200, 0.24),
-            (462500, 0.32),
-            (693750, 0.35),
-            (float('inf'), 0.37)
-        ]
-        
-        # Standard deductions for 2024
-        self.standard_deductions = {
-            'single': 13850,
-            'married_filing_jointly': 27700,
-            'married_filing_separately': 13850,
-            'head_of_household': 20800
-        }
-    
-    def calculate_federal_income_tax(self, taxable_income: float, filing_status: str = 'single') -> Dict[str, float]:
+
+        # Shared module-level 2024 constants, kept as instance attributes
+        # for existing callers
+        self.federal_brackets_single = _FEDERAL_BRACKETS_SINGLE
+        self.federal_brackets_mfj = _FEDERAL_BRACKETS_MFJ
+        self.standard_deductions = _STANDARD_DEDUCTIONS
+        self._bracket_arrays = _FEDERAL_BRACKET_ARRAYS
+
+        # Structure-of-arrays view of self.assets, rebuilt when the count changes
+        self._assets_soa = None
+        self._assets_soa_count = -1
+
+    def _asset_arrays(self) -> Dict[str, np.ndarray]:
+        """Parallel arrays over self.assets for vectorized depreciation"""
+        if self._assets_soa is None or self._assets_soa_count != len(self.assets):
+            assets = list(self.assets.values())
+            self._assets_soa = {
+                'asset_id': [a.asset_id for a in assets],
+                'cost': np.array([a.cost for a in assets], dtype=np.float64),
+                'life': np.array([a.useful_life for a in assets], dtype=np.int64),
+                'placed_year': np.array([a.placed_in_service_date.year for a in assets], dtype=np.int64),
+                'method': np.array([_METHOD_CODES[a.depreciation_method] for a in assets], dtype=np.int8)
+            }
+            self._assets_soa_count = len(assets)
+        return self._assets_soa
+
+    def calculate_federal_income_tax(self, taxable_income: float, filing_status: str = 'single',
+                                     detail: bool = False) -> Dict[str, float]:
         """Calculate federal income tax"""
-        if filing_status == 'married_filing_jointly':
-            brackets = self.federal_brackets_mfj
-        else:
-            brackets = self.federal_brackets_single
-        
-        tax_owed = 0
+        if filing_status != 'married_filing_jointly':
+            filing_status = 'single'
+        lowers, widths, rates, uppers = self._bracket_arrays[filing_status]
+
+        taxable_per_bracket = np.minimum(np.maximum(taxable_income - lowers, 0.0), widths)
+        tax_owed = float(taxable_per_bracket @ rates)
+        marginal_rate = float(rates[np.searchsorted(uppers, taxable_income)])
+
         tax_calculation_detail = []
-        remaining_income = taxable_income
-        
-        prev_threshold = 0
-        for threshold, rate in brackets:
-            if remaining_income <= 0:
-                break
-                
-            taxable_at_rate = min(remaining_income, threshold - prev_threshold)
-            tax_at_rate = taxable_at_rate * rate
-            tax_owed += tax_at_rate
-            
-            if taxable_at_rate > 0:
-                tax_calculation_detail.append({
-                    'income_range': f"${prev_threshold:,.0f} - ${min(threshold, prev_threshold + remaining_income):,.0f}",
-                    'rate': f"{rate * 100:.1f}%",
-                    'taxable_income': taxable_at_rate,
-                    'tax': tax_at_rate
-                })
-            
-            remaining_income -= taxable_at_rate
-            prev_threshold = threshold
-        
+        if detail:
+            for i, taxable_at_rate in enumerate(taxable_per_bracket):
+                if taxable_at_rate > 0:
+                    tax_calculation_detail.append({
+                        'lower': float(lowers[i]),
+                        'upper': float(lowers[i] + taxable_at_rate),
+                        'rate': float(rates[i]),
+                        'taxable_income': float(taxable_at_rate),
+                        'tax': float(taxable_at_rate * rates[i])
+                    })
+
         return {
             'taxable_income': taxable_income,
             'total_tax': round(tax_owed, 2),
             'effective_rate': round(tax_owed / taxable_income * 100, 2) if taxable_income > 0 else 0,
-            'marginal_rate': round(next(rate for threshold, rate in brackets if taxable_income <= threshold) * 100, 2),
+            'marginal_rate': round(marginal_rate * 100, 2),
             'calculation_detail': tax_calculation_detail
         }
     
+    def calculate_federal_income_tax_batch(self, taxable_incomes, filing_status: str = 'single') -> np.ndarray:
+        """Calculate federal income tax for an array of incomes in one pass"""
+        if filing_status != 'married_filing_jointly':
+            filing_status = 'single'
+        lowers, widths, rates, _ = self._bracket_arrays[filing_status]
+
+        incomes = np.asarray(taxable_incomes, dtype=np.float64)
+        taxable_per_bracket = np.minimum(np.maximum(incomes[:, None] - lowers, 0.0), widths)
+        return taxable_per_bracket @ rates
+
     def calculate_self_employment_tax(self, net_earnings: float) -> Dict[str, float]:
         """Calculate self-employment tax (Social Security and Medicare)"""
         if net_earnings <= 0:
             return {'se_tax': 0, 'social_security': 0, 'medicare': 0}
-        
-        # 2024 rates and limits
-        ss_wage_base = 160200  # Social Security wage base
-        ss_rate = 0.124  # 12.4%
-        medicare_rate = 0.029  # 2.9%
-        additional_medicare_rate = 0.009  # Additional 0.9% on high earners
-        additional_medicare_threshold = 200000
-        
-        # Calculate SE earnings (92.35% of net earnings)
-        se_earnings = net_earnings * 0.9235
-        
-        # Social Security tax
-        ss_taxable = min(se_earnings, ss_wage_base)
-        ss_tax = ss_taxable * ss_rate
-        
-        # Medicare tax
-        medicare_tax = se_earnings * medicare_rate
-        
-        # Additional Medicare tax
-        additional_medicare = 0
-        if se_earnings > additional_medicare_threshold:
-            additional_medicare = (se_earnings - additional_medicare_threshold) * additional_medicare_rate
-        
-        total_se_tax = ss_tax + medicare_tax + additional_medicare
-        
+
+        components = _se_tax_vec(net_earnings)
+        total_se_tax = float(components['total_se_tax'])
+
         return {
-            'se_earnings': round(se_earnings, 2),
-            'social_security_tax': round(ss_tax, 2),
-            'medicare_tax': round(medicare_tax, 2),
-            'additional_medicare_tax': round(additional_medicare, 2),
+            'se_earnings': round(float(components['se_earnings']), 2),
+            'social_security_tax': round(float(components['social_security_tax']), 2),
+            'medicare_tax': round(float(components['medicare_tax']), 2),
+            'additional_medicare_tax': round(float(components['additional_medicare_tax']), 2),
             'total_se_tax': round(total_se_tax, 2),
             'deductible_portion': round(total_se_tax * 0.5, 2)  # 50% deductible
         }
@@ -158,125 +369,103 @@ class TaxCalculator:
         asset = self.assets.get(asset_id)
         if not asset:
             return {'error': 'Asset not found'}
-        
-        years_in_service = tax_year - asset.placed_in_service_date.year
-        
-        if asset.depreciation_method == DepreciationMethod.SECTION_179:
-            # Section 179 immediate expensing (2024 limit: $1,220,000)
-            section_179_limit = 1220000
-            deduction = min(asset.cost, section_179_limit)
-            
-            return {
-                'asset_id': asset_id,
-                'depreciation_method': 'Section 179',
-                'annual_deduction': deduction,
-                'remaining_basis': 0,
-                'total_depreciation': deduction
-            }
-        
-        elif asset.depreciation_method == DepreciationMethod.MACRS:
-            # MACRS depreciation
-            from financial_calculations import DepreciationCalculator
-            
-            macrs_schedule = DepreciationCalculator.macrs(asset.cost, asset.useful_life)
-            
-            if years_in_service < len(macrs_schedule):
-                annual_deduction = macrs_schedule[years_in_service]
-                total_depreciation = sum(macrs_schedule[:years_in_service + 1])
-            else:
-                annual_deduction = 0
-                total_depreciation = sum(macrs_schedule)
-            
-            return {
-                'asset_id': asset_id,
-                'depreciation_method': 'MACRS',
-                'annual_deduction': round(annual_deduction, 2),
-                'remaining_basis': round(asset.cost - total_depreciation, 2),
-                'total_depreciation': round(total_depreciation, 2)
-            }
-        
-        elif asset.depreciation_method == DepreciationMethod.STRAIGHT_LINE:
-            annual_deduction = asset.cost / asset.useful_life
-            total_depreciation = annual_deduction * min(years_in_service + 1, asset.useful_life)
-            
-            return {
-                'asset_id': asset_id,
-                'depreciation_method': 'Straight Line',
-                'annual_deduction': round(annual_deduction, 2),
-                'remaining_basis': round(asset.cost - total_depreciation, 2),
-                'total_depreciation': round(total_depreciation, 2)
-            }
-        
-        return {'error': 'Unknown depreciation method'}
+
+        handler = _DEPR_HANDLERS.get(_METHOD_CODES[asset.depreciation_method])
+        if handler is None:
+            return {'error': 'Unknown depreciation method'}
+
+        return handler(asset, tax_year - asset.placed_in_service_date.year)
     
     def calculate_business_deductions(self, expenses: List[Dict], entity_type: TaxEntityType) -> Dict:
         """Calculate allowable business deductions"""
-        deductible_expenses = {}
+        # Vectorized categorization for large expense lists; pandas fixed cost
+        # is not worth paying below a few dozen rows
+        if len(expenses) >= 32:
+            return self._business_deductions_bulk(expenses, entity_type)
+
+        deductible_expenses = defaultdict(float)
         non_deductible = []
-        
+
         # Categorize expenses and apply limits
         for expense in expenses:
             category = expense.get('category', '')
             amount = expense.get('amount', 0)
-            description = expense.get('description', '')
-            
-            if category in ['Meals & Entertainment']:
+
+            if category == 'Meals & Entertainment':
                 # 50% limit on meals
                 deductible_amount = amount * 0.5
-                deductible_expenses[category] = deductible_expenses.get(category, 0) + deductible_amount
+                deductible_expenses[category] += deductible_amount
                 non_deductible.append({
-                    'expense': description,
+                    'expense': expense.get('description', ''),
                     'total': amount,
                     'deductible': deductible_amount,
                     'reason': '50% limit on business meals'
                 })
-            elif category in ['Travel']:
-                # Check for personal vs business travel
-                deductible_expenses[category] = deductible_expenses.get(category, 0) + amount
-            elif category in ['Home Office']:
-                # Simplified home office deduction
-                if entity_type == TaxEntityType.SOLE_PROPRIETORSHIP:
-                    # Can use simplified method or actual expense method
-                    deductible_expenses[category] = deductible_expenses.get(category, 0) + amount
-                else:
-                    # Different rules for other entities
-                    deductible_expenses[category] = deductible_expenses.get(category, 0) + amount
             else:
-                deductible_expenses[category] = deductible_expenses.get(category, 0) + amount
-        
+                # Travel, Home Office, and all other categories are currently
+                # fully deductible regardless of entity type
+                deductible_expenses[category] += amount
+
         total_deductions = sum(deductible_expenses.values())
-        
+
         return {
-            'deductible_expenses': deductible_expenses,
+            'deductible_expenses': dict(deductible_expenses),
             'total_deductions': round(total_deductions, 2),
             'non_deductible_items': non_deductible,
             'entity_type': entity_type.value
         }
-    
+
+    def _business_deductions_bulk(self, expenses: List[Dict], entity_type: TaxEntityType) -> Dict:
+        """Groupby-based categorization for large expense lists"""
+        df = pd.DataFrame({
+            'category': [expense.get('category', '') for expense in expenses],
+            'amount': np.array([expense.get('amount', 0) for expense in expenses], dtype=np.float64),
+            'description': [expense.get('description', '') for expense in expenses]
+        })
+
+        # 50% limit on meals
+        meals = df['category'].eq('Meals & Entertainment')
+        df['deductible'] = np.where(meals, df['amount'] * 0.5, df['amount'])
+
+        deductible_expenses = {category: float(amount) for category, amount
+                               in df.groupby('category', sort=False)['deductible'].sum().items()}
+        non_deductible = [
+            {
+                'expense': description,
+                'total': float(amount),
+                'deductible': float(deductible),
+                'reason': '50% limit on business meals'
+            }
+            for description, amount, deductible
+            in zip(df.loc[meals, 'description'], df.loc[meals, 'amount'], df.loc[meals, 'deductible'])
+        ]
+
+        return {
+            'deductible_expenses': deductible_expenses,
+            'total_deductions': round(float(df['deductible'].sum()), 2),
+            'non_deductible_items': non_deductible,
+            'entity_type': entity_type.value
+        }
+
     def estimated_quarterly_taxes(self, annual_income: float, filing_status: str = 'single',
                                 self_employed: bool = False) -> Dict:
         """Calculate estimated quarterly tax payments"""
-        # Calculate income tax
+        # Compute SE tax once; both the deduction and the tax itself come from it
+        se_tax_info = self.calculate_self_employment_tax(annual_income) if self_employed else None
+
         adjusted_income = annual_income
-        
-        if self_employed:
-            # Deduct SE tax deduction
-            se_tax_info = self.calculate_self_employment_tax(annual_income)
+        if se_tax_info is not None:
             adjusted_income -= se_tax_info['deductible_portion']
-        
+
         # Apply standard deduction
         standard_deduction = self.standard_deductions.get(filing_status, 13850)
         taxable_income = max(0, adjusted_income - standard_deduction)
-        
+
         # Calculate federal income tax
         federal_tax_info = self.calculate_federal_income_tax(taxable_income, filing_status)
         federal_tax = federal_tax_info['total_tax']
-        
-        # Add SE tax if applicable
-        se_tax = 0
-        if self_employed:
-            se_tax = self.calculate_self_employment_tax(annual_income)['total_se_tax']
-        
+
+        se_tax = se_tax_info['total_se_tax'] if se_tax_info is not None else 0
         total_tax = federal_tax + se_tax
         
         # Safe harbor rule (pay 100% of prior year tax or 90% of current year)
@@ -291,72 +480,43 @@ class TaxCalculator:
             'self_employment_tax': round(se_tax, 2),
             'total_annual_tax': round(total_tax, 2),
             'quarterly_payment_90_percent': round(quarterly_payment_90, 2),
-            'due_dates': [
-                f"{date.today().year}-01-15",  # Q4 prior year
-                f"{date.today().year}-04-15",  # Q1
-                f"{date.today().year}-06-15",  # Q2
-                f"{date.today().year}-09-15"   # Q3
-            ]
+            'due_dates': _due_dates(date.today().year)
         }
     
     def calculate_state_taxes(self, state: str, taxable_income: float, 
                             filing_status: str = 'single') -> Dict:
         """Calculate state income tax (simplified)"""
-        # This would need to be expanded for all states
-        state_rates = {
-            'CA': {
-                'single': [(10099, 0.01), (23942, 0.02), (37788, 0.04), 
-                          (52455, 0.06), (66295, 0.08), (338639, 0.093),
-                          (406364, 0.103), (677278, 0.113), (float('inf'), 0.123)],
-                'married_filing_jointly': [(20198, 0.01), (47884, 0.02), (75576, 0.04),
-                                         (104910, 0.06), (132590, 0.08), (677278, 0.093),
-                                         (812728, 0.103), (1354556, 0.113), (float('inf'), 0.123)]
-            },
-            'NY': {
-                'single': [(8500, 0.04), (11700, 0.045), (13900, 0.0525),
-                          (21400, 0.059), (80650, 0.0645), (215400, 0.0665),
-                          (1077550, 0.0685), (float('inf'), 0.0882)],
-                'married_filing_jointly': [(17150, 0.04), (23600, 0.045), (27900, 0.0525),
-                                         (43000, 0.059), (161550, 0.0645), (323200, 0.0665),
-                                         (2155350, 0.0685), (float('inf'), 0.0882)]
-            },
-            'TX': {
-                'single': [(float('inf'), 0.0)],  # No state income tax
-                'married_filing_jointly': [(float('inf'), 0.0)]
-            },
-            'FL': {
-                'single': [(float('inf'), 0.0)],  # No state income tax
-                'married_filing_jointly': [(float('inf'), 0.0)]
-            }
-        }
-        
-        if state not in state_rates:
+        if state not in _STATE_BRACKET_ARRAYS:
             return {'error': f'State {state} tax rates not available'}
-        
-        brackets = state_rates[state].get(filing_status, state_rates[state]['single'])
-        
-        tax_owed = 0
-        remaining_income = taxable_income
-        prev_threshold = 0
-        
-        for threshold, rate in brackets:
-            if remaining_income <= 0:
-                break
-            
-            taxable_at_rate = min(remaining_income, threshold - prev_threshold)
-            tax_owed += taxable_at_rate * rate
-            remaining_income -= taxable_at_rate
-            prev_threshold = threshold
-        
+
+        by_status = _STATE_BRACKET_ARRAYS[state]
+        lowers, widths, rates, _ = by_status.get(filing_status, by_status['single'])
+
+        taxable_per_bracket = np.minimum(np.maximum(taxable_income - lowers, 0.0), widths)
+        tax_owed = float(taxable_per_bracket @ rates)
+
         return {
             'state': state,
             'taxable_income': taxable_income,
             'state_tax': round(tax_owed, 2),
             'effective_rate': round(tax_owed / taxable_income * 100, 2) if taxable_income > 0 else 0
         }
+
+    def calculate_state_taxes_batch(self, state: str, taxable_incomes,
+                                    filing_status: str = 'single') -> np.ndarray:
+        """Calculate state income tax for an array of incomes in one pass"""
+        if state not in _STATE_BRACKET_ARRAYS:
+            raise ValueError(f'State {state} tax rates not available')
+
+        by_status = _STATE_BRACKET_ARRAYS[state]
+        lowers, widths, rates, _ = by_status.get(filing_status, by_status['single'])
+
+        incomes = np.asarray(taxable_incomes, dtype=np.float64)
+        taxable_per_bracket = np.minimum(np.maximum(incomes[:, None] - lowers, 0.0), widths)
+        return taxable_per_bracket @ rates
     
-    def calculate_payroll_taxes(self, wages: float, year: int = 2024) -> Dict:
-        """Calculate payroll taxes (employer and employee portions)"""
+    def calculate_payroll_taxes_bulk(self, wages, year: int = 2024) -> pd.DataFrame:
+        """Calculate payroll taxes for an array of employee wages"""
         # 2024 rates and limits
         ss_wage_base = 160200
         ss_rate = 0.062  # 6.2%
@@ -365,36 +525,48 @@ class TaxCalculator:
         additional_medicare_threshold = 200000
         futa_wage_base = 7000
         futa_rate = 0.006  # 0.6%
-        
-        # Employee taxes
-        ss_employee = min(wages, ss_wage_base) * ss_rate
-        medicare_employee = wages * medicare_rate
-        additional_medicare_employee = max(0, wages - additional_medicare_threshold) * additional_medicare_rate
-        
-        total_employee = ss_employee + medicare_employee + additional_medicare_employee
-        
-        # Employer taxes (matches employee for SS and Medicare, plus FUTA)
-        ss_employer = ss_employee  # Same as employee
-        medicare_employer = medicare_employee  # Same as employee
-        futa_employer = min(wages, futa_wage_base) * futa_rate
-        
-        total_employer = ss_employer + medicare_employer + futa_employer
-        
+
+        wages = np.asarray(wages, dtype=np.float64)
+
+        # Employee taxes; employer SS and Medicare match the employee portions
+        ss = np.minimum(wages, ss_wage_base) * ss_rate
+        medicare = wages * medicare_rate
+        additional_medicare = np.maximum(wages - additional_medicare_threshold, 0.0) * additional_medicare_rate
+        futa = np.minimum(wages, futa_wage_base) * futa_rate
+
+        total_employee = ss + medicare + additional_medicare
+        total_employer = ss + medicare + futa
+
+        return pd.DataFrame({
+            'wages': wages,
+            'social_security': ss,
+            'medicare': medicare,
+            'additional_medicare': additional_medicare,
+            'total_employee': total_employee,
+            'futa': futa,
+            'total_employer': total_employer,
+            'total_payroll_cost': wages + total_employer
+        })
+
+    def calculate_payroll_taxes(self, wages: float, year: int = 2024) -> Dict:
+        """Calculate payroll taxes (employer and employee portions)"""
+        row = self.calculate_payroll_taxes_bulk(np.array([wages]), year).iloc[0]
+
         return {
             'wages': wages,
             'employee_taxes': {
-                'social_security': round(ss_employee, 2),
-                'medicare': round(medicare_employee, 2),
-                'additional_medicare': round(additional_medicare_employee, 2),
-                'total': round(total_employee, 2)
+                'social_security': round(float(row['social_security']), 2),
+                'medicare': round(float(row['medicare']), 2),
+                'additional_medicare': round(float(row['additional_medicare']), 2),
+                'total': round(float(row['total_employee']), 2)
             },
             'employer_taxes': {
-                'social_security': round(ss_employer, 2),
-                'medicare': round(medicare_employer, 2),
-                'futa': round(futa_employer, 2),
-                'total': round(total_employer, 2)
+                'social_security': round(float(row['social_security']), 2),
+                'medicare': round(float(row['medicare']), 2),
+                'futa': round(float(row['futa']), 2),
+                'total': round(float(row['total_employer']), 2)
             },
-            'total_payroll_cost': round(wages + total_employer, 2)
+            'total_payroll_cost': round(float(row['total_payroll_cost']), 2)
         }
     
     def business_tax_summary(self, entity_id: str, tax_year: int, 
@@ -407,16 +579,65 @@ class TaxCalculator:
         revenue = financial_data.get('revenue', 0)
         expenses = financial_data.get('expenses', 0)
         
-        # Calculate depreciation
+        # Calculate depreciation for the whole portfolio in one array pass
         total_depreciation = 0
         asset_depreciation = []
-        
-        for asset_id, asset in self.assets.items():
-            if asset.placed_in_service_date.year <= tax_year:
-                dep_info = self.calculate_depreciation_deduction(asset_id, tax_year)
-                if 'annual_deduction' in dep_info:
-                    total_depreciation += dep_info['annual_deduction']
-                    asset_depreciation.append(dep_info)
+
+        soa = self._asset_arrays()
+        if len(soa['cost']) > 0:
+            cost, life, method = soa['cost'], soa['life'], soa['method']
+            age = tax_year - soa['placed_year']
+            placed = age >= 0
+            annual = np.zeros(len(cost))
+            total = np.zeros(len(cost))
+
+            sec_179 = method == _SEC179_CODE
+            # Section 179 immediate expensing (2024 limit: $1,220,000)
+            annual[sec_179] = np.minimum(cost[sec_179], 1220000)
+            total[sec_179] = annual[sec_179]
+
+            straight = method == _SL_CODE
+            annual[straight] = cost[straight] / life[straight]
+            total[straight] = annual[straight] * np.minimum(age[straight] + 1, life[straight])
+
+            macrs = method == _MACRS_CODE
+            if np.any(macrs):
+                rows_by_life, pct_table, cum_table = _macrs_pct_table()
+                unsupported = next((int(l) for l in life[macrs] if int(l) not in rows_by_life), None)
+                if unsupported is not None:
+                    _macrs_pct_schedule(unsupported)  # raises ValueError
+                rows = np.array([rows_by_life[int(l)] for l in life[macrs]])
+                years = np.clip(age[macrs], 0, pct_table.shape[1] - 1)
+                annual[macrs] = cost[macrs] * pct_table[rows, years]
+                total[macrs] = cost[macrs] * cum_table[rows, years]
+
+            # Sum the unrounded deductions once; per-asset rounding below is
+            # presentation only
+            handled = np.isin(method, tuple(_DEPR_HANDLERS))
+            total_depreciation = float(annual[placed & handled].sum())
+
+            method_names = {_SL_CODE: 'Straight Line', _MACRS_CODE: 'MACRS'}
+            for i in np.flatnonzero(placed):
+                code = method[i]
+                if code == _SEC179_CODE:
+                    dep_info = {
+                        'asset_id': soa['asset_id'][i],
+                        'depreciation_method': 'Section 179',
+                        'annual_deduction': float(annual[i]),
+                        'remaining_basis': 0,
+                        'total_depreciation': float(total[i])
+                    }
+                elif code in method_names:
+                    dep_info = {
+                        'asset_id': soa['asset_id'][i],
+                        'depreciation_method': method_names[code],
+                        'annual_deduction': round(float(annual[i]), 2),
+                        'remaining_basis': round(float(cost[i] - total[i]), 2),
+                        'total_depreciation': round(float(total[i]), 2)
+                    }
+                else:
+                    continue  # no handler for this method
+                asset_depreciation.append(dep_info)
         
         # Net income calculation
         net_income = revenue - expenses - total_depreciation
@@ -428,7 +649,7 @@ class TaxCalculator:
             # Schedule C income
             se_tax_info = self.calculate_self_employment_tax(net_income)
             adjusted_income = net_income - se_tax_info['deductible_portion']
-            income_tax_info = self.calculate_federal_income_tax(adjusted_income)
+            income_tax_info = self.calculate_federal_income_tax(adjusted_income, detail=True)
             
             tax_calculation = {
                 'schedule_c_income': round(net_income, 2),
@@ -473,9 +694,12 @@ class TaxCalculator:
                               entity_type: TaxEntityType) -> List[Dict]:
         """Suggest tax planning strategies"""
         strategies = []
-        
-        current_bracket = self._get_tax_bracket(current_income)
-        projected_bracket = self._get_tax_bracket(projected_income)
+
+        # One binary search covers both bracket lookups
+        _, _, rates, uppers = _FEDERAL_BRACKET_ARRAYS['single']
+        current_bracket, projected_bracket = (
+            float(rate) for rate in rates[np.searchsorted(uppers, [current_income, projected_income])]
+        )
         
         if projected_bracket > current_bracket:
             strategies.append({
@@ -505,10 +729,8 @@ class TaxCalculator:
     
     def _get_tax_bracket(self, income: float) -> float:
         """Get marginal tax rate for income level"""
-        for threshold, rate in self.federal_brackets_single:
-            if income <= threshold:
-                return rate
-        return 0.37  # Top bracket
+        _, _, rates, uppers = _FEDERAL_BRACKET_ARRAYS['single']
+        return float(rates[np.searchsorted(uppers, income)])
     
     def generate_tax_projection(self, entity_id: str, scenarios: Dict[str, Dict]) -> pd.DataFrame:
         """Generate tax projections under different scenarios"""
@@ -516,40 +738,42 @@ class TaxCalculator:
         if not entity:
             return pd.DataFrame()
         
-        projections = []
-        
-        for scenario_name, scenario_data in scenarios.items():
-            revenue = scenario_data.get('revenue', 0)
-            expenses = scenario_data.get('expenses', 0)
-            net_income = revenue - expenses
-            
-            if entity.entity_type == TaxEntityType.SOLE_PROPRIETORSHIP:
-                se_tax = self.calculate_self_employment_tax(net_income)['total_se_tax']
-                income_tax = self.calculate_federal_income_tax(net_income - se_tax * 0.5)['total_tax']
-                total_tax = se_tax + income_tax
-            elif entity.entity_type == TaxEntityType.C_CORP:
-                total_tax = net_income * 0.21
-            else:
-                total_tax = 0  # Pass-through entities
-            
-            projections.append({
-                'Scenario': scenario_name,
-                'Revenue': revenue,
-                'Expenses': expenses,
-                'Net Income': round(net_income, 2),
-                'Total Tax': round(total_tax, 2),
-                'After-tax Income': round(net_income - total_tax, 2),
-                'Effective Tax Rate': round(total_tax / net_income * 100, 2) if net_income > 0 else 0
-            })
-        
-        return pd.DataFrame(projections)
+        scenario_names = list(scenarios)
+        count = len(scenario_names)
+        revenues = np.fromiter((scenarios[name].get('revenue', 0) for name in scenario_names),
+                               dtype=np.float64, count=count)
+        expenses = np.fromiter((scenarios[name].get('expenses', 0) for name in scenario_names),
+                               dtype=np.float64, count=count)
+        net_incomes = revenues - expenses
+
+        if entity.entity_type == TaxEntityType.SOLE_PROPRIETORSHIP:
+            se_taxes = _se_tax_vec(net_incomes)['total_se_tax']
+            total_taxes = se_taxes + self.calculate_federal_income_tax_batch(net_incomes - se_taxes * 0.5)
+        elif entity.entity_type == TaxEntityType.C_CORP:
+            total_taxes = net_incomes * 0.21
+        else:
+            total_taxes = np.zeros(count)  # Pass-through entities
+
+        positive = net_incomes > 0
+        effective_rates = np.where(positive,
+                                   total_taxes / np.where(positive, net_incomes, 1.0) * 100, 0.0)
+
+        return pd.DataFrame({
+            'Scenario': scenario_names,
+            'Revenue': revenues,
+            'Expenses': expenses,
+            'Net Income': net_incomes.round(2),
+            'Total Tax': total_taxes.round(2),
+            'After-tax Income': (net_incomes - total_taxes).round(2),
+            'Effective Tax Rate': effective_rates.round(2)
+        })
 
 if __name__ == "__main__":
     # Test tax calculations
     calc = TaxCalculator()
     
     # Test federal income tax
-    tax_info = calc.calculate_federal_income_tax(75000, 'single')
+    tax_info = calc.calculate_federal_income_tax(75000, 'single', detail=True)
     print("Federal Income Tax:")
     print(json.dumps(tax_info, indent=2))
     